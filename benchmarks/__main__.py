@@ -0,0 +1,53 @@
+"""Command-line interface to run benchmarks: python -m benchmarks."""
+
+import sys
+import argparse
+
+from . import runner
+
+
+def main(args=None):
+    parser = argparse.ArgumentParser(prog='python -m benchmarks')
+    parser.add_argument('-k', '--filter', metavar='PATTERN',
+                        help="only run benchmarks matching a regex")
+    parser.add_argument('--quick', action='store_true',
+                        help="run each benchmark once as a smoke test")
+    parser.add_argument('--save', nargs='?', const='', metavar='PATH',
+                        help="write results to JSON, by default in results/")
+    parser.add_argument('--compare', metavar='PATH',
+                        help="show changes relative to saved results")
+    parser.add_argument('--check', metavar='PATH',
+                        help="fail if benchmarks in a baseline have regressed")
+    parser.add_argument('--threshold', type=float, default=runner.THRESHOLD,
+                        help="allowed relative increase in time for --check "
+                        "(default: %(default)s)")
+    parser.add_argument('--memory-threshold', type=float,
+                        default=runner.MEMORY_THRESHOLD,
+                        help="allowed relative increase in peak memory for "
+                        "--check (default: %(default)s)")
+    args = parser.parse_args(args)
+
+    baseline = runner.load(args.check) if args.check else None
+    names = set(baseline) if baseline else None
+
+    results = runner.run(args.filter, names, quick=args.quick)
+
+    if args.save is not None:
+        path = runner.save(results, args.save or None)
+        print("Saved results to {}".format(path))
+    if args.compare:
+        runner.compare(results, runner.load(args.compare))
+    if baseline:
+        regressions = runner.check(results, baseline,
+                                   args.threshold, args.memory_threshold)
+        for name, change in regressions:
+            print("Regression: {} {:+.1%}".format(name, change))
+        if regressions:
+            return 1
+        print("No regressions compared to {}".format(args.check))
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
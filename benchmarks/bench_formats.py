@@ -0,0 +1,23 @@
+"""Benchmarks for parsing and dumping file formats."""
+
+from yorm import diskutils
+
+from . import datasets
+
+
+class Formats:
+    """Convert data to and from text in each file format."""
+
+    params = [['yml', 'json'], [1, 3], [10, 100]]
+    param_names = ['format', 'depth', 'size']
+
+    def setup(self, ext, depth, size):
+        self.path = "record." + ext
+        self.data = datasets.create_data(depth, size)
+        self.text = diskutils.dump(self.data, self.path)
+
+    def time_parse(self, *_):
+        diskutils.parse(self.text, self.path)
+
+    def time_dump(self, *_):
+        diskutils.dump(self.data, self.path)
@@ -0,0 +1,22 @@
+"""Benchmarks for importing the package."""
+
+import os
+import sys
+import subprocess
+
+import yorm
+
+
+class Imports:
+    """Start a new interpreter that imports the package."""
+
+    def setup(self):
+        root = os.path.dirname(os.path.dirname(yorm.__file__))
+        self.env = dict(os.environ, PYTHONPATH=root)
+
+    def time_interpreter(self):
+        subprocess.check_call([sys.executable, '-c', 'pass'], env=self.env)
+
+    def time_import(self):
+        subprocess.check_call([sys.executable, '-c', 'import yorm'],
+                              env=self.env)
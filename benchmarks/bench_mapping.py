@@ -0,0 +1,114 @@
+"""Benchmarks for mapping objects and accessing their attributes."""
+
+from . import datasets
+
+
+class MapObjects:
+    """Map objects to existing files."""
+
+    params = [[10, 100], [1, 3], [10, 100]]
+    param_names = ['objects', 'depth', 'size']
+
+    def setup(self, objects, depth, size):
+        self.cls = datasets.create_class("records/{self.key}.yml", depth)
+        datasets.create_objects(self.cls, objects, depth, size)
+        self.keys = ["{:06}".format(index) for index in range(objects)]
+
+    def time_sync_object(self, *_):
+        for key in self.keys:
+            self.cls(key)
+
+    def peakmem_sync_object(self, *_):
+        return [self.cls(key) for key in self.keys]
+
+
+class LoadFiles:
+    """Load attributes from existing files."""
+
+    params = [[1, 3], [10, 100]]
+    param_names = ['depth', 'size']
+
+    def setup(self, depth, size):
+        cls = datasets.create_class("records/{self.key}.yml", depth)
+        self.mapper = datasets.create_objects(cls, 1, depth, size)[0].__mapper__
+
+    def time_load(self, *_):
+        self.mapper.load()
+
+    def peakmem_load(self, *_):
+        self.mapper.load()
+
+
+class ReadOneAttribute:
+    """Reload a modified file to read a single attribute."""
+
+    params = [[False, True], [1, 3], [10, 100]]
+    param_names = ['lazy', 'depth', 'size']
+
+    def setup(self, lazy, depth, size):
+        cls = datasets.create_class("records/{self.key}.yml", depth, lazy=lazy)
+        self.obj = datasets.create_objects(cls, 1, depth, size)[0]
+
+    def time_reload_and_read(self, *_):
+        self.obj.__mapper__.modified = True
+        self.obj.count  # pylint: disable=pointless-statement
+
+
+class WriteOneAttribute:
+    """Save a change to a single attribute of a large file."""
+
+    params = [[False, True], [10, 100]]
+    param_names = ['partial', 'size']
+
+    def setup(self, partial, size):
+        cls = datasets.create_class("records/{self.key}.yml", 3,
+                                    partial=partial)
+        self.obj = datasets.create_objects(cls, 1, 3, size)[0]
+        self.count = self.obj.count
+
+    def time_save_one_attribute(self, *_):
+        self.count += 1
+        self.obj.count = self.count
+
+
+class AppendItems:
+    """Append an item to a long list attribute."""
+
+    params = [['List', 'JournaledList'], [100, 1000]]
+    param_names = ['converter', 'size']
+
+    def setup(self, converter, size):
+        cls = datasets.create_class("records/{self.key}.yml", 1,
+                                    journal=converter == 'JournaledList')
+        self.obj = datasets.create_objects(cls, 1, 1, size)[0]
+
+    def time_append(self, *_):
+        self.obj.tags.append("zulu")
+
+
+class AccessAttributes:
+    """Read and write attributes of mapped objects."""
+
+    params = [[False, True], [1, 3], [10, 100]]
+    param_names = ['descriptors', 'depth', 'size']
+
+    def setup(self, descriptors, depth, size):
+        cls = datasets.create_class("records/{self.key}.yml", depth,
+                                    descriptors=descriptors)
+        self.obj = datasets.create_objects(cls, 1, depth, size)[0]
+        self.count = 0
+
+    def time_attribute_read(self, *_):
+        for _ in range(100):
+            self.obj.count  # pylint: disable=pointless-statement
+
+    def time_method_call(self, *_):
+        for _ in range(100):
+            self.obj.touch()
+
+    def time_attribute_write(self, *_):
+        self.count += 1
+        self.obj.count = self.count
+
+    def time_nested_append(self, *_):
+        self.obj.tags.append("zulu")
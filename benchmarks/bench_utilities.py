@@ -0,0 +1,25 @@
+"""Benchmarks for the utility functions."""
+
+import yorm
+
+from . import datasets
+
+
+class MatchObjects:
+    """Find all mapped objects matching a path format."""
+
+    params = [[10, 100, 1000]]
+    param_names = ['objects']
+
+    def setup(self, objects):
+        self.cls = datasets.create_class("records/{self.key}.yml")
+        datasets.create_objects(self.cls, objects)
+
+    def time_match_all(self, _):
+        list(yorm.match(self.cls))
+
+    def peakmem_match_all(self, _):
+        list(yorm.match(self.cls))
+
+    def time_match_one(self, _):
+        list(yorm.match(self.cls, key="000000"))
@@ -0,0 +1,83 @@
+"""Synthetic, reproducible datasets for benchmarks."""
+
+import random
+
+import yorm
+from yorm.types import Dictionary, Integer, JournaledList, List, String
+
+
+SEED = 42
+WORDS = ["alpha", "bravo", "charlie", "delta", "echo", "foxtrot", "golf"]
+
+
+def create_class(path_format, depth=1, journal=False, **kwargs):
+    """Create a mapped class with nested attributes.
+
+    :param path_format: formatting string to create file paths
+    :param depth: number of nested dictionary levels
+    :param journal: store appended tags in a journal file
+    :param kwargs: additional options for `yorm.sync`
+
+    """
+    nested = create_converter(depth)
+    tags = (JournaledList if journal else List).of_type(String)
+
+    @yorm.attr(name=String)
+    @yorm.attr(count=Integer)
+    @yorm.attr(tags=tags)
+    @yorm.attr(data=nested)
+    @yorm.sync(path_format, **kwargs)
+    class Record:
+        """Mapped class used in benchmarks."""
+
+        def __init__(self, key):
+            self.key = key
+
+        def touch(self):
+            return self.key
+
+    return Record
+
+
+def create_converter(depth):
+    """Create a dictionary converter with the specified nesting depth."""
+    attrs = {'label': String, 'values': List.of_type(Integer)}
+    if depth > 1:
+        attrs['child'] = create_converter(depth - 1)
+
+    converter = type('Level{}'.format(depth), (Dictionary,), {})
+    for name, converter2 in sorted(attrs.items()):
+        converter = yorm.attr(**{name: converter2})(converter)
+    return converter
+
+
+def create_data(depth=1, size=10, seed=SEED):
+    """Create the data for one mapped object."""
+    rand = random.Random(seed)
+    return {
+        'name': rand.choice(WORDS),
+        'count': rand.randint(0, 1000),
+        'tags': [rand.choice(WORDS) for _ in range(size)],
+        'data': _create_level(rand, depth, size),
+    }
+
+
+def _create_level(rand, depth, size):
+    data = {
+        'label': rand.choice(WORDS),
+        'values': [rand.randint(0, 1000) for _ in range(size)],
+    }
+    if depth > 1:
+        data['child'] = _create_level(rand, depth - 1, size)
+    return data
+
+
+def create_objects(cls, count, depth=1, size=10):
+    """Create mapped objects with populated files."""
+    objects = []
+    for index in range(count):
+        data = create_data(depth, size, seed=SEED + index)
+        obj = cls("{:06}".format(index))
+        obj.__mapper__.data = data
+        objects.append(obj)
+    return objects
@@ -0,0 +1,186 @@
+"""Report the memory used by each mapped object: python -m benchmarks.footprint.
+
+Totals are measured with `tracemalloc`. Objects reachable from each mapped
+instance that were allocated while mapping are then grouped by kind to show
+where the memory goes. Converter classes (e.g. those created by
+`List.of_type`) are a fixed cost per mapped class, so they are measured
+separately and amortized over the number of objects.
+"""
+
+import os
+import gc
+import sys
+import time
+import shutil
+import logging
+import argparse
+import tempfile
+import tracemalloc
+from collections import OrderedDict
+
+import yorm
+from yorm import common
+from yorm.bases import Container
+from yorm.mapper import Mapper
+from yorm.types import AttributeDictionary, Dictionary, Integer, List, String
+
+from . import datasets
+
+
+CATEGORIES = ('Mapper', 'containers', 'strings', 'other')
+
+
+def create_class(path_format, **kwargs):
+    """Create a mapped class with one attribute of each container kind."""
+
+    @yorm.attr(label=String)
+    @yorm.attr(values=List.of_type(Integer))
+    class Level(Dictionary):
+        """Nested dictionary converter."""
+
+    @yorm.attr(name=String)
+    @yorm.attr(score=Integer)
+    class Info(AttributeDictionary):
+        """Nested dictionary converter with keys as attributes."""
+
+    @yorm.attr(name=String)
+    @yorm.attr(tags=List.of_type(String))
+    @yorm.attr(data=Level)
+    @yorm.attr(info=Info)
+    @yorm.sync(path_format, **kwargs)
+    class Record:
+        """Mapped class used to measure memory."""
+
+        def __init__(self, key):
+            self.key = key
+
+    return Record
+
+
+def measure(count, size=10, **kwargs):
+    """Map synthetic objects and measure the memory they use.
+
+    :param count: number of objects to map
+    :param size: number of items in each nested list
+    :param kwargs: additional options for `yorm.sync`
+
+    :return: dictionary of measurements
+
+    """
+    gc.collect()
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        existing = set(common.attrs)
+        cls = create_class("records/{self.key}.yml", **kwargs)
+        classes = [c for c in common.attrs if c not in existing]
+        class_bytes = tracemalloc.get_traced_memory()[0] - before
+    finally:
+        tracemalloc.stop()
+
+    os.makedirs("records", exist_ok=True)
+    for index in range(count):
+        path = "records/{:06}.yml".format(index)
+        with open(path, 'w') as stream:
+            stream.write(_create_text(index, size))
+
+    gc.collect()
+    tracemalloc.start()
+    try:
+        start = time.perf_counter()
+        before = tracemalloc.get_traced_memory()[0]
+        objects = [cls("{:06}".format(index)) for index in range(count)]
+        for obj in objects:
+            obj.name  # pylint: disable=pointless-statement
+        gc.collect()
+        total = tracemalloc.get_traced_memory()[0] - before
+        seconds = time.perf_counter() - start
+        categories = _categorize(objects)
+    finally:
+        tracemalloc.stop()
+
+    categories['other'] = total - sum(categories.values())
+
+    return OrderedDict([
+        ('count', count),
+        ('seconds', seconds),
+        ('total', total),
+        ('per_object', total / count),
+        ('categories', OrderedDict(
+            (name, categories[name] / count) for name in CATEGORIES
+        )),
+        ('classes', len(classes)),
+        ('class_bytes', class_bytes),
+    ])
+
+
+def _create_text(index, size):
+    data = datasets.create_data(size=size, seed=datasets.SEED + index)
+    data['info'] = {'name': data['name'], 'score': data['count']}
+    data['data'].pop('child', None)
+    del data['count']
+    return yorm.diskutils.dump(data, "record.yml")
+
+
+def _categorize(objects):
+    """Group the size of traced objects reachable from mapped objects."""
+    sizes = dict.fromkeys(CATEGORIES[:-1], 0)
+    seen = set()
+    pending = list(objects)
+    while pending:
+        obj = pending.pop()
+        if id(obj) in seen or isinstance(obj, type):
+            continue
+        seen.add(id(obj))
+        pending.extend(gc.get_referents(obj))
+        if tracemalloc.get_object_traceback(obj) is None:
+            continue  # allocated before mapping (e.g. shared constants)
+
+        if isinstance(obj, Mapper):
+            sizes['Mapper'] += sys.getsizeof(obj)
+        elif isinstance(obj, Container):
+            sizes['containers'] += sys.getsizeof(obj)
+        elif isinstance(obj, str):
+            sizes['strings'] += sys.getsizeof(obj)
+    return sizes
+
+
+def _format_size(size):
+    for unit, scale in (('MB', 2 ** 20), ('KB', 2 ** 10)):
+        if abs(size) >= scale:
+            return "{:.1f} {}".format(size / scale, unit)
+    return "{:.0f} B".format(size)
+
+
+def main(args=None):
+    parser = argparse.ArgumentParser(prog='python -m benchmarks.footprint')
+    parser.add_argument('-n', '--count', type=int, default=1000,
+                        help="number of objects to map (default: %(default)s)")
+    parser.add_argument('--size', type=int, default=10,
+                        help="items in each nested list (default: %(default)s)")
+    parser.add_argument('--descriptors', action='store_true',
+                        help="map objects using attribute descriptors")
+    args = parser.parse_args(args)
+
+    cwd = os.getcwd()
+    temp = tempfile.mkdtemp(prefix='yorm-footprint-')
+    os.chdir(temp)
+    logging.disable(logging.CRITICAL)
+    try:
+        result = measure(args.count, args.size, descriptors=args.descriptors)
+    finally:
+        logging.disable(logging.NOTSET)
+        os.chdir(cwd)
+        shutil.rmtree(temp, ignore_errors=True)
+
+    print("Mapped {} objects in {:.2f} s".format(
+        result['count'], result['seconds']))
+    print("Memory per object: {}".format(_format_size(result['per_object'])))
+    for name, size in result['categories'].items():
+        print("  {:<12} {:>10}".format(name, _format_size(size)))
+    print("Converter classes: {} created, {} per mapped class".format(
+        result['classes'], _format_size(result['class_bytes'])))
+
+
+if __name__ == '__main__':  # pragma: no cover
+    main()
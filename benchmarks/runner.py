@@ -0,0 +1,236 @@
+"""Discover, run, and record benchmarks."""
+
+import os
+import re
+import json
+import timeit
+import tracemalloc
+import shutil
+import inspect
+import contextlib
+import logging
+import platform
+import tempfile
+import itertools
+import importlib
+import subprocess
+from statistics import median
+
+import yorm
+
+
+MODULES = ['bench_imports', 'bench_mapping', 'bench_utilities', 'bench_formats']
+RESULTS = os.path.join(os.path.dirname(__file__), 'results')
+
+TARGET = 0.2  # seconds per repeat when calibrating
+REPEAT = 5
+THRESHOLD = 0.5  # allowed relative increase in time (timings are noisy)
+MEMORY_THRESHOLD = 0.1  # allowed relative increase in peak memory
+
+PREFIXES = ('time_', 'peakmem_')
+
+
+def discover(pattern=None, names=None):
+    """Yield (name, suite class, method name, parameters) for each benchmark.
+
+    :param pattern: regular expression to select benchmark names
+    :param names: collection of exact benchmark names to select
+
+    """
+    for module_name in MODULES:
+        module = importlib.import_module(__package__ + '.' + module_name)
+        for _, suite in inspect.getmembers(module, inspect.isclass):
+            if suite.__module__ != module.__name__:
+                continue
+            methods = [name for name in dir(suite) if name.startswith(PREFIXES)]
+            combinations = itertools.product(*getattr(suite, 'params', ()))
+            for method, params in itertools.product(sorted(methods),
+                                                    list(combinations)):
+                name = _format_name(module_name, suite, method, params)
+                if pattern and not re.search(pattern, name):
+                    continue
+                if names is not None and name not in names:
+                    continue
+                yield name, suite, method, params
+
+
+def run(pattern=None, names=None, quick=False):
+    """Run the selected benchmarks and return their results.
+
+    :param pattern: regular expression to select benchmark names
+    :param names: collection of exact benchmark names to select
+    :param quick: run each benchmark once as a smoke test
+
+    :return: dictionary of timings or peak memory keyed by benchmark name
+
+    """
+    results = {}
+    logging.disable(logging.CRITICAL)
+    try:
+        for name, suite, method, params in discover(pattern, names):
+            if method.startswith('peakmem_'):
+                peak = _measure_memory(suite, method, params)
+                results[name] = {'peakmem': peak}
+                print("{:<80} {:>12}".format(name, _format_size(peak)))
+            else:
+                timings = _measure(suite, method, params, quick)
+                results[name] = {
+                    'min': min(timings),
+                    'median': median(timings),
+                    'repeat': len(timings),
+                }
+                print("{:<80} {:>12}".format(name, _format_time(min(timings))))
+    finally:
+        logging.disable(logging.NOTSET)
+    return results
+
+
+def save(results, path=None):
+    """Write benchmark results to a JSON file.
+
+    :param results: dictionary returned by `run`
+    :param path: output file, defaults to the current commit's results file
+
+    :return: path of the saved results
+
+    """
+    path = path or os.path.join(RESULTS, _get_commit() + '.json')
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    content = {
+        'commit': _get_commit(),
+        'yorm': yorm.__version__,
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'results': results,
+    }
+    with open(path, 'w') as stream:
+        json.dump(content, stream, indent=2, sort_keys=True)
+    return path
+
+
+def load(path):
+    """Read benchmark results from a JSON file."""
+    with open(path) as stream:
+        return json.load(stream)['results']
+
+
+def compare(results, previous):
+    """Print the relative change of each benchmark against previous results."""
+    for name, change in _changes(results, previous):
+        print("{:<80} {:>+11.1%}".format(name, change))
+
+
+def check(results, baseline, threshold=THRESHOLD,
+          memory_threshold=MEMORY_THRESHOLD):
+    """Get the benchmarks that regressed beyond a threshold.
+
+    :param results: dictionary returned by `run`
+    :param baseline: dictionary of results to compare against
+    :param threshold: allowed relative increase in time
+    :param memory_threshold: allowed relative increase in peak memory
+
+    :return: list of (name, relative change) for each regression
+
+    """
+    regressions = []
+    for name, change in _changes(results, baseline):
+        if 'peakmem' in results[name]:
+            limit = memory_threshold
+        else:
+            limit = threshold
+        if change > limit:
+            regressions.append((name, change))
+    return regressions
+
+
+def _changes(results, previous):
+    for name in sorted(results):
+        if name not in previous:
+            continue
+        key = 'peakmem' if 'peakmem' in results[name] else 'min'
+        old = previous[name][key]
+        new = results[name][key]
+        yield name, (new - old) / old if old else 0.0
+
+
+def _measure(suite, method, params, quick):
+    with _setup(suite, params) as instance:
+        function = getattr(instance, method)
+        timer = timeit.Timer(lambda: function(*params))
+        if quick:
+            number, repeat = 1, 1
+        else:
+            number, repeat = _calibrate(timer, TARGET), REPEAT
+        return [t / number for t in timer.repeat(repeat, number)]
+
+
+def _measure_memory(suite, method, params):
+    with _setup(suite, params) as instance:
+        function = getattr(instance, method)
+        function(*params)  # exclude one-time costs such as lazy imports
+        tracemalloc.start()
+        try:
+            function(*params)
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+        return peak
+
+
+@contextlib.contextmanager
+def _setup(suite, params):
+    cwd = os.getcwd()
+    temp = tempfile.mkdtemp(prefix='yorm-benchmark-')
+    os.chdir(temp)
+    try:
+        instance = suite()
+        if hasattr(instance, 'setup'):
+            instance.setup(*params)
+        yield instance
+        if hasattr(instance, 'teardown'):
+            instance.teardown(*params)
+    finally:
+        os.chdir(cwd)
+        shutil.rmtree(temp, ignore_errors=True)
+
+
+def _calibrate(timer, target):
+    number = 1
+    while True:
+        elapsed = timer.timeit(number)
+        if elapsed >= target or number >= 10 ** 6:
+            return number
+        number *= 10 if elapsed < target / 10 else 2
+
+
+def _format_name(module_name, suite, method, params):
+    name = '.'.join([module_name, suite.__name__, method])
+    if params:
+        name += '(' + ', '.join(
+            '{}={}'.format(k, v) for k, v in zip(suite.param_names, params)
+        ) + ')'
+    return name
+
+
+def _format_time(seconds):
+    for unit, scale in (('s', 1), ('ms', 1e-3), ('us', 1e-6)):
+        if seconds >= scale:
+            return "{:.3f} {}".format(seconds / scale, unit)
+    return "{:.3f} ns".format(seconds / 1e-9)
+
+
+def _format_size(size):
+    for unit, scale in (('MB', 2 ** 20), ('KB', 2 ** 10)):
+        if size >= scale:
+            return "{:.1f} {}".format(size / scale, unit)
+    return "{} B".format(size)
+
+
+def _get_commit():
+    try:
+        output = subprocess.check_output(
+            ['git', 'rev-parse', '--short', 'HEAD'],
+            cwd=os.path.dirname(__file__), stderr=subprocess.DEVNULL)
+    except (OSError, subprocess.CalledProcessError):
+        return 'unknown'
+    return output.decode().strip()
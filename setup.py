@@ -49,7 +49,9 @@ setuptools.setup(
     author='Jace Browning',
     author_email='jacebrowning@gmail.com',
 
-    packages=setuptools.find_packages(),
+    packages=setuptools.find_packages(
+        exclude=['benchmarks', 'benchmarks.*', 'tests', 'tests.*'],
+    ),
 
     entry_points={'console_scripts': []},
 
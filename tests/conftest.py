@@ -1,3 +1,15 @@
 """Integration tests configuration file."""
 
+import pytest
+
+import yorm
 from yorm.tests.conftest import pytest_configure  # pylint: disable=unused-import
+
+
+@pytest.yield_fixture
+def writes():
+    """Record each time a mapped object's file is written."""
+    events = []
+    yorm.hooks.on('after_write', lambda event, **_: events.append(1))
+    yield events
+    yorm.hooks.off('after_write')
@@ -0,0 +1,111 @@
+"""Integration tests for arrays stored in sidecar files."""
+
+# pylint: disable=redefined-outer-name,expression-not-assigned,attribute-defined-outside-init,no-member
+
+import os
+
+import pytest
+from expecter import expect
+
+import yorm
+from yorm.types import Array, String
+
+from . import strip, refresh_file_modification_times
+
+numpy = pytest.importorskip('numpy')
+
+
+@yorm.attr(values=Array)
+@yorm.attr(name=String)
+@yorm.sync("tmp/{self.key}.yml")
+class Series:
+    """An example class mapping a NumPy array."""
+
+    def __init__(self, key):
+        self.key = key
+
+
+@pytest.fixture
+def series(tmpdir):
+    tmpdir.chdir()
+    return Series('example')
+
+
+def test_array_is_stored_in_a_sidecar_file(series):
+    series.values = numpy.arange(3)
+
+    expect(series.__mapper__.text) == strip("""
+    values: example.values.npy
+    name: ''
+    """)
+    expect(numpy.load("tmp/example.values.npy").tolist()) == [0, 1, 2]
+
+
+def test_array_is_memory_mapped_when_loaded(series):
+    series.values = numpy.arange(3)
+
+    series2 = Series('example')
+
+    expect(series2.values).isinstance(numpy.memmap)
+    expect(series2.values.tolist()) == [0, 1, 2]
+
+
+def test_array_is_not_rewritten_after_other_changes(series):
+    series.values = numpy.arange(3)
+    stamp = os.path.getmtime("tmp/example.values.npy")
+    refresh_file_modification_times()
+
+    series.name = "foobar"
+
+    expect(os.path.getmtime("tmp/example.values.npy")) == stamp
+
+
+def test_array_changes_in_place_are_saved(series):
+    array = numpy.zeros(3)
+    series.values = array
+    refresh_file_modification_times()
+
+    array[0] = 7
+    yorm.save(series)
+
+    expect(numpy.load("tmp/example.values.npy").tolist()) == [7, 0, 0]
+
+
+def test_array_changes_are_detected(series):
+    series.values = numpy.arange(3)
+    series2 = Series('example')
+    refresh_file_modification_times()
+
+    series2.values = series2.values * 2
+
+    expect(series.values.tolist()) == [0, 2, 4]
+
+
+def test_sidecar_files_are_deleted(series):
+    series.values = numpy.arange(3)
+
+    yorm.delete(series)
+
+    expect(os.listdir("tmp")) == []
+
+
+def test_array_changes_are_staged_in_transactions(series):
+    series.values = numpy.arange(3)
+
+    with yorm.transaction():
+        series.values = numpy.arange(4)
+        expect(numpy.load("tmp/example.values.npy").tolist()) == [0, 1, 2]
+
+    expect(numpy.load("tmp/example.values.npy").tolist()) == [0, 1, 2, 3]
+
+
+def test_array_changes_are_discarded_on_rollback(series):
+    series.values = numpy.arange(3)
+
+    with expect.raises(RuntimeError):
+        with yorm.transaction():
+            series.values = numpy.arange(4)
+            raise RuntimeError
+
+    expect(numpy.load("tmp/example.values.npy").tolist()) == [0, 1, 2]
+    expect(series.values.tolist()) == [0, 1, 2]
@@ -0,0 +1,82 @@
+"""Integration tests for saving a block of changes once."""
+
+# pylint: disable=redefined-outer-name,expression-not-assigned,unused-variable
+# pylint: disable=no-member
+
+import pytest
+from expecter import expect
+
+import yorm
+from yorm.types import AttributeDictionary, Integer, List, String
+
+
+@yorm.attr(names=List.of_type(String))
+class Group(AttributeDictionary):
+    """A nested dictionary containing a list."""
+
+
+@yorm.attr(tags=List.of_type(String))
+@yorm.attr(group=Group)
+@yorm.sync("tmp/{self.key}.yml")
+class Record:
+    """An example class with nested containers."""
+
+    def __init__(self, key):
+        self.key = key
+
+
+@pytest.fixture
+def record(tmpdir):
+    tmpdir.chdir()
+    return Record('example')
+
+
+def describe_bulk():
+
+    def it_saves_once_after_the_block(record, writes):
+        with record.tags.bulk():
+            for index in range(100):
+                record.tags.append("tag{}".format(index))
+            expect(writes) == []
+
+        expect(len(writes)) == 1
+        expect(record.__mapper__.text).contains("- tag99\n")
+
+    def it_includes_changes_to_other_attributes(record, writes):
+        with record.tags.bulk():
+            record.tags.append("a")
+            record.group.names.append("b")
+
+        expect(len(writes)) == 1
+        expect(record.__mapper__.data) == \
+            {'tags': ["a"], 'group': {'names': ["b"]}}
+
+    def it_can_be_nested(record, writes):
+        with record.tags.bulk():
+            with record.group.names.bulk():
+                record.group.names.append("a")
+            record.tags.append("b")
+
+        expect(len(writes)) == 1
+
+    def it_does_not_save_without_changes(record, writes):
+        with record.tags.bulk():
+            expect(record.tags) == []
+
+        expect(writes) == []
+
+    def it_saves_changes_made_before_an_exception(record):
+        with expect.raises(RuntimeError):
+            with record.tags.bulk():
+                record.tags.append("a")
+                raise RuntimeError
+
+        expect(record.__mapper__.text).contains("- a\n")
+
+    def it_works_on_unmapped_containers():
+        tags = List.of_type(Integer)()
+
+        with tags.bulk():
+            tags.append(1)
+
+        expect(tags) == [1]
@@ -0,0 +1,123 @@
+"""Integration tests for evicting the attributes of unused objects."""
+
+# pylint: disable=redefined-outer-name,expression-not-assigned,unused-variable
+# pylint: disable=unused-argument,attribute-defined-outside-init
+
+import pytest
+from expecter import expect
+
+import yorm
+from yorm.types import Integer, List, String
+
+
+@yorm.attr(name=String)
+@yorm.attr(values=List.of_type(Integer))
+@yorm.sync("tmp/{self.key}.yml")
+class Record:
+    """An example class with many instances."""
+
+    def __init__(self, key):
+        self.key = key
+
+
+@pytest.yield_fixture
+def limit():
+    yorm.cache.reset()
+    yield
+    yorm.settings.max_loaded_objects = None
+    yorm.settings.max_loaded_bytes = None
+    yorm.cache.reset()
+
+
+@pytest.fixture
+def records(tmpdir, limit):
+    tmpdir.chdir()
+    yorm.settings.max_loaded_objects = 2
+    records = []
+    for index in range(4):
+        record = Record(str(index))
+        record.name = "record-{}".format(index)
+        record.values = [index] * 3
+        expect(record.name) == "record-{}".format(index)
+        records.append(record)
+    return records
+
+
+def is_evicted(record):
+    return 'name' not in record.__dict__
+
+
+def describe_max_loaded_objects():
+
+    def it_evicts_the_least_recently_used_objects(records):
+        expect([is_evicted(record) for record in records]) == \
+            [True, True, False, False]
+        expect(yorm.cache.stats()['objects']) == 2
+
+    def it_reloads_evicted_objects_on_access(records):
+        expect(records[0].name) == "record-0"
+        expect(records[0].values) == [0, 0, 0]
+
+        expect(is_evicted(records[0])).is_false()
+        expect(is_evicted(records[2])).is_true()
+
+    def it_keeps_recently_accessed_objects(records):
+        records[2].name  # pylint: disable=pointless-statement
+        records[0].name  # pylint: disable=pointless-statement
+
+        expect(is_evicted(records[2])).is_false()
+        expect(is_evicted(records[3])).is_true()
+
+    def it_does_not_write_evicted_objects(records):
+        with open("tmp/0.yml") as stream:
+            text = stream.read()
+
+        yorm.save(records[0])
+
+        with open("tmp/0.yml") as stream:
+            expect(stream.read()) == text
+
+    def it_saves_changes_after_restoring(records):
+        records[0].name = "changed"
+
+        expect(records[0].values) == [0, 0, 0]
+        expect(records[0].__mapper__.data) == \
+            {'name': "changed", 'values': [0, 0, 0]}
+
+    def it_counts_evictions_and_restores(records):
+        records[0].name  # pylint: disable=pointless-statement
+
+        stats = yorm.cache.stats()
+        expect(stats['evictions']) == 3
+        expect(stats['restores']) == 1
+
+    def it_skips_objects_without_auto_save(tmpdir, limit):
+        tmpdir.chdir()
+        yorm.settings.max_loaded_objects = 1
+
+        @yorm.attr(name=String)
+        @yorm.sync("tmp/manual.yml", auto_save=False)
+        class Manual:
+            pass
+
+        manual = Manual()
+        manual.name = "unsaved"
+        Record('other').name  # pylint: disable=pointless-statement
+
+        expect(manual.name) == "unsaved"
+
+
+def describe_max_loaded_bytes():
+
+    def it_limits_the_total_size_of_loaded_files(tmpdir, limit):
+        tmpdir.chdir()
+        records = [Record(str(index)) for index in range(3)]
+        for record in records:
+            record.name = "x" * 100
+        yorm.settings.max_loaded_bytes = 250
+
+        for record in records:
+            record.name  # pylint: disable=pointless-statement
+
+        expect(yorm.cache.stats()['objects']) == 2
+        expect(yorm.cache.stats()['bytes']) <= 250
@@ -0,0 +1,256 @@
+"""Integration tests for files changed since they were loaded."""
+
+# pylint: disable=redefined-outer-name,expression-not-assigned,unused-variable
+# pylint: disable=attribute-defined-outside-init,no-member
+
+import pytest
+from expecter import expect
+
+import yorm
+from yorm.types import AttributeDictionary, Integer, Object, String
+
+from . import strip
+
+
+def create_class(on_conflict):
+
+    @yorm.attr(name=String)
+    @yorm.attr(count=Integer)
+    @yorm.sync("tmp/sample.yml", on_conflict=on_conflict)
+    class Sample:
+        """An example class that detects conflicting changes."""
+
+    return Sample
+
+
+def create_untyped(on_conflict):
+
+    @yorm.attr(name=String)
+    @yorm.attr(config=Object)
+    @yorm.sync("tmp/sample.yml", on_conflict=on_conflict)
+    class Untyped:
+        """An example class with an untyped attribute."""
+
+    change_file("""
+    name: foo
+    config:
+      key: 1
+    """)
+    untyped = Untyped()
+    expect(untyped.config) == {'key': 1}
+    return untyped
+
+
+def change_file(text):
+    with open("tmp/sample.yml", 'w') as stream:
+        stream.write(strip(text))
+
+
+def read_file():
+    with open("tmp/sample.yml") as stream:
+        return stream.read()
+
+
+@pytest.fixture
+def sample(tmpdir, request):
+    tmpdir.chdir()
+    sample = create_class(request.param)()
+    sample.name = "foo"
+    sample.count = 1
+    expect(sample.count) == 1  # reload after saving
+    change_file("""
+    name: bar
+    count: 1
+    """)
+    return sample
+
+
+def describe_on_conflict():
+
+    @pytest.mark.parametrize('sample', ['error'], indirect=True)
+    def it_can_refuse_to_save(sample):
+        with expect.raises(yorm.exceptions.ConflictError):
+            sample.count = 2
+
+        expect(read_file()) == "name: bar\ncount: 1\n"
+
+    @pytest.mark.parametrize('sample', ['overwrite'], indirect=True)
+    def it_can_overwrite_the_file(sample):
+        sample.count = 2
+
+        expect(read_file()) == "name: foo\ncount: 2\n"
+
+    @pytest.mark.parametrize('sample', ['reload'], indirect=True)
+    def it_can_reapply_changes(sample):
+        sample.count = 2
+
+        expect(read_file()) == "name: bar\ncount: 2\n"
+        expect(sample.name) == "bar"
+
+    @pytest.mark.parametrize('sample', ['merge'], indirect=True)
+    def it_can_merge_changes(sample):
+        sample.count = 2
+
+        expect(read_file()) == "name: bar\ncount: 2\n"
+
+    @pytest.mark.parametrize('sample', ['merge'], indirect=True)
+    def it_raises_for_conflicting_merges(sample):
+        with expect.raises(yorm.exceptions.ConflictError,
+                           "tmp/sample.yml: Conflicting changes to: name"):
+            sample.name = "baz"
+
+    @pytest.mark.parametrize('sample', [lambda *_: {'count': 42}],
+                             indirect=True)
+    def it_can_use_a_custom_resolver(sample):
+        sample.count = 2
+
+        expect(read_file()) == "count: 42\n"
+
+    @pytest.mark.parametrize('sample', ['error'], indirect=True)
+    def it_emits_a_hook_event(sample):
+        events = []
+        yorm.hooks.on('conflict', lambda event, **info: events.append(info))
+        try:
+            with expect.raises(yorm.exceptions.ConflictError):
+                sample.count = 2
+        finally:
+            yorm.hooks.off('conflict')
+
+        expect(events) == [{'path': "tmp/sample.yml", 'obj': sample}]
+
+    def it_ignores_files_that_were_only_touched(tmpdir):
+        tmpdir.chdir()
+        sample = create_class('error')()
+        sample.count = 1
+        expect(sample.count) == 1
+        change_file("""
+        name: ''
+        count: 1
+        """)
+
+        sample.count = 2
+
+        expect(read_file()) == "name: ''\ncount: 2\n"
+
+    def it_rejects_unknown_resolvers(tmpdir):
+        tmpdir.chdir()
+        with expect.raises(ValueError):
+            create_class('unknown')()
+
+
+def describe_changes_in_place():
+
+    def it_merges_them_with_external_changes(tmpdir):
+        tmpdir.chdir()
+        tmpdir.mkdir('tmp')
+        untyped = create_untyped('merge')
+        config = untyped.config
+        change_file("""
+        name: bar
+        config:
+          key: 1
+        """)
+
+        config['key'] = 2
+        yorm.save(untyped)
+
+        expect(read_file()) == "name: bar\nconfig:\n  key: 2\n"
+
+    def it_reapplies_them_after_reloading(tmpdir):
+        tmpdir.chdir()
+        tmpdir.mkdir('tmp')
+        untyped = create_untyped('reload')
+        config = untyped.config
+        change_file("""
+        name: bar
+        config:
+          key: 1
+        """)
+
+        config['key'] = 2
+        yorm.save(untyped)
+
+        expect(read_file()) == "name: bar\nconfig:\n  key: 2\n"
+        expect(untyped.name) == "bar"
+
+
+def describe_unsaved_changes():
+
+    @yorm.attr(name=String)
+    @yorm.attr(count=Integer)
+    class Status(AttributeDictionary):
+        """An example nested dictionary."""
+
+    @yorm.attr(label=String)
+    @yorm.attr(status=Status)
+    @yorm.sync("tmp/sample.yml", auto_save=False, on_conflict='merge')
+    class Draft:
+        """An example class that saves changes explicitly."""
+
+    @pytest.fixture
+    def draft(tmpdir):
+        tmpdir.chdir()
+        draft = Draft()
+        draft.label = "foo"
+        draft.status.name = "new"
+        yorm.save(draft)
+        expect(draft.label) == "foo"  # reload after saving
+        return draft
+
+    def it_keeps_them_when_the_file_changes(draft):
+        draft.label = "bar"
+        change_file("""
+        label: foo
+        status:
+          count: 5
+          name: new
+        """)
+
+        expect(draft.label) == "bar"
+        expect(draft.status.count) == 5
+
+        yorm.save(draft)
+
+        expect(read_file()) == strip("""
+        label: bar
+        status:
+          name: new
+          count: 5
+        """)
+
+    def it_merges_changes_to_nested_dictionaries(draft):
+        draft.status.name = "done"
+        change_file("""
+        label: foo
+        status:
+          count: 5
+          name: new
+        """)
+
+        expect(draft.status.name) == "done"
+        expect(draft.status.count) == 5
+
+    def it_raises_for_changes_to_the_same_value(draft):
+        draft.label = "bar"
+        change_file("""
+        label: baz
+        status:
+          count: 0
+          name: new
+        """)
+
+        with expect.raises(yorm.exceptions.ConflictError):
+            print(draft.label)
+
+    def it_discards_them_when_loaded_explicitly(draft):
+        draft.label = "bar"
+        change_file("""
+        label: foo
+        status:
+          count: 5
+          name: new
+        """)
+
+        yorm.load(draft)
+
+        expect(draft.label) == "foo"
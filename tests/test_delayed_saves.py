@@ -0,0 +1,130 @@
+"""Integration tests for saving changes after a quiet period."""
+
+# pylint: disable=redefined-outer-name,expression-not-assigned,unused-variable
+# pylint: disable=attribute-defined-outside-init
+
+import gc
+import time
+
+import pytest
+from expecter import expect
+
+import yorm
+from yorm.types import Integer, List, String
+
+
+@yorm.attr(count=Integer)
+@yorm.attr(items=List.of_type(String))
+@yorm.sync("tmp/{self.key}.yml", auto_save_delay=0.1)
+class Counter:
+    """An example class updated many times in a row."""
+
+    def __init__(self, key):
+        self.key = key
+
+
+@pytest.yield_fixture
+def counter(tmpdir):
+    tmpdir.chdir()
+    yield Counter('example')
+    yorm.scheduler.flush()  # before leaving the directory
+
+
+def read():
+    with open("tmp/example.yml") as stream:
+        return stream.read()
+
+
+def wait_for(condition, timeout=5):
+    start = time.time()
+    while not condition() and time.time() - start < timeout:
+        time.sleep(0.01)
+
+
+def describe_auto_save_delay():
+
+    def it_saves_once_after_changes_stop(counter, writes):
+        for index in range(1, 11):
+            counter.count = index
+            counter.items.append(str(index))
+
+        expect(writes) == []
+        wait_for(lambda: writes)
+        time.sleep(0.2)
+
+        expect(len(writes)) == 1
+        expect(read()).contains("count: 10\n")
+        expect(read()).contains("- 10\n")
+
+    def it_keeps_changes_in_memory_until_saved(counter):
+        counter.count = 42
+
+        expect(counter.count) == 42
+        expect(read()).contains("count: 0\n")
+
+    def it_saves_immediately_when_saved_explicitly(counter, writes):
+        counter.count = 42
+
+        yorm.save(counter)
+
+        expect(read()).contains("count: 42\n")
+        time.sleep(0.2)
+        expect(len(writes)) == 1
+
+    def it_can_flush_waiting_changes(counter):
+        counter.count = 42
+
+        counter.__mapper__.flush()
+
+        expect(read()).contains("count: 42\n")
+        expect(counter.count) == 42
+
+    def it_can_limit_the_delay(counter, writes):
+        counter.__mapper__.auto_save_max_delay = 0.25
+
+        start = time.time()
+        while not writes:
+            counter.count += 1
+            time.sleep(0.02)
+
+        expect(time.time() - start) < 0.5
+
+    def it_saves_objects_that_are_no_longer_referenced(counter):
+        counter.count = 5
+        del counter
+        gc.collect()
+
+        wait_for(lambda: "count: 5" in read())
+
+        expect(read()).contains("count: 5\n")
+
+    def it_enables_thread_safe_mode(counter):
+        counter.count = 1
+
+        expect(counter.__mapper__._mutex is not None).is_true()  # pylint: disable=protected-access
+
+
+def describe_transactions():
+
+    def it_discards_changes_that_are_rolled_back(counter):
+        other = Counter('other')
+
+        with expect.raises(RuntimeError):
+            with yorm.transaction():
+                counter.count = 1
+                other.count = 1
+                raise RuntimeError
+
+        time.sleep(0.2)
+        expect(read()).contains("count: 0\n")
+        expect(counter.count) == 0
+        expect(other.count) == 0
+
+    def it_saves_changes_when_committed(counter, writes):
+        with yorm.transaction():
+            counter.count = 1
+
+        expect(read()).contains("count: 1\n")
+        count = len(writes)
+        time.sleep(0.2)
+        expect(len(writes)) == count
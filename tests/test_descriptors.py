@@ -0,0 +1,60 @@
+"""Integration tests for mapping attributes using descriptors."""
+
+# pylint: disable=redefined-outer-name,expression-not-assigned,attribute-defined-outside-init,no-member
+
+import pytest
+from expecter import expect
+
+import yorm
+from yorm.types import Integer, String
+
+from . import strip, refresh_file_modification_times
+
+
+@yorm.attr(count=Integer)
+@yorm.attr(name=String)
+@yorm.sync("tmp/{self.key}.yml", descriptors=True)
+class Sample:
+    """An example class mapping only its mapped attributes."""
+
+    name = "default"
+
+    def __init__(self, key):
+        self.key = key
+        self.unmapped = 0
+
+
+@pytest.fixture
+def sample(tmpdir):
+    tmpdir.chdir()
+    return Sample('example')
+
+
+def test_mapped_attributes_are_saved(sample):
+    sample.count = 42
+
+    expect(sample.__mapper__.text) == strip("""
+    count: 42
+    name: default
+    """)
+
+
+def test_mapped_attributes_are_loaded(sample):
+    refresh_file_modification_times()
+
+    sample.__mapper__.text = "count: 42\n"
+
+    expect(sample.count) == 42
+
+
+def test_unmapped_attributes_are_not_intercepted(sample):
+    sample.__mapper__.text = "count: 42\n"
+
+    sample.unmapped = 1
+
+    expect(sample.__mapper__.text) == "count: 42\n"
+
+
+def test_class_attributes_are_used_as_defaults(sample):
+    expect(sample.name) == "default"
+    expect(type(sample).name.default) == "default"
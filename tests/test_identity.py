@@ -0,0 +1,117 @@
+"""Integration tests for sharing one instance per mapped file."""
+
+# pylint: disable=redefined-outer-name,expression-not-assigned,unused-variable,unused-argument
+# pylint: disable=no-member
+
+import gc
+import pickle
+import logging
+
+import pytest
+from expecter import expect
+
+import yorm
+from yorm.types import Integer, String
+
+
+@yorm.attr(name=String)
+@yorm.attr(count=Integer)
+@yorm.sync("tmp/{self.key}.yml", identity=True)
+class Record:
+    """An example class with one instance per file."""
+
+    def __init__(self, key, name=""):
+        self.key = key
+        self.name = name
+
+
+class Copy(Record):
+    """An example subclass inheriting the constructor."""
+
+
+class Sub(Record):
+    """An example subclass with different constructor arguments."""
+
+    def __init__(self, key, name, count):
+        super().__init__(key, name=name)
+        self.count = count
+
+
+@pytest.fixture
+def record(tmpdir):
+    tmpdir.chdir()
+    return Record('example', name="foo")
+
+
+def describe_identity():
+
+    def it_returns_the_live_instance_for_a_path(record):
+        expect(Record('example') is record).is_true()
+
+    def it_does_not_reinitialize_the_live_instance(record):
+        record.count = 42
+
+        Record('example', name="bar")
+
+        expect(record.name) == "foo"
+        expect(record.count) == 42
+
+    def it_only_reads_the_file_once(record):
+        reads = []
+        yorm.hooks.on('after_read', lambda event, **_: reads.append(1))
+        try:
+            for _ in range(3):
+                Record('example')
+        finally:
+            yorm.hooks.off('after_read')
+
+        expect(reads) == []
+
+    def it_creates_separate_instances_for_other_paths(record):
+        expect(Record('other') is not record).is_true()
+
+    def it_is_used_by_find_and_match(record):
+        expect(yorm.find(Record, 'example') is record).is_true()
+        expect(list(yorm.match(Record))) == [record]
+
+    def it_forgets_instances_that_are_no_longer_used(tmpdir):
+        tmpdir.chdir()
+        logging.disable(logging.CRITICAL)  # captured records keep references
+        try:
+            Record('example', name="foo")
+        finally:
+            logging.disable(logging.NOTSET)
+        gc.collect()
+
+        expect(yorm.common.get_identity("tmp/example.yml")).is_none()
+        record = Record('example')
+        expect(record.name) == "foo"
+
+    def it_forgets_deleted_instances(record):
+        yorm.delete(record)
+
+        expect(Record('example') is not record).is_true()
+
+    def it_supports_pickling(record):
+        copy = pickle.loads(pickle.dumps(record))
+
+        expect(copy is not record).is_true()
+        expect(copy.key) == "example"
+
+
+def describe_subclasses():
+
+    def it_shares_instances_when_inheriting_the_constructor(tmpdir):
+        tmpdir.chdir()
+        copy = Copy('example', name="foo")
+
+        expect(Copy('example') is copy).is_true()
+
+    def it_creates_instances_with_other_constructors(tmpdir):
+        tmpdir.chdir()
+        sub = Sub('z', "first", 1)
+
+        expect(sub.name) == "first"
+        expect(sub.count) == 1
+        expect(sub.__mapper__.path) == "tmp/z.yml"
+        expect(Sub('z', "second", 2) is not sub).is_true()
@@ -34,6 +34,7 @@ def test_from_top_utilities():
     from yorm import load
     from yorm import save
     from yorm import delete
+    from yorm import watch
 
 
 def test_from_nested():
@@ -41,3 +42,17 @@ def test_from_nested():
     from yorm.types.standard import String
     from yorm.types.extended import Markdown
     from yorm.types.containers import List
+
+
+def test_lazy_imports():
+    import os
+    import sys
+    import subprocess
+    import yorm
+
+    root = os.path.dirname(os.path.dirname(yorm.__file__))
+    code = ("import sys, yorm; "
+            "print(sorted({'simplejson', 'parse'} & set(sys.modules)))")
+    output = subprocess.check_output([sys.executable, '-c', code],
+                                     env=dict(os.environ, PYTHONPATH=root))
+    assert output.decode().strip() == "[]"
@@ -0,0 +1,75 @@
+"""Integration tests for sharing equal values between loaded objects."""
+
+# pylint: disable=redefined-outer-name,expression-not-assigned,unused-variable,unused-argument
+
+import pytest
+from expecter import expect
+
+import yorm
+from yorm.types import List, Object, String
+
+
+@yorm.attr(status=String)
+@yorm.attr(labels=List.of_type(String))
+@yorm.attr(settings=Object)
+@yorm.sync("tmp/{self.key}.yml")
+class Ticket:
+    """An example class with many similar instances."""
+
+    def __init__(self, key):
+        self.key = key
+
+
+@pytest.yield_fixture
+def sharing():
+    yorm.interning.reset()
+    yorm.settings.intern_strings = True
+    yorm.settings.share_values = True
+    yield
+    yorm.settings.intern_strings = False
+    yorm.settings.share_values = False
+    yorm.interning.reset()
+
+
+def write(key, status, labels, color):
+    with open("tmp/{}.yml".format(key), 'w') as stream:
+        stream.write("status: {}\n".format(status))
+        stream.write("labels: [{}]\n".format(', '.join(labels)))
+        stream.write("settings:\n  display: {{color: {}}}\n".format(color))
+
+
+@pytest.fixture
+def tickets(tmpdir, sharing):
+    tmpdir.chdir()
+    tmpdir.mkdir('tmp')
+    write('a', "active", ["x", "y"], "red")
+    write('b', "active", ["y"], "red")
+    write('c', "active", ["x"], "blue")
+    return [Ticket(key) for key in 'abc']
+
+
+def describe_interning():
+
+    def it_shares_equal_strings(tickets):
+        a, b, c = tickets
+
+        expect(a.status is b.status is c.status).is_true()
+        expect(a.labels[1] is b.labels[0]).is_true()
+
+    def it_shares_equal_untyped_data(tickets):
+        a, b, c = tickets
+
+        expect(a.settings is b.settings).is_true()
+        expect(a.settings is c.settings).is_false()
+        expect(yorm.interning.stats()['hits']) >= 1
+
+    def it_does_not_share_assigned_values(tickets):
+        a, b, c = tickets
+        value = {'display': {'color': "green"}}
+
+        a.settings = value
+        value['display']['color'] = "black"
+
+        expect(b.settings) == {'display': {'color': "red"}}
+        with open("tmp/a.yml") as stream:
+            expect(stream.read()).contains("color: green")
@@ -0,0 +1,140 @@
+"""Integration tests for lists with appended items stored in a journal."""
+
+# pylint: disable=redefined-outer-name,expression-not-assigned,attribute-defined-outside-init,no-member
+
+import pytest
+from expecter import expect
+
+import yorm
+from yorm.types import Integer, JournaledList, String
+
+from . import strip, refresh_file_modification_times
+
+
+class SmallJournal(JournaledList):
+    THRESHOLD = 3
+
+
+@yorm.attr(events=SmallJournal.of_type(String))
+@yorm.attr(count=Integer)
+@yorm.sync("tmp/{self.key}.yml")
+class Sample:
+    """An example class with a journaled list."""
+
+    def __init__(self, key):
+        self.key = key
+
+
+def read(path):
+    with open(path) as stream:
+        return stream.read()
+
+
+@pytest.fixture
+def sample(tmpdir):
+    tmpdir.chdir()
+    sample = Sample('example')
+    sample.events.append("created")
+    sample.events.remove("created")
+    refresh_file_modification_times()
+    return sample
+
+
+def test_appended_items_are_journaled(sample):
+    sample.events.append("started")
+    sample.events.append(42)
+
+    expect(read("tmp/example.yml")) == strip("""
+    events:
+    -
+    count: 0
+    """)
+    expect(read("tmp/example.events.log")) == '"started"\n42\n'
+    expect(sample.events) == ["started", "42"]
+
+
+def test_journals_are_replayed_when_loading(sample):
+    sample.events.append("started")
+
+    sample2 = Sample('example')
+
+    expect(sample2.events) == ["started"]
+
+
+def test_journals_are_compacted_after_threshold(sample):
+    for name in ["a", "b", "c", "d"]:
+        sample.events.append(name)
+
+    expect(read("tmp/example.yml")) == strip("""
+    events:
+    - a
+    - b
+    - c
+    - d
+    count: 0
+    """)
+    expect("tmp/example.events.log").missing()
+
+
+def test_journals_are_compacted_after_other_changes(sample):
+    sample.events.append("started")
+    sample.events.insert(0, "inserted")
+
+    expect(read("tmp/example.yml")) == strip("""
+    events:
+    - inserted
+    - started
+    count: 0
+    """)
+    expect("tmp/example.events.log").missing()
+
+
+def test_other_attributes_are_saved_with_journal(sample):
+    sample.events.append("started")
+    sample.count = 1
+
+    expect(read("tmp/example.yml")) == strip("""
+    events:
+    -
+    count: 1
+    """)
+    expect(Sample('example').events) == ["started"]
+
+
+def test_journals_are_deleted_with_file(sample):
+    sample.events.append("started")
+
+    yorm.delete(sample)
+
+    expect("tmp/example.events.log").missing()
+
+
+def test_journals_are_kept_when_a_transaction_fails(sample):
+    sample.events.append("started")
+    sample.events.append("stopped")
+
+    with expect.raises(RuntimeError):
+        with yorm.transaction():
+            sample.events.insert(0, "created")
+            raise RuntimeError
+
+    expect("tmp/example.events.log").exists()
+    expect(Sample('example').events) == ["started", "stopped"]
+
+
+def test_journals_are_compacted_when_a_transaction_commits(sample):
+    sample.events.append("started")
+
+    with yorm.transaction():
+        sample.events.append("stopped")
+        expect(sample.events) == ["started", "stopped"]
+        expect(read("tmp/example.events.log")).contains("started")
+
+    expect("tmp/example.events.log").missing()
+    expect(read("tmp/example.yml")) == strip("""
+    events:
+    - started
+    - stopped
+    count: 0
+    """)
+    expect(Sample('example').events) == ["started", "stopped"]
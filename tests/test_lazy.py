@@ -0,0 +1,91 @@
+"""Integration tests for converting attributes on first access."""
+
+# pylint: disable=redefined-outer-name,expression-not-assigned,attribute-defined-outside-init,no-member
+
+from unittest.mock import patch
+
+import pytest
+from expecter import expect
+
+import yorm
+from yorm.types import Integer, List, String
+
+from . import strip, refresh_file_modification_times
+
+
+def create_class(descriptors):
+
+    @yorm.attr(name=String)
+    @yorm.attr(count=Integer)
+    @yorm.attr(items=List.of_type(Integer))
+    @yorm.sync("tmp/{self.key}.yml", lazy=True, descriptors=descriptors)
+    class Sample:
+        """An example class converting attributes on first access."""
+
+        def __init__(self, key):
+            self.key = key
+
+    return Sample
+
+
+@pytest.fixture(params=[False, True], ids=['methods', 'descriptors'])
+def sample(tmpdir, request):
+    tmpdir.chdir()
+    cls = create_class(request.param)
+    sample = cls('example')
+    sample.__mapper__.text = strip("""
+    name: foobar
+    count: 42
+    items:
+    - 1
+    - 2
+    """)
+    refresh_file_modification_times()
+    return sample
+
+
+def test_attributes_are_converted_on_access(sample):
+    expect(sample.count) == 42
+    expect(sorted(sample.__mapper__.pending)) == ['items', 'name']
+
+    expect(sample.name) == "foobar"
+    expect(sample.items) == [1, 2]
+    expect(sample.__mapper__.pending).is_none()
+
+
+def test_only_accessed_attributes_are_converted(sample):
+    with patch.object(Integer, 'to_value', wraps=Integer.to_value) as mock:
+        expect(sample.name) == "foobar"
+
+    expect(mock.call_count) == 0
+
+
+def test_converted_attributes_are_reused(sample):
+    items = sample.items
+
+    expect(sample.items is items).is_true()
+
+
+def test_pending_attributes_are_kept_when_saving(sample):
+    expect(sample.count) == 42
+
+    sample.count = 0
+
+    expect(sample.__mapper__.text) == strip("""
+    name: foobar
+    count: 0
+    items:
+    - 1
+    - 2
+    """)
+
+
+def test_file_changes_are_loaded_lazily(sample):
+    expect(sample.count) == 42
+
+    sample.__mapper__.text = "count: 7\nname: updated\n"
+    refresh_file_modification_times()
+
+    expect(sample.count) == 7
+    expect(sorted(sample.__mapper__.pending)) == ['name']
+    expect(sample.name) == "updated"
@@ -0,0 +1,138 @@
+"""Integration tests for advisory file locking between processes."""
+
+# pylint: disable=redefined-outer-name,expression-not-assigned,unused-variable,no-member
+# pylint: disable=attribute-defined-outside-init
+
+import os
+import threading
+import multiprocessing
+
+import pytest
+from expecter import expect
+
+import yorm
+from yorm.types import Integer
+
+from . import refresh_file_modification_times
+
+fcntl = pytest.importorskip('fcntl')
+
+
+@yorm.attr(count=Integer)
+@yorm.sync("tmp/{self.key}.yml", locking=True)
+class Counter:
+    """An example class shared between processes."""
+
+    def __init__(self, key):
+        self.key = key
+
+
+def increment(times):
+    counter = Counter('shared')
+    for _ in range(times):
+        with yorm.locked(counter):
+            counter.count += 1
+
+
+def is_locked(path):
+    with open(path + '.lock', 'a') as stream:
+        try:
+            fcntl.flock(stream, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError:
+            return True
+        fcntl.flock(stream, fcntl.LOCK_UN)
+        return False
+
+
+@pytest.fixture
+def counter(tmpdir):
+    tmpdir.chdir()
+    return Counter('shared')
+
+
+def describe_locking():
+
+    def it_creates_a_lock_file(counter):
+        counter.count = 1
+
+        expect(os.path.exists("tmp/shared.yml.lock")).is_true()
+
+    def it_deletes_the_lock_file_with_the_object(counter):
+        counter.count = 1
+
+        yorm.delete(counter)
+
+        expect("tmp/shared.yml.lock").missing()
+
+    def it_releases_the_lock_after_saving(counter):
+        counter.count = 1
+
+        expect(is_locked("tmp/shared.yml")).is_false()
+
+    def it_does_not_lose_concurrent_changes(counter):
+        processes = [multiprocessing.Process(target=increment, args=(20,))
+                     for _ in range(3)]
+        for process in processes:
+            process.start()
+        for process in processes:
+            process.join()
+
+        expect(counter.count) == 60
+
+
+def describe_locked():
+
+    def it_holds_the_lock_for_the_block(counter):
+        with yorm.locked(counter):
+            counter.count = 1
+            counter.count = 2
+            expect(is_locked("tmp/shared.yml")).is_true()
+
+        expect(is_locked("tmp/shared.yml")).is_false()
+        expect(counter.count) == 2
+
+    def it_excludes_other_threads(counter):
+        entered = threading.Event()
+
+        def lock():
+            with counter.__mapper__.lock():
+                entered.set()
+
+        with yorm.locked(counter):
+            thread = threading.Thread(target=lock)
+            thread.start()
+            expect(entered.wait(0.2)).is_false()
+
+        thread.join(1)
+        expect(entered.is_set()).is_true()
+
+    def it_is_reused_by_other_objects_of_the_file(counter):
+        def change():
+            with yorm.locked(counter):
+                other = Counter('shared')
+                other.count = 5
+
+        thread = threading.Thread(target=change)
+        thread.daemon = True
+        thread.start()
+        thread.join(2)
+
+        expect(thread.is_alive()).is_false()
+        expect(counter.count) == 5
+
+    def it_reloads_external_changes(counter):
+        expect(counter.count) == 0
+        with open("tmp/shared.yml", 'w') as stream:
+            stream.write("count: 42\n")
+        refresh_file_modification_times()
+
+        with yorm.locked(counter) as obj:
+            expect(counter.__dict__['count']) == 42
+            expect(obj) == counter
+
+    def it_releases_the_lock_on_errors(counter):
+        with expect.raises(RuntimeError):
+            with yorm.locked(counter):
+                raise RuntimeError
+
+        expect(is_locked("tmp/shared.yml")).is_false()
@@ -0,0 +1,110 @@
+"""Integration tests for rewriting only the changed keys of a file."""
+
+# pylint: disable=redefined-outer-name,expression-not-assigned,attribute-defined-outside-init,no-member
+
+import pytest
+from expecter import expect
+
+import yorm
+from yorm.types import Integer, List, Object, String
+
+from . import strip, refresh_file_modification_times
+
+
+@yorm.attr(name=String)
+@yorm.attr(items=List.of_type(Integer))
+@yorm.attr(count=Integer)
+@yorm.sync("tmp/{self.key}.yml", partial=True)
+class Sample:
+    """An example class that rewrites only changed keys."""
+
+    def __init__(self, key):
+        self.key = key
+
+
+@pytest.fixture
+def sample(tmpdir):
+    tmpdir.chdir()
+    sample = Sample('example')
+    sample.__mapper__.text = strip("""
+    # Comments are kept for unchanged keys
+    name: foobar
+
+    items:
+    - 1
+    - 2
+    count: 42  # until this key changes
+    """)
+    refresh_file_modification_times()
+    return sample
+
+
+def test_unchanged_keys_are_preserved(sample):
+    expect(sample.count) == 42
+
+    sample.count = 0
+
+    expect(sample.__mapper__.text) == strip("""
+    # Comments are kept for unchanged keys
+    name: foobar
+
+    items:
+    - 1
+    - 2
+    count: 0
+    """)
+
+
+def test_nested_changes_are_saved(sample):
+    expect(sample.items) == [1, 2]
+
+    sample.items.append(3)
+    sample.name = "updated"
+
+    expect(sample.__mapper__.text) == strip("""
+    # Comments are kept for unchanged keys
+    name: updated
+    items:
+    - 1
+    - 2
+    - 3
+    count: 42  # until this key changes
+    """)
+
+
+def test_external_changes_are_loaded(sample):
+    expect(sample.count) == 42
+
+    sample.__mapper__.text = "count: 7\n"
+    refresh_file_modification_times()
+
+    expect(sample.count) == 7
+    sample.name = "changed"
+
+    expect(sample.__mapper__.text) == strip("""
+    name: changed
+    items:
+    - 1
+    - 2
+    count: 7
+    """)
+
+
+def test_untyped_changes_in_place_are_saved(tmpdir):
+    tmpdir.chdir()
+
+    @yorm.attr(config=Object)
+    @yorm.sync("tmp/untyped.yml", partial=True)
+    class Untyped:
+        """An example class with an untyped attribute."""
+
+    untyped = Untyped()
+    untyped.config = {'key': 1}
+
+    untyped.config['key'] = 2
+    yorm.save(untyped)
+
+    expect(untyped.__mapper__.text) == strip("""
+    config:
+      key: 2
+    """)
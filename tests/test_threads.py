@@ -0,0 +1,146 @@
+"""Integration tests for mapped objects shared between threads."""
+
+# pylint: disable=redefined-outer-name,expression-not-assigned,unused-variable
+# pylint: disable=unused-argument,no-member
+
+import time
+import threading
+
+import pytest
+from expecter import expect
+
+import yorm
+from yorm.types import Integer, List
+
+
+@yorm.attr(count=Integer)
+@yorm.attr(values=List.of_type(Integer))
+@yorm.sync("tmp/{self.key}.yml", thread_safe=True)
+class Shared:
+    """An example class accessed from multiple threads."""
+
+    def __init__(self, key):
+        self.key = key
+
+
+@pytest.fixture
+def shared(tmpdir):
+    tmpdir.chdir()
+    return Shared('example')
+
+
+@pytest.yield_fixture
+def slow_reads():
+    yorm.hooks.on('before_read', lambda event, **_: time.sleep(0.01))
+    yield
+    yorm.hooks.off('before_read')
+
+
+def run(count, target, *args):
+    threads = [threading.Thread(target=target, args=args)
+               for _ in range(count)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+
+def describe_thread_safe():
+
+    def it_does_not_skip_loads_from_other_threads(shared, slow_reads):
+        loads = []
+        yorm.hooks.on('after_load', lambda event, **_: loads.append(1))
+        try:
+            run(4, yorm.load, shared)
+        finally:
+            yorm.hooks.off('after_load')
+
+        expect(len(loads)) == 4
+
+    def it_keeps_the_file_consistent(shared):
+        errors = []
+
+        def update():
+            try:
+                for index in range(20):
+                    shared.count = index
+                    shared.values = [index] * 3
+                    shared.count  # pylint: disable=pointless-statement
+            except Exception as exc:  # pylint: disable=broad-except
+                errors.append(exc)
+
+        run(4, update)
+
+        expect(errors) == []
+        mapper = shared.__mapper__
+        expect(mapper.data) == {'count': shared.count,
+                                'values': shared.values}
+
+    def it_excludes_other_threads_while_locked(shared, slow_reads):
+        events = []
+
+        def batch():
+            name = threading.current_thread().name
+            with yorm.locked(shared):
+                events.append(name)
+                shared.count += 1
+                events.append(name)
+
+        run(3, batch)
+
+        expect(events[0::2]) == events[1::2]
+        expect(shared.count) == 3
+
+
+@yorm.attr(count=Integer)
+@yorm.sync("tmp/{self.key}.yml")
+class Unsafe:
+    """An example class without thread-safe mode."""
+
+    def __init__(self, key):
+        self.key = key
+
+
+def describe_overlapping_threads():
+
+    def it_does_not_skip_later_loads(tmpdir):
+        tmpdir.chdir()
+        unsafe = Unsafe('example')
+        first_entered = threading.Event()
+        second_entered = threading.Event()
+        first_exited = threading.Event()
+
+        def pause(_event, **_):
+            if threading.current_thread().name == 'first':
+                first_entered.set()
+                second_entered.wait(5)
+            else:
+                second_entered.set()
+                first_exited.wait(5)
+
+        def load():
+            yorm.load(unsafe)
+
+        yorm.hooks.on('before_read', pause)
+        try:
+            first = threading.Thread(target=load, name='first')
+            second = threading.Thread(target=load, name='second')
+            first.start()
+            first_entered.wait(5)
+            second.start()
+            first.join()
+            first_exited.set()
+            second.join()
+        finally:
+            yorm.hooks.off('before_read')
+
+        loads = []
+        yorm.hooks.on('after_load', lambda event, **_: loads.append(1))
+        try:
+            run(1, yorm.load, unsafe)
+            yorm.load(unsafe)
+        finally:
+            yorm.hooks.off('after_load')
+
+        expect(len(loads)) == 2
+        expect(unsafe.__mapper__.evict()).is_true()
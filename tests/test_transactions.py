@@ -0,0 +1,173 @@
+"""Integration tests for atomic commits of multiple mapped files."""
+
+# pylint: disable=redefined-outer-name,expression-not-assigned,unused-variable
+
+import os
+import threading
+import time
+
+import pytest
+from expecter import expect
+
+import yorm
+from yorm import diskutils, transactions
+from yorm.types import Integer, List, String
+
+from . import strip
+
+
+@yorm.attr(items=List.of_type(String))
+@yorm.sync("tmp/{self.key}.yml", auto_create=False)
+class Inventory:
+    """An example class with items that move between files."""
+
+    def __init__(self, key):
+        self.key = key
+
+
+@pytest.fixture
+def inventories(tmpdir):
+    tmpdir.chdir()
+    os.mkdir('tmp')
+    with open('tmp/a.yml', 'w') as stream:
+        stream.write("items:\n- apples\n")
+    with open('tmp/b.yml', 'w') as stream:
+        stream.write("items: []\n")
+    return Inventory('a'), Inventory('b')
+
+
+def read(path):
+    with open(path) as stream:
+        return stream.read()
+
+
+def describe_transaction():
+
+    def it_writes_files_when_the_block_exits(inventories):
+        a, b = inventories
+
+        with yorm.transaction():
+            a.items.remove('apples')
+            b.items.append('apples')
+            expect(read('tmp/a.yml')) == "items:\n- apples\n"
+            expect(read('tmp/b.yml')) == "items: []\n"
+
+        expect(read('tmp/a.yml')) == "items:\n-\n"
+        expect(read('tmp/b.yml')) == "items:\n- apples\n"
+        expect(transactions.WAL).missing()
+
+    def it_reads_staged_changes_inside_the_block(inventories):
+        a, b = inventories
+
+        with yorm.transaction():
+            a.items.remove('apples')
+            b.items.append('apples')
+            expect(a.__mapper__.text) == "items:\n-\n"
+            expect(b.items) == ['apples']
+
+    def it_discards_changes_when_the_block_fails(inventories):
+        a, b = inventories
+
+        with expect.raises(RuntimeError):
+            with yorm.transaction():
+                a.items.remove('apples')
+                b.items.append('apples')
+                raise RuntimeError
+
+        expect(read('tmp/a.yml')) == "items:\n- apples\n"
+        expect(read('tmp/b.yml')) == "items: []\n"
+        expect(a.items) == ['apples']
+        expect(b.items) == []
+
+    def it_joins_an_enclosing_transaction(inventories):
+        a, b = inventories
+
+        with yorm.transaction() as outer:
+            with yorm.transaction() as inner:
+                a.items.remove('apples')
+                b.items.append('apples')
+            expect(inner) == outer
+            expect(read('tmp/b.yml')) == "items: []\n"
+
+        expect(read('tmp/b.yml')) == "items:\n- apples\n"
+
+    def it_only_applies_to_the_current_thread(inventories):
+        a, b = inventories
+
+        with yorm.transaction():
+            thread = threading.Thread(target=a.items.clear)
+            thread.start()
+            thread.join()
+            expect(read('tmp/a.yml')) == "items:\n-\n"
+
+
+def describe_recover():
+
+    def it_applies_changes_from_an_interrupted_commit(tmpdir):
+        tmpdir.chdir()
+        path = str(tmpdir.join('sample.yml'))
+        with open(path, 'w') as stream:
+            stream.write("count: 1\n")
+        diskutils.write_log([(path, "count: 2\n")], transactions.WAL)
+
+        @yorm.attr(count=Integer)
+        class Sample:
+            pass
+
+        sample = yorm.sync(Sample(), path)
+
+        expect(sample.count) == 2
+        expect(transactions.WAL).missing()
+
+    def it_discards_an_incomplete_log(tmpdir):
+        tmpdir.chdir()
+        with open(transactions.WAL, 'w') as stream:
+            stream.write('{"files": [["sample.yml", "cou')
+
+        expect(transactions.recover()) == []
+        expect(transactions.WAL).missing()
+
+    def it_does_nothing_without_a_log(tmpdir):
+        tmpdir.chdir()
+
+        expect(transactions.recover()) == []
+
+    def it_returns_the_recovered_paths(tmpdir):
+        tmpdir.chdir()
+        path = str(tmpdir.join('sample.yml'))
+        diskutils.write_log([(path, "count: 2\n")], 'custom.wal')
+
+        expect(transactions.recover('custom.wal')) == [path]
+        expect(read(path)) == strip("""
+        count: 2
+        """)
+
+    def it_deletes_files_logged_without_contents(tmpdir):
+        tmpdir.chdir()
+        path = str(tmpdir.join('sample.events.log'))
+        with open(path, 'w') as stream:
+            stream.write('"started"\n')
+        diskutils.write_log([(path, None)], transactions.WAL)
+
+        expect(transactions.recover()) == [path]
+        expect(path).missing()
+
+    def it_waits_for_a_commit_in_progress(tmpdir):
+        tmpdir.chdir()
+        path = str(tmpdir.join('sample.yml'))
+        diskutils.write_log([(path, "count: 2\n")], transactions.WAL)
+        locked = threading.Event()
+
+        def commit():
+            with diskutils.lock(transactions.WAL):
+                locked.set()
+                time.sleep(0.1)
+                diskutils.delete(transactions.WAL)
+
+        thread = threading.Thread(target=commit)
+        thread.start()
+        locked.wait(5)
+
+        expect(transactions.recover()) == []
+        expect(path).missing()
+        thread.join()
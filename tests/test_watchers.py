@@ -0,0 +1,117 @@
+"""Integration tests for callbacks on files changed by others."""
+
+# pylint: disable=redefined-outer-name,expression-not-assigned,unused-variable
+# pylint: disable=unused-argument,attribute-defined-outside-init
+
+import threading
+
+import pytest
+from expecter import expect
+
+import yorm
+from yorm.types import Integer, String
+
+
+@yorm.attr(name=String)
+@yorm.attr(count=Integer)
+@yorm.sync("tmp/{self.key}.yml")
+class Config:
+    """An example class used as live configuration."""
+
+    def __init__(self, key):
+        self.key = key
+
+
+class Recorder:
+    """Callback that records the changes it receives."""
+
+    def __init__(self):
+        self.calls = []
+        self.called = threading.Event()
+
+    def __call__(self, obj, changes):
+        self.calls.append((obj, changes))
+        self.called.set()
+
+
+@pytest.yield_fixture
+def config(tmpdir):
+    tmpdir.chdir()
+    config = Config('example')
+    config.name = "foo"
+    yield config
+    yorm.unwatch(config)
+    yorm.unwatch(Config)
+
+
+def edit(text):
+    with open("tmp/example.yml", 'w') as stream:
+        stream.write(text)
+
+
+def settle():
+    for _ in range(2):
+        yorm.watchers.check()
+
+
+def describe_watch():
+
+    def it_calls_back_with_the_changes(config):
+        recorder = Recorder()
+        yorm.watch(config, recorder)
+
+        edit("name: bar\ncount: 0\n")
+
+        settle()
+        expect(recorder.calls) == [(config, {'name': ("foo", "bar")})]
+
+    def it_runs_on_a_background_thread(config, monkeypatch):
+        monkeypatch.setattr(yorm.settings, 'watch_interval', 0.01)
+        recorder = Recorder()
+        yorm.watch(config, recorder)
+
+        edit("name: bar\ncount: 42\n")
+
+        expect(recorder.called.wait(5)).is_true()
+        expect(recorder.calls[0][1]) == {'name': ("foo", "bar"),
+                                         'count': (0, 42)}
+        expect(config.count) == 42
+
+    def it_ignores_changes_saved_by_the_object(config):
+        recorder = Recorder()
+        yorm.watch(config, recorder)
+
+        config.count = 42
+
+        settle()
+        expect(recorder.calls) == []
+
+    def it_ignores_files_that_are_unchanged(config):
+        recorder = Recorder()
+        yorm.watch(config, recorder)
+
+        edit("name: foo\ncount: 0\n")
+
+        settle()
+        expect(recorder.calls) == []
+
+    def it_can_watch_instances_of_a_class(config):
+        recorder = Recorder()
+        yorm.watch(Config, recorder)
+        other = Config('other')
+
+        with open("tmp/other.yml", 'w') as stream:
+            stream.write("name: changed\ncount: 0\n")
+
+        settle()
+        expect(recorder.calls) == [(other, {'name': ("", "changed")})]
+
+    def it_can_stop_calling_back(config):
+        recorder = Recorder()
+        yorm.watch(config, recorder)
+        yorm.unwatch(config, recorder)
+
+        edit("name: bar\n")
+
+        settle()
+        expect(recorder.calls) == []
@@ -1,9 +1,12 @@
 """Package for YORM."""
 
-from . import bases, types
+from . import bases, cache, hooks, interning, scheduler, types, watchers
 from .common import UUID
 from .decorators import sync, sync_object, sync_instances, attr
-from .utilities import create, find, match, load, save, delete
+from .utilities import create, find, match, load, save, delete, locked
+from .metrics import stats
+from .transactions import transaction
+from .watchers import watch, unwatch
 from .bases import Container, Converter, Mappable
 from .mixins import ModelMixin
 
@@ -1,6 +1,7 @@
 """Converter classes."""
 
 from abc import ABCMeta, abstractclassmethod, abstractmethod
+import contextlib
 import logging
 
 from .. import common
@@ -12,6 +13,8 @@ log = logging.getLogger(__name__)
 class Converter(metaclass=ABCMeta):
     """Base class for attribute converters."""
 
+    __slots__ = ()
+
     @abstractclassmethod
     def create_default(cls):
         """Create a default value for an attribute."""
@@ -31,6 +34,8 @@ class Converter(metaclass=ABCMeta):
 class Container(Mappable, Converter, metaclass=ABCMeta):
     """Base class for mutable attribute converters."""
 
+    __slots__ = ()
+
     @classmethod
     def create_default(cls):
         return cls.__new__(cls)
@@ -49,3 +54,13 @@ class Container(Mappable, Converter, metaclass=ABCMeta):
     def format_data(self):
         """Format the attribute to data optimized for dumping."""
         return self.to_data(self)
+
+    @contextlib.contextmanager
+    def bulk(self):
+        """Save the mapped object once after a block of changes."""
+        mapper = common.get_mapper(self)
+        if mapper is None:
+            yield self
+        else:
+            with mapper.bulk():
+                yield self
@@ -4,7 +4,7 @@ import abc
 import functools
 import logging
 
-from .. import common
+from .. import cache, common
 
 log = logging.getLogger(__name__)
 
@@ -23,10 +23,11 @@ def load_before(method):
             mapper = common.get_mapper(self)
             if mapper and mapper.modified:
                 log.debug("Loading before call: %s", method.__name__)
-                mapper.load()
-                if mapper.auto_save_after_load:
-                    mapper.save()
-                    mapper.modified = False
+                _load(mapper)
+            elif mapper:
+                cache.touch(mapper)
+            if mapper and mapper.pending:
+                _materialize(mapper, method, args)
 
         return method(self, *args, **kwargs)
 
@@ -51,7 +52,7 @@ def save_after(method):
             mapper = common.get_mapper(self)
             if mapper and mapper.auto_save:
                 log.debug("Saving after call: %s", method.__name__)
-                mapper.save()
+                mapper.autosave()
 
         return result
 
@@ -60,6 +61,23 @@ def save_after(method):
     return wrapped
 
 
+def _load(mapper):
+    """Update an object from its modified file."""
+    mapper.flush()
+    mapper.load(merge=True)
+    if mapper.auto_save_after_load:
+        mapper.save()
+        mapper.modified = False
+
+
+def _materialize(mapper, method, args):
+    """Convert pending file data for the attributes a call needs."""
+    if method.__name__ != '__getattribute__':
+        mapper.materialize()
+    elif args[0] in mapper.pending:
+        mapper.materialize(args[0])
+
+
 def _private_call(method, args, prefix='_'):
     """Determine if a call's first argument is a private variable name."""
     if method.__name__ in ('__getattribute__', '__setattr__'):
@@ -69,9 +87,65 @@ def _private_call(method, args, prefix='_'):
         return False
 
 
+class MappedAttribute:
+    """Data descriptor to load before getting and save after setting."""
+
+    MISSING = object()
+
+    def __init__(self, name, default=MISSING):
+        self.name = name
+        self.default = default
+
+    def __repr__(self):
+        return "<mapped attribute {!r}>".format(self.name)
+
+    def __get__(self, instance, owner):
+        if instance is None:
+            return self
+
+        mapper = common.get_mapper(instance)
+        if mapper and mapper.modified:
+            log.debug("Loading before get: %s", self.name)
+            _load(mapper)
+        elif mapper:
+            cache.touch(mapper)
+        if mapper and mapper.pending and self.name in mapper.pending:
+            mapper.materialize(self.name)
+
+        try:
+            return instance.__dict__[self.name]
+        except KeyError:
+            if self.default is self.MISSING:
+                msg = "{!r} object has no attribute {!r}".format(
+                    owner.__name__, self.name)
+                raise AttributeError(msg) from None
+            return self.default
+
+    def __set__(self, instance, value):
+        instance.__dict__[self.name] = value
+
+        mapper = common.get_mapper(instance)
+        if mapper and mapper.auto_save:
+            log.debug("Saving after set: %s", self.name)
+            mapper.autosave()
+
+    def __delete__(self, instance):
+        try:
+            del instance.__dict__[self.name]
+        except KeyError:
+            raise AttributeError(self.name) from None
+
+        mapper = common.get_mapper(instance)
+        if mapper and mapper.auto_save:
+            log.debug("Saving after delete: %s", self.name)
+            mapper.autosave()
+
+
 class Mappable(metaclass=abc.ABCMeta):
     """Base class for objects with attributes mapped to file."""
 
+    __slots__ = ()
+
     # pylint: disable=no-member
 
     @load_before
@@ -161,26 +235,107 @@ _SAVE_AFTER_METHODS = [
 ]
 
 
-def patch_methods(instance):
+_mapped_classes = {}  # generated subclasses keyed by original class and mode
+
+
+def patch_methods(instance, *, descriptors=False):
     log.debug("Patching methods on: %r", instance)
     cls = instance.__class__
+    key = cls, descriptors
 
+    try:
+        mapped_cls = _mapped_classes[key]
+    except KeyError:
+        mapped_cls = _create_mapped_class(cls, descriptors)
+        _mapped_classes[key] = mapped_cls
+
+    # Proxy objects can report a `__class__` that is not their own type
+    if mapped_cls and type(instance) is cls:  # pylint: disable=unidiomatic-typecheck
+        try:
+            instance.__class__ = mapped_cls
+        except TypeError as exc:
+            log.debug("Unable to change class of %r: %s", instance, exc)
+        else:
+            return
+
+    log.trace("Patching class in place: %r", cls)
+    _patch_class(cls, descriptors)
+
+
+def _create_mapped_class(cls, descriptors):
+    """Create a subclass with patched methods for mapped instances."""
+    namespace = {
+        '__module__': cls.__module__,
+        '__qualname__': cls.__qualname__,
+        '__doc__': cls.__doc__,
+        '__slots__': (),
+        '__class__': property(lambda self: cls),
+        '__reduce_ex__': _reduce_ex,
+    }
+    for name, method in _get_methods(cls, descriptors):
+        namespace[name] = method
+
+    try:
+        mapped_cls = type(cls)(cls.__name__, (cls,), namespace)
+    except TypeError as exc:
+        log.debug("Unable to subclass %r: %s", cls, exc)
+        return None
+
+    log.trace("Created mapped class: %r", mapped_cls)
+    return mapped_cls
+
+
+def _reduce_ex(self, protocol):
+    """Pickle a mapped instance as an instance of its original class."""
+    mapped_cls = type(self)
+    reduced = super(mapped_cls, self).__reduce_ex__(protocol)
+    if isinstance(reduced, tuple) and reduced[1][:1] == (mapped_cls,):
+        args = (self.__class__,) + reduced[1][1:]
+        reduced = (reduced[0], args) + reduced[2:]
+    return reduced
+
+
+def _patch_class(cls, descriptors):
+    """Patch methods on a class that cannot be subclassed."""
+    for name, method in _get_methods(cls, descriptors):
+        setattr(cls, name, method)
+
+
+def _get_methods(cls, descriptors):
+    """Yield the methods of a class wrapped to load and save."""
     for name in _LOAD_BEFORE_METHODS:
+        if descriptors and name == '__getattribute__':
+            continue
         try:
             method = getattr(cls, name)
         except AttributeError:
             log.trace("No method: %s", name)
         else:
-            modified_method = load_before(method)
-            setattr(cls, name, modified_method)
+            yield name, load_before(method)
             log.trace("Patched to load before call: %s", name)
 
     for name in _SAVE_AFTER_METHODS:
+        if descriptors and name == '__setattr__':
+            continue
         try:
             method = getattr(cls, name)
         except AttributeError:
             log.trace("No method: %s", name)
         else:
-            modified_method = save_after(method)
-            setattr(cls, name, modified_method)
+            yield name, save_after(method)
             log.trace("Patched to save after call: %s", name)
+
+
+def patch_attributes(instance, names):
+    log.debug("Patching attributes on: %r", instance)
+    cls = type(instance)
+
+    for name in names:
+        default = getattr(cls, name, MappedAttribute.MISSING)
+        if isinstance(default, MappedAttribute):
+            continue
+        if hasattr(default, '__get__'):
+            log.trace("Not replacing descriptor: %s", name)
+            continue
+        setattr(cls, name, MappedAttribute(name, default))
+        log.trace("Patched to load and save attribute: %s", name)
@@ -0,0 +1,120 @@
+"""Least recently used objects kept loaded within memory limits."""
+
+import logging
+import threading
+import weakref
+from collections import OrderedDict
+
+from . import metrics, settings
+
+log = logging.getLogger(__name__)
+
+
+# GLOBALS #####################################################################
+
+_lock = threading.RLock()
+_entries = OrderedDict()  # [mapper reference, size] keyed by mapper ID
+_totals = {'bytes': 0, 'evictions': 0, 'restores': 0}
+
+
+# FUNCTIONS ###################################################################
+
+
+def enabled():
+    """Determine if a limit on loaded objects is set."""
+    return settings.max_loaded_objects is not None or \
+        settings.max_loaded_bytes is not None
+
+
+def touch(mapper, size=None):
+    """Mark a mapper as recently used, evicting others over the limits.
+
+    :param mapper: mapper of the object being used
+    :param size: size of the data just read from its file
+
+    """
+    if not enabled():
+        return
+
+    key = id(mapper)
+    with _lock:
+        entry = _entries.get(key)
+        if entry is None or entry[0]() is not mapper:
+            if size is None:
+                return  # not loaded yet
+            entry = [weakref.ref(mapper, lambda _: discard(key)), 0]
+            _entries[key] = entry
+        else:
+            _entries.move_to_end(key)
+
+        if size is not None:
+            _totals['bytes'] += size - entry[1]
+            entry[1] = size
+
+        if _over_limits():
+            _evict()
+
+
+def discard(key):
+    """Stop tracking a mapper by its ID."""
+    with _lock:
+        entry = _entries.pop(key, None)
+        if entry:
+            _totals['bytes'] -= entry[1]
+
+
+def restored():
+    """Count an evicted object being loaded again."""
+    with _lock:
+        _totals['restores'] += 1
+    if settings.metrics:
+        metrics.record('restore')
+
+
+def stats():
+    """Get the number and size of loaded objects and eviction counts.
+
+    :return: dictionary of counts
+
+    """
+    with _lock:
+        return OrderedDict([
+            ('objects', len(_entries)),
+            ('bytes', _totals['bytes']),
+            ('evictions', _totals['evictions']),
+            ('restores', _totals['restores']),
+        ])
+
+
+def reset():
+    """Stop tracking all loaded objects and clear the counts."""
+    with _lock:
+        _entries.clear()
+        _totals.update(bytes=0, evictions=0, restores=0)
+
+
+def _over_limits():
+    if settings.max_loaded_objects is not None and \
+            len(_entries) > settings.max_loaded_objects:
+        return True
+    if settings.max_loaded_bytes is not None and \
+            _totals['bytes'] > settings.max_loaded_bytes:
+        return True
+    return False
+
+
+def _evict():
+    """Drop the attributes of the least recently used objects."""
+    for _ in range(len(_entries) - 1):  # never the most recently used
+        if not _over_limits():
+            break
+        key, entry = next(iter(_entries.items()))
+        mapper = entry[0]()
+        if mapper is not None and not mapper.evict():
+            _entries.move_to_end(key)  # in use, so try others first
+            continue
+        discard(key)
+        if mapper is not None:
+            _totals['evictions'] += 1
+            if settings.metrics:
+                metrics.record('evict')
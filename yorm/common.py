@@ -1,5 +1,7 @@
 """Shared internal classes and functions."""
 
+import os
+import weakref
 import collections
 import logging
 
@@ -24,6 +26,7 @@ verbosity = 0  # global verbosity setting for controlling string formatting
 
 attrs = collections.defaultdict(collections.OrderedDict)
 path_formats = {}
+identities = weakref.WeakValueDictionary()  # live instances by resolved path
 
 
 # LOGGING #####################################################################
@@ -40,6 +43,8 @@ def _trace(self, message, *args, **kwargs):
 
 logging.Logger.trace = _trace
 
+log = logging.getLogger(__name__)
+
 
 # DECORATORS ##################################################################
 
@@ -79,3 +84,23 @@ def set_mapper(obj, mapper):
     """Attach a `Mapper` instance to an object."""
     setattr(obj, MAPPER, mapper)
     return mapper
+
+
+def get_identity(path):
+    """Get the live mapped object for a file path, if any."""
+    return identities.get(os.path.realpath(path))
+
+
+def set_identity(path, obj):
+    """Record the mapped object for a file path in the identity map."""
+    try:
+        identities[os.path.realpath(path)] = obj
+    except TypeError:
+        log.debug("Unable to track identity of %r", obj)
+
+
+def del_identity(path, obj):
+    """Remove a mapped object from the identity map."""
+    key = os.path.realpath(path)
+    if identities.get(key) is obj:
+        del identities[key]
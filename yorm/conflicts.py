@@ -0,0 +1,104 @@
+"""Resolvers for files changed since they were last read or written."""
+
+import logging
+
+from . import exceptions
+
+log = logging.getLogger(__name__)
+
+MISSING = object()
+
+
+def error(base, ours, theirs):  # pylint: disable=unused-argument
+    """Refuse to save over changes made by others."""
+    raise exceptions.ConflictError("File changed since it was loaded")
+
+
+def overwrite(base, ours, theirs):  # pylint: disable=unused-argument
+    """Replace changes made by others (last writer wins)."""
+    return ours
+
+
+def reapply(base, ours, theirs):
+    """Apply our changed keys on top of the file's current data."""
+    data = ours.__class__()
+    for key, value in ours.items():
+        if key in theirs and base.get(key, MISSING) == value:
+            data[key] = theirs[key]
+        else:
+            data[key] = value
+    for key, value in theirs.items():
+        if key not in data:
+            data[key] = value
+    return data
+
+
+def merge(base, ours, theirs):
+    """Combine changes to different keys, failing when both changed a key.
+
+    Dictionaries changed on both sides are merged key by key, so only
+    changes to the same nested value conflict.
+
+    """
+    conflicts = []
+    data = _merge(base, ours, theirs, conflicts)
+
+    if conflicts:
+        msg = "Conflicting changes to: {}".format(", ".join(conflicts))
+        raise exceptions.ConflictError(msg)
+
+    return data
+
+
+RESOLVERS = {
+    'error': error,
+    'overwrite': overwrite,
+    'reload': reapply,
+    'merge': merge,
+}
+
+
+def get_resolver(on_conflict):
+    """Get the resolver function for an `on_conflict` setting.
+
+    :param on_conflict: name of a resolver or a function that accepts the
+                        base, our, and their data and returns data to save
+
+    """
+    if callable(on_conflict):
+        return on_conflict
+    try:
+        return RESOLVERS[on_conflict]
+    except KeyError:
+        msg = "Unknown conflict resolver: {!r}".format(on_conflict)
+        raise ValueError(msg) from None
+
+
+def _merge(base, ours, theirs, conflicts, path=()):
+    """Three-way merge dictionaries, recording the keys that conflict."""
+    data = ours.__class__()
+    for key in _keys(ours, theirs):
+        original = base.get(key, MISSING)
+        mine = ours.get(key, MISSING)
+        other = theirs.get(key, MISSING)
+        if mine in (original, other):
+            value = other
+        elif other == original:
+            value = mine
+        elif isinstance(mine, dict) and isinstance(other, dict):
+            if not isinstance(original, dict):
+                original = {}
+            value = _merge(original, mine, other, conflicts, path + (key,))
+        else:
+            conflicts.append(".".join(map(str, path + (key,))))
+            continue
+        if value is not MISSING:
+            data[key] = value
+    return data
+
+
+def _keys(ours, theirs):
+    """Get the keys of both dictionaries, preserving our order first."""
+    keys = list(ours)
+    keys.extend(key for key in theirs if key not in ours)
+    return keys
@@ -4,8 +4,8 @@ import uuid
 from collections import OrderedDict
 import logging
 
-from . import common
-from .bases.mappable import patch_methods
+from . import common, settings, transactions, watchers
+from .bases.mappable import patch_methods, patch_attributes
 from .mapper import Mapper
 
 log = logging.getLogger(__name__)
@@ -28,22 +28,33 @@ def sync(*args, **kwargs):
         return sync_object(*args, **kwargs)
 
 
-def sync_object(instance, path, attrs=None, **kwargs):
+def sync_object(instance, path, attrs=None, *, descriptors=False, **kwargs):
     """Enable YAML mapping on an object.
 
     :param instance: object to patch with YAML mapping behavior
     :param path: file path for dump/parse
     :param attrs: dictionary of attribute names mapped to converter classes
+    :param descriptors: only intercept access to the mapped attributes
 
     :param auto_create: automatically create the file to save attributes
     :param auto_save: automatically save attribute changes to the file
     :param auto_track: automatically add new attributes from the file
+    :param lazy: convert each attribute's file data on first access
+    :param partial: rewrite only the changed top-level keys of YAML files
+    :param locking: lock the file while reading and saving
+    :param on_conflict: resolver for files changed since they were loaded
+    :param thread_safe: serialize loads and saves from multiple threads
+    :param identity: share one live instance between lookups of each file
+    :param auto_save_delay: seconds without changes before saving them
+    :param auto_save_max_delay: maximum seconds to delay saving changes
 
     """
     log.info("Mapping %r to %s...", instance, path)
 
     common.get_mapper(instance, expected=False)
-    patch_methods(instance)
+    if not settings.fake:
+        transactions.recover()
+    patch_methods(instance, descriptors=descriptors)
 
     attrs = _ordered(attrs) or common.attrs[instance.__class__]
     mapper = Mapper(instance, path, attrs, **kwargs)
@@ -57,7 +68,13 @@ def sync_object(instance, path, attrs=None, **kwargs):
     else:
         mapper.load()
 
+    if descriptors:
+        patch_attributes(instance, mapper.attrs)
+
     common.set_mapper(instance, mapper)
+    if mapper.identity:
+        common.set_identity(path, instance)
+    watchers.track(mapper)
     log.info("Mapped %r to %s", instance, path)
 
     return instance
@@ -69,10 +86,19 @@ def sync_instances(path_format, format_spec=None, attrs=None, **kwargs):
     :param path_format: formatting string to create file paths for dump/parse
     :param format_spec: dictionary to use for string formatting
     :param attrs: dictionary of attribute names mapped to converter classes
+    :param descriptors: only intercept access to the mapped attributes
 
     :param auto_create: automatically create the file to save attributes
     :param auto_save: automatically save attribute changes to the file
     :param auto_track: automatically add new attributes from the file
+    :param lazy: convert each attribute's file data on first access
+    :param partial: rewrite only the changed top-level keys of YAML files
+    :param locking: lock the file while reading and saving
+    :param on_conflict: resolver for files changed since they were loaded
+    :param thread_safe: serialize loads and saves from multiple threads
+    :param identity: share one live instance between lookups of each file
+    :param auto_save_delay: seconds without changes before saving them
+    :param auto_save_max_delay: maximum seconds to delay saving changes
 
     """
     format_spec = format_spec or {}
@@ -82,12 +108,9 @@ def sync_instances(path_format, format_spec=None, attrs=None, **kwargs):
         """Class decorator to map instances to files."""
         common.path_formats[cls] = path_format
         init = cls.__init__
+        new = cls.__new__
 
-        def modified_init(self, *_args, **_kwargs):
-            init(self, *_args, **_kwargs)
-
-            log.info("Mapping instance of %r to '%s'...", cls, path_format)
-
+        def get_path(self):
             format_values = {}
             for key, value in format_spec.items():
                 format_values[key] = getattr(self, value)
@@ -97,17 +120,52 @@ def sync_instances(path_format, format_spec=None, attrs=None, **kwargs):
 
             common.attrs[cls].update(attrs)
             common.attrs[cls].update(common.attrs[self.__class__])
-            path = path_format.format(**format_values)
-            sync_object(self, path, **kwargs)
+            return path_format.format(**format_values)
+
+        def modified_init(self, *_args, **_kwargs):
+            if kwargs.get('identity') and common.get_mapper(self):
+                return  # mapped when created
+
+            init(self, *_args, **_kwargs)
+
+            log.info("Mapping instance of %r to '%s'...", cls, path_format)
+            sync_object(self, get_path(self), **kwargs)
+
+        def modified_new(cls_, *_args, **_kwargs):
+            if new is object.__new__:
+                self = new(cls_)
+            else:
+                self = new(cls_, *_args, **_kwargs)
+            if _args[:1] and isinstance(_args[0], _Unpickled):
+                return self
+            if cls_.__init__ is not modified_init:
+                return self  # subclass arguments may not fit this `__init__`
+            init(self, *_args, **_kwargs)
+
+            path = get_path(self)
+            existing = common.get_identity(path)
+            if existing is not None and isinstance(existing, cls_):
+                log.debug("Reusing mapped instance for '%s'", path)
+                return existing
+
+            log.info("Mapping instance of %r to '%s'...", cls, path_format)
+            return sync_object(self, path, **kwargs)
 
         modified_init.__doc__ = init.__doc__
         cls.__init__ = modified_init
+        if kwargs.get('identity'):
+            cls.__new__ = staticmethod(modified_new)
+            cls.__getnewargs__ = lambda self: (_Unpickled(),)
 
         return cls
 
     return decorator
 
 
+class _Unpickled:
+    """Marker to create instances without looking up existing ones."""
+
+
 def attr(**kwargs):
     """Class decorator to map attributes to types.
 
@@ -1,16 +1,26 @@
 """Functions to work with files and data formats."""
 
+import io
 import os
+import re
+import base64
 import shutil
 import logging
+import tempfile
+import threading
+import contextlib
 
 import yaml
-import simplejson as json
 
-from . import exceptions
+from . import exceptions, metrics, settings
 
 log = logging.getLogger(__name__)
 
+LOCK_EXTENSION = '.lock'
+YAML_KEY = re.compile(r"^(?![\s#%-]|\.\.\.)([^:\n]+?):(?= |$)", re.MULTILINE)
+
+_locks = {}  # [lock file, shared] held keyed by real path and thread ID
+
 
 def exists(path):
     """Determine if a path exists."""
@@ -28,6 +38,56 @@ def touch(path):
         write("", path)
 
 
+@contextlib.contextmanager
+def lock(path, shared=False):
+    """Hold an advisory lock on a file while the context is active.
+
+    The lock is placed on a separate lock file that remains in place even
+    when the file itself is replaced. A thread that already holds a lock on
+    the file (e.g. through another object mapped to it) reuses that lock,
+    upgrading it while an exclusive lock is needed. Locking is skipped on
+    platforms without `fcntl`.
+
+    :param path: file path to lock
+    :param shared: allow other processes to hold shared locks at once
+
+    """
+    try:
+        import fcntl
+    except ImportError:  # pragma: no cover (Windows)
+        log.trace("Unable to lock '{}' on this platform".format(path))
+        yield
+        return
+
+    key = os.path.realpath(path), threading.get_ident()
+    held = _locks.get(key)
+    if held:
+        stream, held_shared = held
+        if shared or not held_shared:
+            yield
+            return
+        log.trace("Upgrading lock on '{}'...".format(path))
+        fcntl.flock(stream, fcntl.LOCK_EX)
+        held[1] = False
+        try:
+            yield
+        finally:
+            held[1] = True
+            fcntl.flock(stream, fcntl.LOCK_SH)
+        return
+
+    log.trace("Locking '{}'...".format(path))
+    with open(path + LOCK_EXTENSION, 'a') as stream:
+        fcntl.flock(stream, fcntl.LOCK_SH if shared else fcntl.LOCK_EX)
+        _locks[key] = [stream, shared]
+        try:
+            yield
+        finally:
+            del _locks[key]
+            fcntl.flock(stream, fcntl.LOCK_UN)
+            log.trace("Unlocked '{}'".format(path))
+
+
 def read(path, encoding='utf-8'):
     """Read text from a file.
 
@@ -39,18 +99,21 @@ def read(path, encoding='utf-8'):
     """
     log.trace("Reading text from '{}'...".format(path))
 
-    with open(path, 'r', encoding=encoding) as stream:
-        text = stream.read()
+    with metrics.Timer('read', path=path) as timer:
+        with open(path, 'r', encoding=encoding) as stream:
+            text = stream.read()
+        timer.size = len(text)
 
     return text
 
 
-def write(text, path, encoding='utf-8'):
+def write(text, path, encoding='utf-8', *, start=0):
     """Write text to a file.
 
     :param text: string
     :param path: file path to write text
     :param encoding: output file encoding
+    :param start: index of the first character that differs from the file
 
     :return: path of file
 
@@ -58,18 +121,230 @@ def write(text, path, encoding='utf-8'):
     if text:
         log.trace("Writing text to '{}'...".format(path))
 
-    with open(path, 'wb') as stream:
-        data = text.encode(encoding)
-        stream.write(data)
+    with metrics.Timer('write', path=path) as timer:
+        if start:
+            with open(path, 'r+b') as stream:
+                stream.seek(len(text[:start].encode(encoding)))
+                data = text[start:].encode(encoding)
+                stream.write(data)
+                stream.truncate()
+        else:
+            with open(path, 'wb') as stream:
+                data = text.encode(encoding)
+                stream.write(data)
+        timer.size = len(data)
+
+    return path
+
+
+def replace(text, path, encoding='utf-8'):
+    """Atomically replace the contents of a file.
+
+    :param text: string, or bytes for a binary file
+    :param path: file path to replace
+    :param encoding: output file encoding
+
+    :return: path of file
+
+    """
+    log.trace("Replacing text in '{}'...".format(path))
+
+    with metrics.Timer('write', path=path) as timer:
+        with _temporary(path) as stream:
+            data = text if isinstance(text, bytes) else text.encode(encoding)
+            stream.write(data)
+        timer.size = len(data)
+
+    return path
+
+
+def sync(paths):
+    """Flush written files and their directory entries to disk.
+
+    :param paths: file paths that were written, replaced, or deleted
+
+    """
+    dirpaths = []
+    for path in paths:
+        if os.path.isfile(path):
+            with open(path, 'rb') as stream:
+                os.fsync(stream.fileno())
+        dirpath = os.path.dirname(os.path.abspath(path))
+        if dirpath not in dirpaths:
+            dirpaths.append(dirpath)
+
+    for dirpath in dirpaths:
+        _sync_directory(dirpath)
+
+
+def write_log(files, path, encoding='utf-8'):
+    """Durably write a log of new file contents.
+
+    The log is flushed to disk and then moved into place, so it either
+    contains every change or does not exist.
+
+    :param files: list of (path, text) pairs, with bytes for binary files
+    :param path: file path to write the log
+    :param encoding: output file encoding
+
+    :return: path of file
+
+    """
+    import simplejson as json  # imported on first use to speed up imports
+
+    log.trace("Logging changes to {} file(s) in '{}'...".format(
+        len(files), path))
+
+    files = [(name, _encode(text)) for name, text in files]
+    text = json.dumps({'files': files})
+    with metrics.Timer('write', path=path) as timer:
+        with _temporary(path) as stream:
+            data = text.encode(encoding)
+            stream.write(data)
+            stream.flush()
+            os.fsync(stream.fileno())
+        _sync_directory(os.path.dirname(os.path.abspath(path)))
+        timer.size = len(data)
+
+    return path
+
+
+def read_log(path, encoding='utf-8'):
+    """Read a log of new file contents.
+
+    :param path: file path to read from
+    :param encoding: input file encoding
+
+    :return: list of (path, text) pairs, or None if the log is invalid
+
+    """
+    import simplejson as json  # imported on first use to speed up imports
+
+    text = read(path, encoding=encoding)
+    try:
+        return [(name, _decode(text))
+                for name, text in json.loads(text)['files']]
+    except (json.JSONDecodeError, KeyError, TypeError, ValueError):
+        return None
+
+
+def read_records(path, encoding='utf-8'):
+    """Read a list of JSON records from a file with one record per line.
+
+    :param path: file path to read from
+    :param encoding: input file encoding
+
+    :return: list of records
+
+    """
+    import simplejson as json  # imported on first use to speed up imports
+
+    log.trace("Reading records from '{}'...".format(path))
+
+    records = []
+    with metrics.Timer('read', path=path) as timer:
+        with open(path, 'r', encoding=encoding) as stream:
+            for line in stream:
+                timer.size += len(line)
+                try:
+                    records.append(json.loads(line))
+                except json.JSONDecodeError:
+                    log.warning("Ignored incomplete record in '%s'", path)
+                    break
+
+    return records
+
+
+def append_records(records, path, encoding='utf-8'):
+    """Append JSON records to a file with one record per line.
+
+    :param records: list of records to append
+    :param path: file path to append records
+    :param encoding: output file encoding
+
+    :return: path of file
+
+    """
+    import simplejson as json  # imported on first use to speed up imports
+
+    log.trace("Appending records to '{}'...".format(path))
+
+    text = ''.join(json.dumps(record) + '\n' for record in records)
+    with metrics.Timer('write', path=path) as timer:
+        with open(path, 'ab') as stream:
+            data = text.encode(encoding)
+            stream.write(data)
+        timer.size = len(data)
+
+    return path
+
+
+def read_array(path):
+    """Memory-map a NumPy array from a file.
+
+    :param path: file path to read from
+
+    :return: read-only array backed by the file
+
+    """
+    import numpy  # pylint: disable=import-error
+
+    log.trace("Reading array from '{}'...".format(path))
+
+    return numpy.load(path, mmap_mode='r')
+
+
+def dump_array(array):
+    """Get the contents of a NumPy array file.
+
+    :param array: array to save
+
+    :return: bytes to write to the file
+
+    """
+    import numpy  # pylint: disable=import-error
+
+    stream = io.BytesIO()
+    numpy.save(stream, array)
+    return stream.getvalue()
+
+
+def write_array(array, path):
+    """Write a NumPy array to a file.
+
+    The file is replaced rather than overwritten so that arrays currently
+    memory-mapped from the previous file remain valid.
+
+    :param array: array to save
+    :param path: file path to write array
+
+    :return: path of file
+
+    """
+    import numpy  # pylint: disable=import-error
+
+    log.trace("Writing array to '{}'...".format(path))
+
+    with _temporary(path) as stream:
+        numpy.save(stream, array)
 
     return path
 
 
 def stamp(path):
     """Get the modification timestamp from a file."""
+    if settings.metrics:
+        with metrics.Timer('stat', path=path):
+            return os.path.getmtime(path)
     return os.path.getmtime(path)
 
 
+def signature(path):
+    """Get a tuple that changes whenever a file is modified or replaced."""
+    stat = os.stat(path)
+    return stat.st_mtime_ns, stat.st_size, stat.st_ino
+
+
 def delete(path):
     """Delete a file or directory."""
     if os.path.isdir(path):
@@ -95,13 +370,15 @@ def parse(text, path):
 
     """
     ext = _get_ext(path)
-    if ext in ['json']:
-        data = _parse_json(text, path)
-    elif ext in ['yml', 'yaml']:
-        data = _parse_yaml(text, path)
-    else:
-        log.warning("Unrecognized file extension (.%s), assuming YAML", ext)
-        data = _parse_yaml(text, path)
+    with metrics.Timer('parse', path=path):
+        if ext in ['json']:
+            data = _parse_json(text, path)
+        elif ext in ['yml', 'yaml']:
+            data = _parse_yaml(text, path)
+        else:
+            log.warning("Unrecognized file extension (.%s), assuming YAML",
+                        ext)
+            data = _parse_yaml(text, path)
 
     if not isinstance(data, dict):
         msg = "Invalid file contents: {}".format(path)
@@ -111,6 +388,8 @@ def parse(text, path):
 
 
 def _parse_json(text, path):
+    import simplejson as json  # imported on first use to speed up imports
+
     try:
         return json.loads(text) or {}
     except json.JSONDecodeError:
@@ -137,17 +416,151 @@ def dump(data, path):
     """
     ext = _get_ext(path)
 
-    if ext in ['json']:
-        return json.dumps(data, indent=4, sort_keys=True)
+    with metrics.Timer('dump', path=path):
+        if ext in ['json']:
+            import simplejson as json  # imported on first use
+
+            return json.dumps(data, indent=4, sort_keys=True)
 
-    if ext not in ['yml', 'yaml']:
-        log.warning("Unrecognized file extension (.%s), assuming YAML", ext)
+        if ext not in ['yml', 'yaml']:
+            log.warning("Unrecognized file extension (.%s), assuming YAML",
+                        ext)
 
+        return _dump_yaml(data)
+
+
+def _dump_yaml(data):
     return yaml.dump(data, default_flow_style=False, allow_unicode=True)
 
 
+def patch(data, path, text, previous):
+    """Update only the changed top-level keys of formatted YAML text.
+
+    :param data: dictionary of data to format
+    :param path: file path to specify formatting
+    :param text: string previously parsed or dumped for the file
+    :param previous: dictionary of data represented by that text
+
+    :return: updated string and the index of its first change, or
+             None when the whole document must be dumped
+
+    """
+    if _get_ext(path) not in ['yml', 'yaml'] or list(data) != list(previous):
+        return None
+
+    spans = outline(text, data)
+    if spans is None:
+        log.trace("Unable to locate keys in '{}'".format(path))
+        return None
+
+    with metrics.Timer('dump', path=path):
+        chunks = []
+        start = offset = 0
+        changed = False
+        for name, (first, last) in zip(data, spans):
+            if _same(data[name], previous[name]):
+                continue
+            log.trace("Replacing key '{}' in '{}'".format(name, path))
+            chunks.append(text[offset:first])
+            fragment = _dump_yaml({name: data[name]})
+            if not changed:
+                start = first + _common_prefix(fragment, text[first:last])
+                changed = True
+            chunks.append(fragment)
+            offset = last
+        chunks.append(text[offset:])
+
+    if not changed:
+        start = len(text)
+    return ''.join(chunks), start
+
+
+def outline(text, keys):
+    """Locate the text spanned by each top-level key of a YAML document.
+
+    :param text: string of block-style YAML
+    :param keys: expected top-level keys in order
+
+    :return: list of (start, end) indices for each key, or None
+
+    """
+    matches = list(YAML_KEY.finditer(text))
+    if len(matches) != len(keys):
+        return None
+
+    ends = [match.start() for match in matches[1:]] + [len(text)]
+
+    spans = []
+    for match, end, key in zip(matches, ends, keys):
+        if match.group(1).strip('\'"') != str(key):
+            return None
+        spans.append((match.start(), end))
+    return spans
+
+
+def _common_prefix(text, other):
+    """Get the length of the common prefix of two strings."""
+    return len(os.path.commonprefix([text, other]))
+
+
+def _same(value, other):
+    """Determine if two parsed values are equal, including their types."""
+    if value is other:
+        return True
+    if isinstance(value, dict) and isinstance(other, dict):
+        return value.keys() == other.keys() and \
+            all(_same(item, other[key]) for key, item in value.items())
+    if isinstance(value, list) and isinstance(other, list):
+        return len(value) == len(other) and all(map(_same, value, other))
+    return type(value) is type(other) and value == other
+
+
 def _get_ext(path):
     if '.' in path:
         return path.split('.')[-1].lower()
     else:
         return 'yml'
+
+
+@contextlib.contextmanager
+def _temporary(path):
+    """Write a uniquely named file that then replaces a path."""
+    dirpath, filename = os.path.split(path)
+    fd, temp = tempfile.mkstemp(prefix=filename + '.', suffix='.tmp',
+                                dir=dirpath or None)
+    try:
+        with os.fdopen(fd, 'wb') as stream:
+            yield stream
+        os.replace(temp, path)
+    except BaseException:
+        if os.path.exists(temp):
+            os.remove(temp)
+        raise
+
+
+def _encode(text):
+    """Store the contents of a binary file as JSON."""
+    if isinstance(text, bytes):
+        return {'base64': base64.b64encode(text).decode('ascii')}
+    return text
+
+
+def _decode(text):
+    """Restore the contents of a file stored by `_encode`."""
+    if isinstance(text, dict):
+        return base64.b64decode(text['base64'])
+    return text
+
+
+def _sync_directory(dirpath):
+    """Flush a directory's entries to disk where the platform allows it."""
+    try:
+        fd = os.open(dirpath, os.O_RDONLY)
+    except OSError:  # pragma: no cover (Windows)
+        return
+    try:
+        os.fsync(fd)
+    except OSError:  # pragma: no cover (unsupported file system)
+        pass
+    finally:
+        os.close(fd)
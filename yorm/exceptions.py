@@ -21,5 +21,9 @@ class DeletedFileError(Error, FileNotFoundError):
     """An object's file was deleted."""
 
 
+class ConflictError(Error):
+    """An object's file was changed by others since it was loaded."""
+
+
 class FileContentError(Error, yaml.error.YAMLError, ValueError):
     """Text could not be parsed as valid YAML."""
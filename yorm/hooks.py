@@ -0,0 +1,68 @@
+"""Callbacks invoked around mapping and file activity."""
+
+import logging
+
+log = logging.getLogger(__name__)
+
+
+# CONSTANTS ###################################################################
+
+ACTIONS = ('load', 'save', 'read', 'write', 'parse', 'dump')
+EVENTS = tuple(when + '_' + action
+               for action in ACTIONS for when in ('before', 'after'))
+EVENTS += ('conflict',)
+
+
+# GLOBALS #####################################################################
+
+callbacks = {}  # registered callbacks keyed by event name (only when present)
+
+
+# FUNCTIONS ###################################################################
+
+
+def on(event, callback=None):
+    """Register a callback to be called for an event.
+
+    Callbacks receive the event name and keyword arguments describing it:
+
+    * `path` - the file involved
+    * `obj` - the mapped object (`load` and `save` only)
+    * `seconds` - duration of the activity (`after_*` only)
+    * `size` - number of bytes read or written (`after_read`/`after_write`)
+
+    The 'conflict' event is called with the `path` and `obj` when a file
+    changed since it was loaded.
+
+    :param event: name of the event, e.g. 'before_save' or 'after_write'
+    :param callback: function to call, or omit to use as a decorator
+
+    """
+    if event not in EVENTS:
+        raise ValueError("Unknown event: {}".format(event))
+
+    def decorator(function):
+        log.debug("Registering %r for %s", function, event)
+        callbacks.setdefault(event, []).append(function)
+        return function
+
+    if callback is None:
+        return decorator
+    return decorator(callback)
+
+
+def off(event, callback=None):
+    """Unregister one or all callbacks for an event."""
+    if callback is None:
+        callbacks.pop(event, None)
+    else:
+        registered = callbacks.get(event, [])
+        registered.remove(callback)
+        if not registered:
+            callbacks.pop(event, None)
+
+
+def emit(event, **info):
+    """Call the callbacks registered for an event."""
+    for callback in callbacks.get(event, ()):
+        callback(event, **info)
@@ -0,0 +1,124 @@
+"""Shared copies of equal values loaded by many objects."""
+
+import sys
+import threading
+from collections import OrderedDict
+
+from . import settings
+
+
+# GLOBALS #####################################################################
+
+_lock = threading.Lock()
+_shared = OrderedDict()  # canonical value keyed by its contents (LRU order)
+_canonical = {}  # canonical value keyed by its ID
+_totals = {'hits': 0}
+
+
+# FUNCTIONS ###################################################################
+
+
+def string(value):
+    """Get the interned copy of a string when enabled.
+
+    :param value: converted string value
+
+    """
+    if settings.intern_strings and type(value) is str:  # pylint: disable=unidiomatic-typecheck
+        return sys.intern(value)
+    return value
+
+
+def share(value):
+    """Get an equal copy of untyped data already loaded by another object.
+
+    Nested dictionaries and lists are shared recursively, so equal subtrees
+    of otherwise different values are also stored once. Shared values must
+    be treated as immutable: assign a new value rather than editing one.
+
+    Shared values are kept alive until more than `max_shared_values` are
+    stored, after which the least recently used ones are forgotten.
+
+    :param value: parsed data without a specific converter
+
+    """
+    if not settings.share_values:
+        return value
+    with _lock:
+        return _share(value)
+
+
+def stats():
+    """Get the number of shared values and how often they were reused.
+
+    :return: dictionary of counts
+
+    """
+    with _lock:
+        return OrderedDict([
+            ('values', len(_shared)),
+            ('hits', _totals['hits']),
+        ])
+
+
+def reset():
+    """Forget all shared values and clear the counts."""
+    with _lock:
+        _shared.clear()
+        _canonical.clear()
+        _totals.update(hits=0)
+
+
+def _share(value):
+    kind = type(value)
+
+    if kind is str:
+        return sys.intern(value)
+
+    if kind is dict:
+        items = [(_share(k), _share(v)) for k, v in value.items()]
+    elif kind is list:
+        items = [_share(v) for v in value]
+    else:
+        return value
+
+    try:
+        if kind is dict:
+            key = kind, tuple((k, _identify(v)) for k, v in items)
+        else:
+            key = kind, tuple(_identify(v) for v in items)
+        shared = _shared.get(key)
+    except TypeError:
+        return value  # contains data that cannot be compared
+
+    if shared is None:
+        if kind is dict:
+            value.clear()
+            value.update(items)
+        else:
+            value[:] = items
+        _shared[key] = _canonical[id(value)] = shared = value
+        _trim()
+    else:
+        _shared.move_to_end(key)
+        _totals['hits'] += 1
+
+    return shared
+
+
+def _trim():
+    """Forget the least recently used values above the limit."""
+    limit = settings.max_shared_values
+    while limit is not None and len(_shared) > limit:
+        _, value = _shared.popitem(last=False)
+        _canonical.pop(id(value), None)
+
+
+def _identify(value):
+    """Get a hashable identity for a value that is already shared."""
+    kind = type(value)
+    if kind is dict or kind is list:
+        if _canonical.get(id(value)) is not value:
+            raise TypeError("unshared value: {!r}".format(value))
+        return id(value)
+    return kind, value
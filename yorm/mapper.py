@@ -1,14 +1,24 @@
 """Core object-file mapping functionality."""
 
+import os
+import copy
+import hashlib
 import functools
+import contextlib
+import threading
+import weakref
 from pprint import pformat
 import logging
 
-from . import common, diskutils, exceptions, types, settings
+from . import common, diskutils, exceptions, metrics, types, settings
+from . import cache, conflicts, hooks, scheduler, transactions, watchers
 from .bases import Container
 
 log = logging.getLogger(__name__)
 
+_scheduling = threading.Lock()  # guards the deadlines of delayed saves
+_tracking = threading.Lock()  # guards the threads active in each mapper
+
 
 def file_required(method):
     """Decorate methods that require the file to exist."""
@@ -32,16 +42,67 @@ def prevent_recursion(method):
     @functools.wraps(method)
     def wrapped(self, *args, **kwargs):
         # pylint: disable=protected-access
-        if self._activity:
-            return None
-        self._activity = True
-        result = method(self, *args, **kwargs)
-        self._activity = False
-        return result
+        thread = threading.get_ident()
+        with _tracking:
+            threads = self._activity or ()
+            if thread in threads:
+                return None
+            self._activity = threads + (thread,)
+        try:
+            return method(self, *args, **kwargs)
+        finally:
+            with _tracking:
+                threads = tuple(t for t in self._activity if t != thread)
+                self._activity = threads or None
+
+    return wrapped
+
+
+def synchronized(method):
+    """Decorate methods to hold the mapper's lock in thread-safe mode."""
+
+    @functools.wraps(method)
+    def wrapped(self, *args, **kwargs):
+        # pylint: disable=protected-access
+        if self._mutex is None:
+            return method(self, *args, **kwargs)
+        with self._mutex:
+            return method(self, *args, **kwargs)
 
     return wrapped
 
 
+def locked(shared=False):
+    """Decorate methods to lock the file when locking is enabled."""
+
+    def decorator(method):
+
+        @functools.wraps(method)
+        def wrapped(self, *args, **kwargs):
+            if not self.locking:
+                return method(self, *args, **kwargs)
+            with self.lock(shared=shared):
+                return method(self, *args, **kwargs)
+
+        return wrapped
+
+    return decorator
+
+
+def option(name):
+    """Create a property for a setting shared between mappers."""
+
+    # pylint: disable=protected-access
+
+    def fget(self):
+        return getattr(self._options, name)
+
+    def fset(self, value):
+        self._options = self._options.replace(**{name: value})
+
+    return property(fget, fset, doc="Shared setting: {}".format(name))
+
+
 def prefix(obj):
     """Prefix a string with a fake designator if enabled."""
     fake = "(fake) " if settings.fake else ""
@@ -49,6 +110,46 @@ def prefix(obj):
     return fake + name
 
 
+def _checksum(array):
+    """Get a digest of an array's contents to detect in-place changes."""
+    if array.dtype.hasobject:
+        return None  # contents are references to other objects
+    data = array.data if array.flags.c_contiguous else array.tobytes()
+    return array.dtype.str, array.shape, hashlib.sha1(data).digest()
+
+
+class Options:
+    """Settings shared between all mappers with identical values."""
+
+    NAMES = ('attrs', 'auto_create', 'auto_save', 'auto_track', 'auto_resolve',
+             'lazy', 'partial', 'locking', 'on_conflict', 'thread_safe',
+             'identity', 'auto_save_delay', 'auto_save_max_delay')
+
+    __slots__ = NAMES + ('__weakref__',)
+
+    _cache = weakref.WeakValueDictionary()
+
+    @classmethod
+    def get(cls, **values):
+        """Get the shared instance for a combination of settings."""
+        key = tuple(id(values[name]) if name == 'attrs' else values[name]
+                    for name in cls.NAMES)
+        try:
+            return cls._cache[key]
+        except KeyError:
+            options = object.__new__(cls)
+            for name in cls.NAMES:
+                setattr(options, name, values[name])
+            cls._cache[key] = options
+            return options
+
+    def replace(self, **changes):
+        """Get the shared instance with some settings changed."""
+        values = {name: getattr(self, name) for name in self.NAMES}
+        values.update(changes)
+        return self.get(**values)
+
+
 class Mapper:
     """Utility class to map an object's attributes to a file.
 
@@ -70,24 +171,72 @@ class Mapper:
 
     """
 
+    __slots__ = ('_obj', 'path', '_options',
+                 'exists', 'deleted', 'auto_save_after_load', 'pending',
+                 '_activity', '_timestamp', '_fake', '_arrays', '_snapshot',
+                 '_journals', '_written', '_locked', '_base', '_mutex',
+                 '_evicted', '_deadline', '_expiry', '_bulk', '_dirty',
+                 '__weakref__')
+
+    attrs = option('attrs')
+    auto_create = option('auto_create')
+    auto_save = option('auto_save')
+    auto_track = option('auto_track')
+    auto_resolve = option('auto_resolve')
+    lazy = option('lazy')
+    partial = option('partial')
+    locking = option('locking')
+    on_conflict = option('on_conflict')
+    thread_safe = option('thread_safe')
+    identity = option('identity')
+    auto_save_delay = option('auto_save_delay')
+    auto_save_max_delay = option('auto_save_max_delay')
+
     def __init__(self, obj, path, attrs, *,
                  auto_create=True, auto_save=True,
-                 auto_track=False, auto_resolve=False):
+                 auto_track=False, auto_resolve=False,
+                 lazy=False, partial=False, locking=False,
+                 on_conflict=None, thread_safe=False, identity=False,
+                 auto_save_delay=None, auto_save_max_delay=None):
+        if on_conflict is not None:
+            conflicts.get_resolver(on_conflict)  # fail early on unknown names
+
         self._obj = obj
         self.path = path
-        self.attrs = attrs
-        self.auto_create = auto_create
-        self.auto_save = auto_save
-        self.auto_track = auto_track
-        self.auto_resolve = auto_resolve
+        self._options = Options.get(attrs=attrs,
+                                    auto_create=auto_create,
+                                    auto_save=auto_save,
+                                    auto_track=auto_track,
+                                    auto_resolve=auto_resolve,
+                                    lazy=lazy,
+                                    partial=partial,
+                                    locking=locking,
+                                    on_conflict=on_conflict,
+                                    thread_safe=thread_safe,
+                                    identity=identity,
+                                    auto_save_delay=auto_save_delay,
+                                    auto_save_max_delay=auto_save_max_delay)
 
         self.exists = diskutils.exists(self.path)
         self.deleted = False
         self.auto_save_after_load = False
+        self.pending = None
 
-        self._activity = False
+        self._activity = None
         self._timestamp = 0
         self._fake = ""
+        self._arrays = None
+        self._snapshot = None
+        self._journals = None
+        self._written = None
+        self._locked = None
+        self._base = None
+        self._mutex = threading.RLock() if thread_safe else None
+        self._evicted = False
+        self._deadline = None
+        self._expiry = None
+        self._bulk = 0
+        self._dirty = False
 
     def __str__(self):
         return str(self.path)
@@ -104,10 +253,14 @@ class Mapper:
             return changes
         elif not self.exists:
             return True
+        elif settings.metrics:  # checked here as this runs on every access
+            with metrics.Scope(self):
+                with metrics.Timer('modified', path=self.path):
+                    return self._timestamp != self._stamp()
         else:
             # TODO: this raises an exception is the file is missing
             was = self._timestamp
-            now = diskutils.stamp(self.path)
+            now = self._stamp()
             return was != now
 
     @modified.setter
@@ -121,10 +274,11 @@ class Mapper:
             if settings.fake or self.path is None:
                 self._timestamp = None
             else:
-                self._timestamp = diskutils.stamp(self.path)
+                self._timestamp = self._stamp()
             log.debug("Marked %s as unmodified", prefix(self))
 
     @property
+    @metrics.scoped()
     def text(self):
         """Get file contents as a string."""
         log.info("Getting contents of %s...", prefix(self))
@@ -136,6 +290,7 @@ class Mapper:
         return text
 
     @text.setter
+    @metrics.scoped()
     def text(self, text):
         """Set file contents from a string."""
         log.info("Setting contents of %s...", prefix(self))
@@ -145,10 +300,12 @@ class Mapper:
             self._write(text)
         log.trace("Text wrote: \n%s", text.rstrip())
         self.modified = True
+        self._base = None
 
     @property
     def data(self):
         """Get the file values as a dictionary."""
+        signature = self._signature() if self.on_conflict else None
         text = self._read()
         try:
             data = diskutils.parse(text, self.path)
@@ -162,14 +319,41 @@ class Mapper:
             return {}
 
         log.trace("Parsed data: \n%s", pformat(data))
+        if self.partial or self.on_conflict:
+            original = copy.deepcopy(data)  # untyped values are shared
+            if self.partial:
+                self._snapshot = text, original, None
+            if self.on_conflict:
+                self._base = signature, hash(text), original
+        cache.touch(self, size=len(text))
         return data
 
     @data.setter
     def data(self, data):
         """Set the file values from a dictionary."""
-        text = diskutils.dump(data, self.path)
-        self._write(text)
-
+        patched = None
+        if self._snapshot:
+            text, previous, timestamp = self._snapshot
+            patched = diskutils.patch(data, self.path, text, previous)
+
+        if patched:
+            text, start = patched
+            if timestamp is None or timestamp != self._stamp_file():
+                start = 0  # the file may differ from the text
+        else:
+            text = diskutils.dump(data, self.path)
+            start = 0
+        self._write(text, start=start)
+
+        if self.partial or self.on_conflict:
+            original = copy.deepcopy(data)  # untyped values are shared
+            if self.partial:
+                self._snapshot = text, original, self._stamp_file()
+            if self.on_conflict:
+                self._base = self._signature(), hash(text), original
+        watchers.written(self, data)
+
+    @synchronized
     def create(self):
         """Create a new file for the object."""
         log.info("Creating %s for %r...", prefix(self), self._obj)
@@ -182,14 +366,34 @@ class Mapper:
         self.deleted = False
 
     @file_required
+    @synchronized
     @prevent_recursion
-    def load(self):
-        """Update the object's mapped attributes from its file."""
+    @metrics.scoped('load')
+    def load(self, *, merge=False):
+        """Update the object's mapped attributes from its file.
+
+        :param merge: keep unsaved changes by resolving them with changes
+                      made to the file (requires `on_conflict`)
+
+        """
         log.info("Loading %r from %s...", self._obj, prefix(self))
+        self._load(merge=merge)
+
+    def _load(self, *, merge=False):
+        """Update all attributes from the file without recursion checks."""
+        if self._evicted:
+            log.debug("Restoring evicted attributes of %s", prefix(self))
+            cache.restored()
+            self._evicted = False
 
         # Update all attributes
         attrs2 = self.attrs.copy()
-        for name, data in self.data.items():
+        pending = {}
+        base = self._base
+        parsed = self.data
+        if merge and base and not self.auto_save:
+            parsed = self._keep_unsaved(base[2], parsed)
+        for name, data in parsed.items():
             attrs2.pop(name, None)
 
             # Find a matching converter
@@ -204,17 +408,19 @@ class Mapper:
                     log.warning(msg, name, data)
                     continue
 
-            # Convert the parsed value to the attribute's final type
-            attr = getattr(self._obj, name, None)
-            if isinstance(attr, converter) and \
-                    issubclass(converter, Container):
-                attr.update_value(data, auto_track=self.auto_track)
-            else:
-                log.trace("Converting attribute %r using %r", name, converter)
-                attr = converter.to_value(data)
-                setattr(self._obj, name, attr)
-            self._remap(attr, self)
-            log.trace("Value loaded: %s = %r", name, attr)
+            # Replay items appended to the attribute's journal
+            if issubclass(converter, types.JournaledList) and \
+                    not settings.fake:
+                self._load_journal(name, converter, data)
+                continue
+
+            # Defer conversion until the attribute is accessed
+            if self.lazy:
+                log.trace("Deferring attribute conversion: %s", name)
+                pending[name] = data
+                continue
+
+            self._load_attribute(name, converter, data)
 
         # Add missing attributes
         for name, converter in attrs2.items():
@@ -240,8 +446,42 @@ class Mapper:
                     pass  # TODO: Figure out when this case occurs
 
         # Set meta attributes
+        self.pending = pending or None
+        if self._journals:
+            self._written = parsed, self._stamp_file()
         self.modified = False
 
+    @synchronized
+    @prevent_recursion
+    def materialize(self, name=None):
+        """Convert the pending file data of an attribute (or all) on access."""
+        names = list(self.pending or ()) if name is None else [name]
+        for name2 in names:
+            try:
+                data = self.pending.pop(name2)
+            except (AttributeError, KeyError):
+                continue
+            if not self.pending:
+                self.pending = None
+            self._load_attribute(name2, self.attrs[name2], data)
+
+    def _load_attribute(self, name, converter, data):
+        """Convert the parsed value to the attribute's final type."""
+        attr = getattr(self._obj, name, None)
+        if issubclass(converter, types.Array) and isinstance(data, str):
+            attr = self._load_array(name, data)
+            setattr(self._obj, name, attr)
+        elif isinstance(attr, converter) and \
+                issubclass(converter, Container):
+            attr.update_value(data, auto_track=self.auto_track)
+        else:
+            log.trace("Converting attribute %r using %r", name, converter)
+            attr = converter.to_value(data)
+            setattr(self._obj, name, attr)
+        self._remap(attr, self)
+        log.trace("Value loaded: %s = %r", name, attr)
+        return attr
+
     def _remap(self, obj, root):
         """Attach mapper on nested attributes."""
         if isinstance(obj, Container):
@@ -250,20 +490,41 @@ class Mapper:
             if isinstance(obj, dict):
                 for obj2 in obj.values():
                     self._remap(obj2, root)
-            else:
-                assert isinstance(obj, list)
+            elif isinstance(obj, list):
                 for obj2 in obj:
                     self._remap(obj2, root)
 
     @file_required
+    @locked()
+    @synchronized
     @prevent_recursion
+    @metrics.scoped('save')
     def save(self):
         """Format and save the object's mapped attributes to its file."""
         log.info("Saving %r to %s...", self._obj, prefix(self))
+        with _scheduling:
+            waiting = self._deadline is not None
+            self._deadline = self._expiry = None
+        if waiting:
+            scheduler.release(self)
+        self._dirty = False
+
+        # Restore attributes dropped from memory, keeping new values
+        if self._evicted:
+            values = object.__getattribute__(self._obj, '__dict__')
+            changes = {name: values[name] for name in self.attrs
+                       if name in values}
+            self._load()
+            values.update(changes)
 
         # Format the data items
         data = self.attrs.__class__()
+        journals = {}
         for name, converter in self.attrs.items():
+            if self.pending and name in self.pending:
+                data[name] = self.pending[name]
+                log.trace("Data not yet accessed: %s", name)
+                continue
             try:
                 value = getattr(self._obj, name)
             except AttributeError:
@@ -271,42 +532,434 @@ class Mapper:
                 msg = "Default data for missing object attribute: %s = %r"
                 log.warning(msg, name, data2)
             else:
-                data2 = converter.to_data(value)
+                if issubclass(converter, types.Array):
+                    data2 = self._save_array(name, value)
+                elif issubclass(converter, types.JournaledList) and \
+                        not settings.fake:
+                    data2, journals[name] = self._save_journal(
+                        name, converter, value)
+                else:
+                    data2 = converter.to_data(value)
 
             log.trace("Data to save: %s = %r", name, data2)
             data[name] = data2
 
+        # Skip rewriting the file when only journals changed
+        if journals and not any(journals.values()) and \
+                self._written and self._written == (data, self._stamp_file()):
+            log.debug("Only journals changed for %s", prefix(self))
+            self.modified = False
+            self.auto_save_after_load = self.auto_save
+            return
+
+        # Resolve changes made to the file by others
+        if self._base:
+            data = self._resolve(data)
+
         # Save the formatted to disk
         self.data = data
 
+        # Remove journals compacted into the file
+        transaction = transactions.get_transaction()
+        for name, compacted in journals.items():
+            if compacted:
+                converter = self.attrs[name]
+                path = self._sidecar(name, converter.EXTENSION)
+                if transaction:
+                    transaction.stage(self, None, path)
+                else:
+                    diskutils.delete(path)
+        if journals:
+            self._written = data, self._stamp_file()
+
         # Set meta attributes
         self.modified = True
         self.auto_save_after_load = self.auto_save
 
+    def autosave(self):
+        """Save changes now or, with a delay, once changes stop."""
+        if threading.get_ident() in (self._activity or ()):
+            return  # attributes are being set while loading or saving
+        if self._bulk:
+            self._dirty = True
+            return
+        delay = self.auto_save_delay
+        if not delay or transactions.get_transaction():
+            self.save()  # the scheduler thread is outside the transaction
+            return
+        if self._mutex is None:
+            self._mutex = threading.RLock()  # saved from another thread
+
+        now = scheduler.now()
+        with _scheduling:
+            waiting = self._deadline is not None
+            if not waiting and self.auto_save_max_delay is not None:
+                self._expiry = now + self.auto_save_max_delay
+            self._deadline = now + delay
+            if self._expiry is not None:
+                self._deadline = min(self._deadline, self._expiry)
+            due = self._deadline
+
+        if not waiting:
+            log.debug("Delaying save of %s", prefix(self))
+            scheduler.schedule(self, due)
+
+    def flush_due(self):
+        """Save delayed changes if the object stopped changing."""
+        with _scheduling:
+            due = self._deadline
+        if due is None:
+            return
+        if due > scheduler.now():
+            scheduler.schedule(self, due)  # changed again since scheduled
+        else:
+            self.flush()
+
+    def cancel(self):
+        """Stop waiting to save changes delayed by the auto save delay."""
+        with _scheduling:
+            scheduled = self._deadline is not None
+            self._deadline = self._expiry = None
+        if scheduled:
+            scheduler.release(self)
+
+    def flush(self):
+        """Save changes waiting for the auto save delay or a bulk change."""
+        with _scheduling:
+            scheduled = self._deadline is not None
+            self._deadline = self._expiry = None
+        if scheduled:
+            scheduler.release(self)
+        if (scheduled or self._dirty) and not self.deleted:
+            self.save()
+
+    @contextlib.contextmanager
+    def bulk(self):
+        """Combine the automatic saves of changes into one when finished."""
+        self._bulk += 1
+        try:
+            yield
+        finally:
+            self._bulk -= 1
+            if not self._bulk and self._dirty:
+                log.debug("Saving bulk changes to %s", prefix(self))
+                self.autosave()
+
+    @contextlib.contextmanager
+    def lock(self, shared=False):
+        """Hold an advisory lock on the file unless this thread holds one."""
+        if self._mutex:
+            self._mutex.acquire()
+        thread = threading.get_ident()
+        try:
+            if thread in (self._locked or ()) or settings.fake:
+                yield
+            else:
+                with diskutils.lock(self.path, shared=shared):
+                    with _tracking:
+                        self._locked = (self._locked or ()) + (thread,)
+                    try:
+                        yield
+                    finally:
+                        with _tracking:
+                            threads = tuple(t for t in self._locked
+                                            if t != thread)
+                            self._locked = threads or None
+        finally:
+            if self._mutex:
+                self._mutex.release()
+
+    def evict(self):
+        """Drop converted attribute values until the object is next used.
+
+        :return: indication that the values were dropped
+
+        """
+        if not self._evictable():
+            return False
+        if self._mutex and not self._mutex.acquire(blocking=False):
+            return False
+        try:
+            try:
+                values = object.__getattribute__(self._obj, '__dict__')
+            except AttributeError:
+                return False
+            log.debug("Evicting attributes of %s", prefix(self))
+            for name in self.attrs:
+                values.pop(name, None)
+            self.pending = None
+            self.auto_save_after_load = False
+            self._arrays = None
+            self._snapshot = None
+            self._journals = None
+            self._written = None
+            self._base = None
+            self._evicted = True
+            self.modified = True
+            return True
+        finally:
+            if self._mutex:
+                self._mutex.release()
+
+    def _evictable(self):
+        """Determine if attribute values can be dropped without losing data."""
+        if self._activity or self._locked or self._evicted:
+            return False  # in use or already dropped
+        if self._deadline is not None or self._bulk or self._dirty:
+            return False  # changes are waiting to be saved
+        return self.auto_save and not (self.deleted or self.missing)
+
+    @synchronized
     def delete(self):
         """Delete the object's file from the file system."""
         if self.exists:
             log.info("Deleting %s...", prefix(self))
             diskutils.delete(self.path)
+            for name, converter in self.attrs.items():
+                if issubclass(converter, (types.Array, types.JournaledList)):
+                    diskutils.delete(self._sidecar(name, converter.EXTENSION))
+            diskutils.delete(self.path + diskutils.LOCK_EXTENSION)
+            self._arrays = None
+            self._journals = None
         else:
             log.warning("Already deleted: %s", self)
         self.exists = False
         self.deleted = True
+        with _scheduling:
+            waiting = self._deadline is not None
+            self._deadline = self._expiry = None
+        if waiting:
+            scheduler.release(self)
+        cache.discard(id(self))
+        watchers.written(self, {})
+        if self.identity:
+            common.del_identity(self.path, self._obj)
+
+    def _sidecar(self, name, extension=types.Array.EXTENSION):
+        """Get the path of the file storing an attribute's array or journal."""
+        root = os.path.splitext(self.path)[0]
+        return root + '.' + name + extension
+
+    def _load_array(self, name, filename):
+        """Get an attribute's array from its sidecar file."""
+        path = os.path.join(os.path.dirname(self.path), filename)
+        array, timestamp, _ = (self._arrays or {}).get(name, (None,) * 3)
+
+        transaction = transactions.get_transaction()
+        if transaction and path in transaction.files:
+            return array  # staged to replace the file
+        if settings.fake or not diskutils.exists(path):
+            if array is None:
+                log.warning("Missing array file: %s", path)
+            return array
+
+        if timestamp != diskutils.stamp(path):
+            log.trace("Loading array %r from %s", name, path)
+            array = diskutils.read_array(path)
+            self._arrays = self._arrays or {}
+            self._arrays[name] = array, diskutils.stamp(path), None
+
+        return array
+
+    def _save_array(self, name, array):
+        """Write an attribute's array to its sidecar file."""
+        path = self._sidecar(name)
+        transaction = transactions.get_transaction()
+
+        if array is None:
+            if transaction:
+                transaction.stage(self, None, path)
+            elif not settings.fake:
+                diskutils.delete(path)
+            if self._arrays:
+                self._arrays.pop(name, None)
+            return None
+
+        cached, _, checksum = (self._arrays or {}).get(name, (None,) * 3)
+        if cached is array and not array.flags.writeable:
+            return os.path.basename(path)  # unchanged memory-mapped file
+
+        array = types.Array.to_value(array)
+        if cached is not array or checksum is None or \
+                checksum != _checksum(array):
+            log.trace("Saving array %r to %s", name, path)
+            if settings.fake:
+                timestamp = None
+            elif transaction:
+                transaction.stage(self, diskutils.dump_array(array), path)
+                timestamp = None  # reloaded from the file once committed
+            else:
+                diskutils.write_array(array, path)
+                timestamp = diskutils.stamp(path)
+            self._arrays = self._arrays or {}
+            self._arrays[name] = array, timestamp, _checksum(array)
+
+        return os.path.basename(path)
+
+    def _load_journal(self, name, converter, data):
+        """Update an attribute from its file data and journal."""
+        path = self._sidecar(name, converter.EXTENSION)
+        transaction = transactions.get_transaction()
+        if transaction and path in transaction.files:
+            records = []  # compacted into the staged file
+        elif diskutils.exists(path):
+            records = diskutils.read_records(path)
+        else:
+            records = []
+        log.trace("Replaying %s records for %r", len(records), name)
+
+        items = data if isinstance(data, list) else [data]
+        value = self._load_attribute(name, converter, items + records)
+
+        if isinstance(value, converter):
+            value._rewrite = False  # pylint: disable=protected-access
+            self._journals = self._journals or {}
+            self._journals[name] = [value, data, len(value), len(records)]
+
+    def _save_journal(self, name, converter, value):
+        """Append an attribute's new items to its journal file.
+
+        :return: data for the object's file and whether the journal
+                 must be compacted into it
+
+        """
+        state = (self._journals or {}).get(name)
+        if self._appendable(state, converter, value):
+            count = state[2]
+            if len(value) > count:
+                items = value[count:]
+                log.trace("Journaling %s items for %r", len(items), name)
+                records = [converter.item_type.to_data(i) for i in items]
+                path = self._sidecar(name, converter.EXTENSION)
+                diskutils.append_records(records, path)
+                for index, record in enumerate(records, start=count):
+                    item = converter.item_type.to_value(record)
+                    self._remap(item, self)
+                    list.__setitem__(value, index, item)
+                state[2] = len(value)
+                state[3] += len(records)
+            return state[1], False
+
+        log.trace("Compacting journal for %r", name)
+        data = converter.to_data(value)
+        if isinstance(value, converter):
+            value._rewrite = False  # pylint: disable=protected-access
+            self._journals = self._journals or {}
+            self._journals[name] = [value, data, len(value), 0]
+        return data, True
+
+    @staticmethod
+    def _appendable(state, converter, value):
+        """Determine if a list's changes can be appended to its journal."""
+        if not state or state[0] is not value or \
+                getattr(value, '_rewrite', True):
+            return False
+        if transactions.get_transaction():
+            return False  # appending would bypass the staged files
+        count = state[3] + len(value) - state[2]
+        return state[2] <= len(value) and count <= converter.THRESHOLD
+
+    def _resolve(self, data):
+        """Combine data to save with changes made since the file was read."""
+        signature, checksum, base = self._base
+        if self._signature() == signature:
+            return data
+        text = self._read()
+        if hash(text) == checksum:
+            return data
+
+        theirs = diskutils.parse(text, self.path)
+        return self._merge(base, data, theirs)
+
+    def _keep_unsaved(self, base, theirs):
+        """Combine unsaved attribute changes with data read from the file."""
+        ours = self.attrs.__class__()
+        for name, converter in self.attrs.items():
+            if self.pending and name in self.pending:
+                ours[name] = self.pending[name]
+            elif issubclass(converter, (types.Array, types.JournaledList)):
+                if name in base:
+                    ours[name] = base[name]  # saved separately
+            else:
+                try:
+                    value = getattr(self._obj, name)
+                except AttributeError:
+                    continue
+                ours[name] = converter.to_data(value)
+
+        if ours == base:
+            return theirs
+        log.debug("Unsaved changes to %s", prefix(self))
+        if theirs == base:
+            return ours
+        return self._merge(base, ours, theirs)
+
+    def _merge(self, base, ours, theirs):
+        """Resolve our changes with changes made to the file by others."""
+        log.warning("File changed since it was loaded: %s", prefix(self))
+        if settings.metrics:
+            metrics.record('conflict')
+        hooks.emit('conflict', path=self.path, obj=self._obj)
+
+        resolver = conflicts.get_resolver(self.on_conflict)
+        try:
+            return resolver(base, ours, theirs)
+        except exceptions.ConflictError as e:
+            msg = "{}: {}".format(self.path, e)
+            raise exceptions.ConflictError(msg) from None
+
+    def _signature(self):
+        """Get the signature of the file if it exists."""
+        if settings.fake or not diskutils.exists(self.path):
+            return None
+        return diskutils.signature(self.path)
+
+    def _stamp_file(self):
+        """Get the modification timestamp of the file if it exists."""
+        if settings.fake or not diskutils.exists(self.path):
+            return None
+        return diskutils.stamp(self.path)
+
+    def _stamp(self):
+        """Get the modification timestamps of the file and its sidecars."""
+        timestamp = diskutils.stamp(self.path)
+        if not self._arrays and not self._journals:
+            return timestamp
+
+        paths = [self._sidecar(name) for name in sorted(self._arrays or {})]
+        paths += [self._sidecar(name, types.JournaledList.EXTENSION)
+                  for name in sorted(self._journals or {})]
+
+        timestamps = [timestamp]
+        for path in paths:
+            if diskutils.exists(path):
+                timestamps.append(diskutils.stamp(path))
+            else:
+                timestamps.append(None)
+        return tuple(timestamps)
 
     @file_required
+    @locked(shared=True)
     def _read(self):
         """Read text from the object's file."""
         if settings.fake:
             return self._fake
+        transaction = transactions.get_transaction()
+        if transaction and self.path in transaction.files:
+            return transaction.files[self.path]
         elif not self.exists:
             return ""
         else:
             return diskutils.read(self.path)
 
     @file_required
-    def _write(self, text):
+    def _write(self, text, *, start=0):
         """Write text to the object's file."""
         if settings.fake:
             self._fake = text
+            return
+        transaction = transactions.get_transaction()
+        if transaction:
+            transaction.stage(self, text)
         else:
-            diskutils.write(text, self.path)
+            diskutils.write(text, self.path, start=start)
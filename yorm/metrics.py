@@ -0,0 +1,192 @@
+"""Counters and timings of file and conversion activity."""
+
+import time
+import threading
+import functools
+from collections import defaultdict, OrderedDict
+
+from . import common, hooks, settings
+
+
+# CONSTANTS ###################################################################
+
+BOUNDS = (0.001, 0.01, 0.1, 1.0, float('inf'))  # histogram buckets (seconds)
+
+
+# GLOBALS #####################################################################
+
+_lock = threading.Lock()
+_local = threading.local()
+
+_totals = OrderedDict()
+_groups = {
+    'class': defaultdict(OrderedDict),
+    'path': defaultdict(OrderedDict),
+}
+
+
+# CLASSES #####################################################################
+
+
+class Metric:
+    """Count, total time, total size, and timing histogram of an event."""
+
+    __slots__ = ('count', 'seconds', 'size', 'histogram')
+
+    def __init__(self):
+        self.count = 0
+        self.seconds = 0.0
+        self.size = 0
+        self.histogram = [0] * len(BOUNDS)
+
+    def add(self, seconds, size):
+        self.count += 1
+        self.seconds += seconds
+        self.size += size
+        for index, bound in enumerate(BOUNDS):
+            if seconds <= bound:
+                self.histogram[index] += 1
+                break
+
+    def as_dict(self):
+        return {
+            'count': self.count,
+            'seconds': self.seconds,
+            'bytes': self.size,
+            'histogram': OrderedDict(zip(BOUNDS, self.histogram)),
+        }
+
+
+class Timer:
+    """Context manager to record an event and call its hooks."""
+
+    __slots__ = ('event', 'info', 'size', '_start')
+
+    def __init__(self, event, **info):
+        self.event = event
+        self.info = info
+        self.size = 0
+        self._start = None
+
+    def __enter__(self):
+        if settings.metrics or hooks.callbacks:
+            hooks.emit('before_' + self.event, **self.info)
+            self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, *_):
+        if self._start is not None:
+            seconds = time.perf_counter() - self._start
+            if settings.metrics:
+                record(self.event, seconds, self.size)
+            if exc_type is None:
+                hooks.emit('after_' + self.event, seconds=seconds,
+                           size=self.size, **self.info)
+
+
+class Scope:
+    """Context manager to group nested events by a mapper's class and path."""
+
+    __slots__ = ('mapper', '_previous')
+
+    def __init__(self, mapper):
+        self.mapper = mapper
+        self._previous = None
+
+    def __enter__(self):
+        obj = self.mapper._obj  # pylint: disable=protected-access
+        self._previous = getattr(_local, 'scope', {})
+        _local.scope = {'class': obj.__class__, 'path': self.mapper.path}
+        return self
+
+    def __exit__(self, *_):
+        _local.scope = self._previous
+
+
+# FUNCTIONS ###################################################################
+
+
+def record(event, seconds=0.0, size=0):
+    """Add an event to the totals and the active mapped object's groups."""
+    with _lock:
+        _get(_totals, event).add(seconds, size)
+        for group, key in getattr(_local, 'scope', {}).items():
+            _get(_groups[group][key], event).add(seconds, size)
+
+
+def scoped(event=None):
+    """Decorate mapper methods to group nested events by class and path.
+
+    Only use this on methods that also read or write files: frequent calls
+    should check `settings.metrics` inline to avoid the wrapper's overhead.
+
+    """
+
+    def decorator(method):
+
+        @functools.wraps(method)
+        def wrapped(self, *args, **kwargs):
+            if not (settings.metrics or hooks.callbacks):
+                return method(self, *args, **kwargs)
+
+            with Scope(self):
+                if event:
+                    obj = self._obj  # pylint: disable=protected-access
+                    with Timer(event, path=self.path, obj=obj):
+                        return method(self, *args, **kwargs)
+                return method(self, *args, **kwargs)
+
+        return wrapped
+
+    return decorator
+
+
+def stats(obj=None):
+    """Get metrics for all activity or a mapped class, object, or path.
+
+    :param obj: mapped class, mapped object, or file path to filter by
+
+    :return: dictionary of metrics keyed by event name
+
+    """
+    if obj is None:
+        metrics = _totals
+    elif isinstance(obj, type):
+        metrics = _groups['class'].get(obj, {})
+    elif isinstance(obj, str):
+        metrics = _groups['path'].get(obj, {})
+    else:
+        mapper = common.get_mapper(obj, expected=True)
+        metrics = _groups['path'].get(mapper.path, {})
+
+    with _lock:
+        return OrderedDict((k, v.as_dict()) for k, v in metrics.items())
+
+
+def breakdown(group='class'):
+    """Get metrics for each mapped class or path.
+
+    :param group: 'class' or 'path'
+
+    :return: dictionary of metrics dictionaries keyed by class or path
+
+    """
+    with _lock:
+        keys = list(_groups[group])
+    return OrderedDict((key, stats(key)) for key in keys)
+
+
+def reset():
+    """Clear all recorded metrics."""
+    with _lock:
+        _totals.clear()
+        for groups in _groups.values():
+            groups.clear()
+
+
+def _get(metrics, event):
+    try:
+        return metrics[event]
+    except KeyError:
+        metrics[event] = Metric()
+        return metrics[event]
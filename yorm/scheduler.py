@@ -0,0 +1,86 @@
+"""Background saving of objects after a quiet period."""
+
+import atexit
+import heapq
+import itertools
+import logging
+import threading
+import time
+import weakref
+
+log = logging.getLogger(__name__)
+
+
+# GLOBALS #####################################################################
+
+_condition = threading.Condition()
+_queue = []  # [time due, order, mapper reference] for each scheduled save
+_pending = {}  # mappers with changes to save keyed by ID (keeps them alive)
+_counter = itertools.count()
+_thread = None
+
+
+# FUNCTIONS ###################################################################
+
+
+def now():
+    """Get the current time used for scheduling."""
+    return time.monotonic()
+
+
+def schedule(mapper, due):
+    """Call a mapper's `flush_due` method on a background thread when due.
+
+    :param mapper: mapper with changes to save
+    :param due: time from `now()` to call the mapper
+
+    """
+    global _thread  # pylint: disable=global-statement
+    with _condition:
+        _pending[id(mapper)] = mapper
+        heapq.heappush(_queue, (due, next(_counter), weakref.ref(mapper)))
+        if _thread is None:
+            _thread = threading.Thread(target=_run, name="yorm-scheduler")
+            _thread.daemon = True
+            _thread.start()
+        _condition.notify()
+
+
+def release(mapper):
+    """Stop keeping a mapper alive after its changes were saved."""
+    with _condition:
+        _pending.pop(id(mapper), None)
+
+
+def flush():
+    """Save all scheduled changes immediately."""
+    with _condition:
+        mappers = list(_pending.values())
+    for mapper in mappers:
+        mapper.flush()
+
+
+def _run():
+    global _thread  # pylint: disable=global-statement
+    while True:
+        with _condition:
+            if not _queue:
+                _thread = None
+                return
+            due, _, reference = _queue[0]
+            delay = due - now()
+            if delay > 0:
+                _condition.wait(delay)
+                continue
+            heapq.heappop(_queue)
+
+        mapper = reference()
+        if mapper is None:
+            continue
+        try:
+            mapper.flush_due()
+        except Exception:  # pylint: disable=broad-except
+            log.exception("Failed to save %s", mapper)
+
+
+atexit.register(flush)
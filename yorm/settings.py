@@ -1,3 +1,13 @@
 """Package settings."""
 
 fake = False
+metrics = False
+
+max_loaded_objects = None  # evict attributes of least recently used objects
+max_loaded_bytes = None  # same, by the total size of their files
+
+intern_strings = False  # store one copy of each equal string value
+share_values = False  # same, for untyped nested data (treat as immutable)
+max_shared_values = 10000  # forget least recently used shared values
+
+watch_interval = 1.0  # seconds between checks of watched files
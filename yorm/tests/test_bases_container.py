@@ -36,3 +36,9 @@ class TestContainer:
         container.update_value(10)
         assert 52 == container.value
         assert "52" == container.format_data()
+
+    def test_bulk_changes_use_the_mapper(self):
+        container = self.MyContainer(42)
+        with container.bulk() as value:
+            assert container is value
+        assert 1 == container.__mapper__.bulk.call_count
@@ -1,5 +1,6 @@
 # pylint: disable=missing-docstring,no-self-use,attribute-defined-outside-init,protected-access,misplaced-comparison-constant
 
+import copy
 import logging
 from unittest.mock import Mock
 
@@ -7,6 +8,7 @@ import pytest
 
 import yorm
 from yorm.bases import Mappable
+from yorm.bases.mappable import patch_methods
 from yorm.mapper import Mapper
 from yorm.types import String, Integer, Boolean, List, Dictionary
 
@@ -27,7 +29,7 @@ class MockMapper(Mapper):
         logging.debug("Mock read:\n%s", text.strip())
         return text
 
-    def _write(self, text):
+    def _write(self, text, *, start=0):  # pylint: disable=unused-argument
         logging.debug("Mock write:\n%s", text.strip())
         self._mock_file = text
         self.modified = True
@@ -213,6 +215,8 @@ class TestMappableTriggers:
         __mapper__.attrs = {}
         __mapper__.load = Mock()
         __mapper__.save = Mock()
+        __mapper__.autosave = __mapper__.save
+        __mapper__.pending = None
 
     def setup_method(self, _):
         """Create an mappable instance for tests."""
@@ -281,3 +285,37 @@ class TestMappableTriggers:
         sample[0] = 0
         print(sample[0])
         assert None is sample.__mapper__
+
+
+class TestPatchMethods:
+    """Unit tests for patching methods on mapped instances."""
+
+    class Sample:
+
+        def __init__(self):
+            self.value = None
+
+    def test_original_class_is_unchanged(self):
+        sample = self.Sample()
+        patch_methods(sample)
+        assert '__setattr__' not in self.Sample.__dict__
+        assert '__setattr__' in type(sample).__dict__
+
+    def test_mapped_class_is_reused(self):
+        sample1 = self.Sample()
+        sample2 = self.Sample()
+        patch_methods(sample1)
+        patch_methods(sample2)
+        assert type(sample1) is type(sample2)
+
+    def test_mapped_class_appears_unchanged(self):
+        sample = self.Sample()
+        patch_methods(sample)
+        assert self.Sample is sample.__class__
+        assert isinstance(sample, self.Sample)
+
+    def test_mapped_instance_can_be_pickled(self):
+        sample = self.Sample()
+        patch_methods(sample)
+        sample2 = copy.deepcopy(sample)
+        assert self.Sample is type(sample2)
@@ -0,0 +1,71 @@
+# pylint: disable=missing-docstring,redefined-outer-name,unused-variable,expression-not-assigned
+# pylint: disable=unused-argument
+
+from unittest.mock import Mock
+
+import pytest
+from expecter import expect
+
+from yorm import cache, settings
+
+
+class MockMapper:
+
+    def __init__(self, evicted=True):
+        self.evict = Mock(return_value=evicted)
+
+
+@pytest.yield_fixture
+def limited():
+    cache.reset()
+    settings.max_loaded_objects = 2
+    yield
+    settings.max_loaded_objects = None
+    cache.reset()
+
+
+def describe_touch():
+
+    def it_does_nothing_without_limits():
+        cache.reset()
+        cache.touch(MockMapper(), size=10)
+
+        expect(cache.stats()['objects']) == 0
+
+    def it_tracks_the_size_of_loaded_data(limited):
+        mapper = MockMapper()
+        cache.touch(mapper, size=10)
+        cache.touch(mapper, size=15)
+
+        expect(cache.stats()['bytes']) == 15
+
+    def it_ignores_mappers_that_are_not_loaded(limited):
+        cache.touch(MockMapper())
+
+        expect(cache.stats()['objects']) == 0
+
+    def it_evicts_the_least_recently_used_mapper(limited):
+        mappers = [MockMapper() for _ in range(3)]
+        for mapper in mappers:
+            cache.touch(mapper, size=1)
+
+        expect(mappers[0].evict.call_count) == 1
+        expect(mappers[1].evict.call_count) == 0
+        expect(cache.stats()['evictions']) == 1
+
+    def it_skips_mappers_that_are_in_use(limited):
+        mappers = [MockMapper(False), MockMapper(), MockMapper()]
+        for mapper in mappers:
+            cache.touch(mapper, size=1)
+
+        expect(mappers[1].evict.call_count) == 1
+        expect(cache.stats()['objects']) == 2
+
+
+def describe_discard():
+
+    def it_happens_when_mappers_are_collected(limited):
+        cache.touch(MockMapper(), size=10)
+
+        expect(cache.stats()['objects']) == 0
+        expect(cache.stats()['bytes']) == 0
@@ -0,0 +1,113 @@
+# pylint: disable=missing-docstring,unused-variable,expression-not-assigned
+
+import pytest
+from expecter import expect
+
+from yorm import conflicts, exceptions
+
+
+BASE = {'name': "foo", 'count': 1, 'items': [1]}
+
+
+def describe_error():
+
+    def it_always_raises():
+        with expect.raises(exceptions.ConflictError):
+            conflicts.error(BASE, BASE, BASE)
+
+
+def describe_overwrite():
+
+    def it_keeps_our_data():
+        ours = dict(BASE, count=2)
+
+        expect(conflicts.overwrite(BASE, ours, dict(BASE, name="bar"))) == ours
+
+
+def describe_reapply():
+
+    def it_applies_our_changes_to_their_data():
+        ours = dict(BASE, count=2)
+        theirs = dict(BASE, name="bar")
+
+        expect(conflicts.reapply(BASE, ours, theirs)) == \
+            {'name': "bar", 'count': 2, 'items': [1]}
+
+    def it_prefers_our_changes():
+        ours = dict(BASE, count=2)
+        theirs = dict(BASE, count=3)
+
+        expect(conflicts.reapply(BASE, ours, theirs)['count']) == 2
+
+    def it_keeps_their_new_keys():
+        theirs = dict(BASE, extra=True)
+
+        expect(conflicts.reapply(BASE, dict(BASE), theirs)['extra']).is_true()
+
+
+def describe_merge():
+
+    def it_combines_changes_to_different_keys():
+        ours = dict(BASE, count=2)
+        theirs = dict(BASE, name="bar")
+
+        expect(conflicts.merge(BASE, ours, theirs)) == \
+            {'name': "bar", 'count': 2, 'items': [1]}
+
+    def it_accepts_identical_changes():
+        ours = dict(BASE, count=2)
+        theirs = dict(BASE, count=2)
+
+        expect(conflicts.merge(BASE, ours, theirs)['count']) == 2
+
+    def it_removes_keys_they_deleted():
+        theirs = dict(BASE)
+        del theirs['items']
+
+        expect(conflicts.merge(BASE, dict(BASE), theirs)) == \
+            {'name': "foo", 'count': 1}
+
+    def it_raises_when_both_changed_a_key():
+        ours = dict(BASE, count=2, name="baz")
+        theirs = dict(BASE, count=3, name="bar")
+
+        with expect.raises(exceptions.ConflictError,
+                           "Conflicting changes to: name, count"):
+            conflicts.merge(BASE, ours, theirs)
+
+    def it_merges_nested_dictionaries():
+        base = {'data': {'a': 1, 'b': 1}}
+        ours = {'data': {'a': 2, 'b': 1}}
+        theirs = {'data': {'a': 1, 'b': 2, 'c': 3}}
+
+        expect(conflicts.merge(base, ours, theirs)) == \
+            {'data': {'a': 2, 'b': 2, 'c': 3}}
+
+    def it_merges_dictionaries_added_on_both_sides():
+        ours = {'data': {'a': 1}}
+        theirs = {'data': {'b': 2}}
+
+        expect(conflicts.merge({}, ours, theirs)) == \
+            {'data': {'a': 1, 'b': 2}}
+
+    def it_reports_the_paths_of_nested_conflicts():
+        base = {'data': {'a': 1}}
+        ours = {'data': {'a': 2}}
+        theirs = {'data': {'a': 3}}
+
+        with expect.raises(exceptions.ConflictError,
+                           "Conflicting changes to: data.a"):
+            conflicts.merge(base, ours, theirs)
+
+
+def describe_get_resolver():
+
+    def it_returns_builtin_resolvers_by_name():
+        expect(conflicts.get_resolver('reload') is conflicts.reapply).is_true()
+
+    def it_returns_custom_resolvers():
+        expect(conflicts.get_resolver(max) is max).is_true()
+
+    def it_rejects_unknown_names():
+        with pytest.raises(ValueError):
+            conflicts.get_resolver('unknown')
@@ -9,6 +9,7 @@ from expecter import expect
 
 from yorm import decorators
 from yorm.bases import Converter
+from yorm.bases.mappable import MappedAttribute
 
 log = logging.getLogger(__name__)
 
@@ -57,6 +58,14 @@ def describe_sync():
             expect(sample.__mapper__.path) == "sample.yml"
             expect(sample.__mapper__.attrs) == {'var1': MockConverter}
 
+        def with_descriptors(instance, path):
+            attrs = {'var1': MockConverter}
+            sample = decorators.sync(instance, path, attrs, descriptors=True)
+
+            expect(type(sample).__dict__['var1']).isinstance(MappedAttribute)
+            expect(type(sample).__dict__).excludes('__getattribute__')
+            expect(type(sample).__dict__).excludes('__setattr__')
+
         def cannot_be_called_twice(instance, path):
             sample = decorators.sync(instance, path)
 
@@ -34,6 +34,40 @@ def describe_touch():
         expect(os.path.exists(new_path_in_directory)).is_true()
 
 
+def is_locked(fcntl, path):
+    with open(path + diskutils.LOCK_EXTENSION, 'a') as stream:
+        try:
+            fcntl.flock(stream, fcntl.LOCK_SH | fcntl.LOCK_NB)
+        except BlockingIOError:
+            return True
+        fcntl.flock(stream, fcntl.LOCK_UN)
+        return False
+
+
+def describe_lock():
+
+    @pytest.fixture
+    def fcntl():
+        return pytest.importorskip('fcntl')
+
+    def it_reuses_locks_held_by_the_thread(tmpdir, fcntl):
+        tmpdir.chdir()
+        with diskutils.lock("file.yml"):
+            with diskutils.lock(os.path.join('.', "file.yml")):
+                expect(is_locked(fcntl, "file.yml")).is_true()
+            expect(is_locked(fcntl, "file.yml")).is_true()
+
+        expect(is_locked(fcntl, "file.yml")).is_false()
+
+    def it_upgrades_shared_locks_when_nested(tmpdir, fcntl):
+        tmpdir.chdir()
+        with diskutils.lock("file.yml", shared=True):
+            expect(is_locked(fcntl, "file.yml")).is_false()
+            with diskutils.lock("file.yml"):
+                expect(is_locked(fcntl, "file.yml")).is_true()
+            expect(is_locked(fcntl, "file.yml")).is_false()
+
+
 def describe_delete():
 
     @pytest.fixture
@@ -61,3 +95,116 @@ def describe_delete():
     def it_deletes_directories(existing_dirpath):
         diskutils.delete(existing_dirpath)
         expect(os.path.exists(existing_dirpath)).is_false()
+
+
+def describe_write():
+
+    def it_can_overwrite_the_end_of_a_file(tmpdir):
+        tmpdir.chdir()
+        diskutils.write("name: foo\ncount: 1\n", "file.yml")
+
+        diskutils.write("name: foo\nnumber: 42\n", "file.yml", start=10)
+
+        expect(diskutils.read("file.yml")) == "name: foo\nnumber: 42\n"
+
+
+def describe_replace():
+
+    def it_replaces_the_file_without_a_temporary_file(tmpdir):
+        tmpdir.chdir()
+        diskutils.write("name: foo\n", "file.yml")
+
+        diskutils.replace("name: bar\n", "file.yml")
+
+        expect(diskutils.read("file.yml")) == "name: bar\n"
+        expect(os.listdir()) == ["file.yml"]
+
+
+def describe_write_array():
+
+    def it_leaves_the_temporary_files_of_other_writers(tmpdir):
+        numpy = pytest.importorskip('numpy')
+        tmpdir.chdir()
+        diskutils.write("partial", "values.npy.tmp")
+
+        diskutils.write_array(numpy.arange(3), "values.npy")
+
+        expect(numpy.load("values.npy").tolist()) == [0, 1, 2]
+        expect(sorted(os.listdir())) == ["values.npy", "values.npy.tmp"]
+        expect(diskutils.read("values.npy.tmp")) == "partial"
+
+
+def describe_sync():
+
+    def it_flushes_files_and_their_directories(tmpdir):
+        tmpdir.chdir()
+        diskutils.write("name: foo\n", "file.yml")
+
+        diskutils.sync(["file.yml", "deleted.yml"])
+
+        expect(diskutils.read("file.yml")) == "name: foo\n"
+
+
+def describe_write_log():
+
+    def it_can_be_read_back(tmpdir):
+        tmpdir.chdir()
+        files = [("a.yml", "name: foo\n"), ("b.yml", "")]
+
+        diskutils.write_log(files, "changes.wal")
+
+        expect(diskutils.read_log("changes.wal")) == files
+
+    def it_can_contain_binary_files(tmpdir):
+        tmpdir.chdir()
+        files = [("a.npy", b"\x93NUMPY\x00"), ("b.npy", None)]
+
+        diskutils.write_log(files, "changes.wal")
+
+        expect(diskutils.read_log("changes.wal")) == files
+
+    def it_rejects_incomplete_logs(tmpdir):
+        tmpdir.chdir()
+        diskutils.write('{"files": [["a.yml", "na', "changes.wal")
+
+        expect(diskutils.read_log("changes.wal")).is_none()
+
+
+def describe_patch():
+
+    TEXT = "# comment\nname: foo\nitems:\n- 1\n- 2\ncount: 1\n"
+    DATA = {'name': 'foo', 'items': [1, 2], 'count': 1}
+
+    def it_replaces_only_changed_keys():
+        data = dict(DATA, items=[3])
+
+        text, start = diskutils.patch(data, "file.yml", TEXT, DATA)
+
+        expect(text) == "# comment\nname: foo\nitems:\n- 3\ncount: 1\n"
+        expect(start) == TEXT.index("- 1") + 2
+
+    def it_returns_the_text_when_nothing_changed():
+        text, start = diskutils.patch(dict(DATA), "file.yml", TEXT, DATA)
+
+        expect(text) == TEXT
+        expect(start) == len(TEXT)
+
+    def it_detects_changes_in_type():
+        data = dict(DATA, count=True)
+
+        text, _ = diskutils.patch(data, "file.yml", TEXT, DATA)
+
+        expect(text).endswith("count: true\n")
+
+    def it_requires_the_same_keys():
+        data = dict(DATA, extra=None)
+
+        expect(diskutils.patch(data, "file.yml", TEXT, DATA)).is_none()
+
+    def it_requires_keys_to_be_located():
+        text = "{name: foo, items: [1, 2], count: 1}\n"
+
+        expect(diskutils.patch(DATA, "file.yml", text, DATA)).is_none()
+
+    def it_only_supports_yaml():
+        expect(diskutils.patch(DATA, "file.json", TEXT, DATA)).is_none()
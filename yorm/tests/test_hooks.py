@@ -0,0 +1,82 @@
+# pylint: disable=missing-docstring,redefined-outer-name,unused-variable,expression-not-assigned
+# pylint: disable=attribute-defined-outside-init
+
+from unittest.mock import Mock, call
+
+import pytest
+from expecter import expect
+
+import yorm
+from yorm import hooks
+from yorm.types import Integer
+
+
+@yorm.attr(value=Integer)
+@yorm.sync("tmp/{self.name}.yml")
+class Sample:
+
+    def __init__(self, name):
+        self.name = name
+
+
+@pytest.yield_fixture
+def callback(tmpdir):
+    tmpdir.chdir()
+    yield Mock()
+    hooks.callbacks.clear()
+
+
+def describe_on():
+
+    def it_rejects_unknown_events():
+        with expect.raises(ValueError):
+            hooks.on('before_everything', print)
+
+    def it_can_be_used_as_a_decorator(callback):
+        function = hooks.on('after_save')(callback)
+
+        expect(function) == callback
+        expect(hooks.callbacks['after_save']) == [callback]
+
+    def it_calls_callbacks_before_and_after_events(callback):
+        hooks.on('before_save', callback)
+        hooks.on('after_write', callback)
+
+        sample = Sample('a')
+        callback.reset_mock()
+        sample.value = 42
+
+        expect(callback.call_args_list[0]) == call(
+            'before_save', path="tmp/a.yml", obj=sample)
+        event, info = callback.call_args_list[1]
+        expect(event) == ('after_write',)
+        expect(info['path']) == "tmp/a.yml"
+        expect(info['size']) == len("value: 42\n")
+        expect(info['seconds']) > 0
+
+
+def describe_off():
+
+    def it_removes_one_callback(callback):
+        hooks.on('after_load', callback)
+        hooks.on('after_load', print)
+
+        hooks.off('after_load', callback)
+
+        expect(hooks.callbacks['after_load']) == [print]
+
+    def it_removes_all_callbacks(callback):
+        hooks.on('after_load', callback)
+        hooks.on('after_load', print)
+
+        hooks.off('after_load')
+
+        expect(hooks.callbacks) == {}
+
+    def it_stops_calling_callbacks(callback):
+        hooks.on('after_load', callback)
+        hooks.off('after_load', callback)
+
+        Sample('a')
+
+        expect(callback.called).is_false()
@@ -0,0 +1,92 @@
+# pylint: disable=missing-docstring,redefined-outer-name,unused-variable,expression-not-assigned
+# pylint: disable=unused-argument
+
+import pytest
+from expecter import expect
+
+from yorm import interning, settings
+
+
+@pytest.yield_fixture
+def interned():
+    settings.intern_strings = True
+    yield
+    settings.intern_strings = False
+
+
+@pytest.yield_fixture
+def shared():
+    interning.reset()
+    settings.share_values = True
+    yield
+    settings.share_values = False
+    interning.reset()
+
+
+def fresh(text):
+    return ''.join(list(text))  # a new object for an equal string
+
+
+def describe_string():
+
+    def it_is_disabled_by_default():
+        first, second = fresh("enabled"), fresh("enabled")
+
+        expect(interning.string(second) is first).is_false()
+
+    def it_returns_one_copy_of_equal_strings(interned):
+        first = interning.string(fresh("enabled"))
+
+        expect(interning.string(fresh("enabled")) is first).is_true()
+
+    def it_ignores_other_types(interned):
+        expect(interning.string(42)) == 42
+
+
+def describe_share():
+
+    def it_is_disabled_by_default():
+        data = {'key': [1, 2]}
+
+        expect(interning.share({'key': [1, 2]}) is data).is_false()
+
+    def it_returns_one_copy_of_equal_data(shared):
+        first = interning.share({'key': [1, 2]})
+
+        expect(interning.share({'key': [1, 2]}) is first).is_true()
+        expect(interning.stats()) == {'values': 2, 'hits': 2}
+
+    def it_shares_equal_subtrees_of_different_data(shared):
+        first = interning.share({'a': {'b': 1}, 'c': 1})
+        second = interning.share({'a': {'b': 1}, 'c': 2})
+
+        expect(first is second).is_false()
+        expect(first['a'] is second['a']).is_true()
+
+    def it_distinguishes_values_of_different_types(shared):
+        first = interning.share([1])
+
+        expect(interning.share([True]) is first).is_false()
+        expect(interning.share([1.0]) is first).is_false()
+
+    def it_skips_data_that_cannot_be_compared(shared):
+        data = [{'key': {1, 2}}]
+
+        expect(interning.share(data) is data).is_true()
+        expect(interning.stats()['values']) == 0
+
+    def it_ignores_scalars(shared):
+        expect(interning.share(42)) == 42
+        expect(interning.share(None)).is_none()
+
+    def it_forgets_the_least_recently_used_values(shared, monkeypatch):
+        monkeypatch.setattr(settings, 'max_shared_values', 2)
+        first = interning.share([1])
+        second = interning.share([2])
+        interning.share([1])
+
+        interning.share([3])
+
+        expect(interning.stats()['values']) == 2
+        expect(interning.share([1]) is first).is_true()
+        expect(interning.share([2]) is second).is_false()
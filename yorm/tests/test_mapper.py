@@ -1,4 +1,4 @@
-# pylint: disable=missing-docstring,redefined-outer-name,unused-variable,expression-not-assigned
+# pylint: disable=missing-docstring,redefined-outer-name,unused-variable,expression-not-assigned,protected-access
 
 import pytest
 from expecter import expect
@@ -51,6 +51,27 @@ def mapper_fake(obj, attrs):
 
 def describe_mapper():
 
+    def describe_options():
+
+        def are_shared_between_mappers(obj, attrs):
+            mapper1 = Mapper(obj, "path/to/file1", attrs)
+            mapper2 = Mapper(obj, "path/to/file2", attrs)
+
+            expect(mapper1._options is mapper2._options).is_true()
+
+        def are_copied_when_changed(obj, attrs):
+            mapper1 = Mapper(obj, "path/to/file1", attrs)
+            mapper2 = Mapper(obj, "path/to/file2", attrs)
+
+            mapper2.auto_track = True
+
+            expect(mapper1.auto_track).is_false()
+            expect(mapper2.auto_track).is_true()
+            expect(mapper2.attrs is attrs).is_true()
+
+        def are_not_stored_per_mapper(mapper):
+            expect(hasattr(mapper, '__dict__')).is_false()
+
     def describe_create():
 
         def it_creates_the_file(mapper_real):
@@ -127,6 +148,17 @@ def describe_mapper():
             with expect.raises(exceptions.DeletedFileError):
                 mapper.load()
 
+        def it_can_load_again_after_an_exception(obj, mapper):
+            mapper.create()
+            mapper.text = "var2: [invalid"
+
+            with expect.raises(exceptions.FileContentError):
+                mapper.load()
+
+            mapper.text = "var2: 42"
+            mapper.load()
+            expect(obj.var2) == 42
+
     def describe_modified():
 
         def is_true_initially(mapper):
@@ -198,3 +230,37 @@ def describe_mapper():
             mapper.text = "abc"
 
             expect(mapper.data) == {}
+
+    def describe_autosave():
+
+        def it_saves_immediately_without_a_delay(obj, mapper):
+            mapper.create()
+            obj.var2 = 42
+
+            mapper.autosave()
+
+            expect(mapper.data) == {'var2': 42, 'var3': 0}
+
+        def it_waits_for_the_delay(obj, mapper, monkeypatch):
+            monkeypatch.setattr(yorm.scheduler, 'schedule', lambda *_: None)
+            mapper.auto_save_delay = 1
+            mapper.create()
+            obj.var2 = 42
+
+            mapper.autosave()
+
+            expect(mapper.data) == {}
+            mapper.flush()
+            expect(mapper.data) == {'var2': 42, 'var3': 0}
+
+        def it_extends_the_delay_up_to_the_maximum(mapper, monkeypatch):
+            monkeypatch.setattr(yorm.scheduler, 'schedule', lambda *_: None)
+            monkeypatch.setattr(yorm.scheduler, 'now', lambda: 0)
+            mapper.auto_save_delay = 1
+            mapper.auto_save_max_delay = 1.5
+            mapper.autosave()
+
+            monkeypatch.setattr(yorm.scheduler, 'now', lambda: 1)
+            mapper.autosave()
+
+            expect(mapper._deadline) == 1.5
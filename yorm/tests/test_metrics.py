@@ -0,0 +1,91 @@
+# pylint: disable=missing-docstring,redefined-outer-name,unused-variable,expression-not-assigned
+# pylint: disable=unused-argument,attribute-defined-outside-init
+
+import pytest
+from expecter import expect
+
+import yorm
+from yorm import metrics
+from yorm.types import Integer
+
+
+@yorm.attr(value=Integer)
+@yorm.sync("tmp/{self.key}.yml")
+class Sample:
+
+    def __init__(self, key):
+        self.key = key
+
+
+@pytest.yield_fixture
+def enabled(tmpdir):
+    tmpdir.chdir()
+    metrics.reset()
+    yorm.settings.metrics = True
+    yield
+    yorm.settings.metrics = False
+    metrics.reset()
+
+
+def describe_stats():
+
+    def it_is_empty_when_disabled(tmpdir):
+        tmpdir.chdir()
+        metrics.reset()
+
+        Sample('a').value = 1
+
+        expect(yorm.stats()) == {}
+
+    def it_counts_mapper_and_file_activity(enabled):
+        sample = Sample('a')
+        sample.value = 42
+
+        stats = yorm.stats()
+
+        expect(stats['save']['count']) == 2
+        expect(stats['write']['count']) == 3
+        expect(stats['write']['bytes']) == len("value: 0\nvalue: 42\n")
+        expect(stats['parse']['count']) == stats['read']['count']
+        expect(stats['stat']['count']) > 0
+
+    def it_records_a_timing_histogram(enabled):
+        Sample('a')
+
+        histogram = yorm.stats()['load']['histogram']
+
+        expect(list(histogram)) == list(metrics.BOUNDS)
+        expect(sum(histogram.values())) == yorm.stats()['load']['count']
+
+    def it_can_be_filtered_by_class_object_or_path(enabled):
+        sample = Sample('a')
+        sample2 = Sample('b')
+        sample2.value = 2
+
+        expect(yorm.stats(Sample)['save']['count']) == 3
+        expect(yorm.stats(sample)['save']['count']) == 1
+        expect(yorm.stats("tmp/b.yml")['save']['count']) == 2
+        expect(yorm.stats("tmp/c.yml")) == {}
+
+    def it_groups_file_checks_on_attribute_access(enabled):
+        sample = Sample('a')
+        metrics.reset()
+
+        expect(sample.value) == 0
+
+        expect(yorm.stats(sample)['modified']['count']) == 1
+        expect(yorm.stats(Sample)['stat']['count']) == 1
+
+
+def describe_breakdown():
+
+    def it_groups_metrics_by_path(enabled):
+        Sample('a')
+        Sample('b')
+
+        expect(list(metrics.breakdown('path'))) == ["tmp/a.yml", "tmp/b.yml"]
+
+    def it_groups_metrics_by_class(enabled):
+        Sample('a')
+
+        expect(list(metrics.breakdown())) == [Sample]
@@ -167,6 +167,10 @@ class TestList:
         expect(cls.__name__) == "IntegerList"
         expect(common.attrs[cls]) == {'all': Integer}
 
+    def test_shortened_syntax_without_instance_dictionary(self):
+        value = List.of_type(Integer)()
+        expect(hasattr(value, '__dict__')).is_false()
+
 
 class TestExtensions:
     """Unit tests for extensions to the container classes."""
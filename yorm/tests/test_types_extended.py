@@ -1,4 +1,5 @@
 # pylint: disable=missing-docstring,unused-variable,expression-not-assigned,singleton-comparison
+# pylint: disable=no-member
 
 import pytest
 from expecter import expect
@@ -6,7 +7,9 @@ from expecter import expect
 from yorm.decorators import attr
 from yorm.types.standard import Integer, String, Float
 from yorm.types.extended import (NullableString, Number, NullableNumber,
-                                 Markdown, AttributeDictionary, SortedList)
+                                 Markdown, AttributeDictionary, SortedList,
+                                 JournaledList, NumericArray, IntegerArray,
+                                 FloatArray)
 
 
 def describe_nullable_string():
@@ -161,3 +164,74 @@ def describe_sorted_list():
         def it_sorts(converter):
             data = converter.to_data([4, 2, 0, 1, 3])
             expect(data) == [0.0, 1.0, 2.0, 3.0, 4.0]
+
+
+def describe_journaled_list():
+
+    @pytest.fixture
+    def value():
+        value = JournaledList.of_type(String).to_value(["a", "b"])
+        value._rewrite = False  # pylint: disable=protected-access
+        return value
+
+    def it_marks_new_lists():
+        value = JournaledList.of_type(String)()
+        expect(value._rewrite) == True  # pylint: disable=protected-access
+
+    def it_allows_appends(value):
+        value.append("c")
+        value.extend(["d"])
+        expect(value._rewrite) == False  # pylint: disable=protected-access
+
+    def it_marks_other_changes(value):
+        value.insert(0, "z")
+        expect(value._rewrite) == True  # pylint: disable=protected-access
+
+    def it_marks_item_assignment(value):
+        value[0] = "z"
+        expect(value._rewrite) == True  # pylint: disable=protected-access
+
+
+def describe_numeric_array():
+
+    def it_cannot_be_used_directly():
+        with expect.raises(NotImplementedError):
+            NumericArray.to_value(None)
+        with expect.raises(NotImplementedError):
+            NumericArray.to_data(None)
+
+    def describe_to_value():
+
+        def it_converts_lists():
+            value = IntegerArray.to_value([1, 2, 3])
+            expect(value.typecode) == 'q'
+            expect(value.tolist()) == [1, 2, 3]
+
+        def it_converts_items_that_need_coercion():
+            value = IntegerArray.to_value([1, "2", 3.0, None])
+            expect(value.tolist()) == [1, 2, 3]
+
+        def it_rejects_items_out_of_range():
+            msg = "Items out of range for IntegerArray: int too big to convert"
+            with expect.raises(ValueError, msg):
+                IntegerArray.to_value([1, 2**70])
+
+        def it_converts_other_arrays():
+            value = FloatArray.to_value(IntegerArray.to_value([1, 2]))
+            expect(value.tolist()) == [1.0, 2.0]
+
+        def it_converts_buffers_in_bulk():
+            numpy = pytest.importorskip('numpy')
+            value = FloatArray.to_value(numpy.arange(3))
+            expect(value.tolist()) == [0.0, 1.0, 2.0]
+
+        def it_allows_none():
+            expect(FloatArray.to_value(None).tolist()) == []
+
+    def describe_to_data():
+
+        def it_converts_to_lists():
+            expect(FloatArray.to_data([1, 2])) == [1.0, 2.0]
+
+        def it_keeps_a_placeholder_when_empty():
+            expect(IntegerArray.to_data([])) == [None]
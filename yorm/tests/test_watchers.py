@@ -0,0 +1,19 @@
+# pylint: disable=missing-docstring,redefined-outer-name,unused-variable,expression-not-assigned
+
+from expecter import expect
+
+from yorm import watchers
+
+
+def describe_diff():
+
+    def it_includes_changed_keys():
+        expect(watchers.diff({'a': 1, 'b': 2}, {'a': 1, 'b': 3})) == \
+            {'b': (2, 3)}
+
+    def it_includes_added_and_removed_keys():
+        expect(watchers.diff({'a': 1}, {'b': 2})) == \
+            {'a': (1, None), 'b': (None, 2)}
+
+    def it_is_empty_for_equal_data():
+        expect(watchers.diff({'a': [1]}, {'a': [1]})) == {}
@@ -0,0 +1,168 @@
+"""Atomic commits of changes to multiple mapped files."""
+
+import os
+import logging
+import threading
+import contextlib
+from collections import OrderedDict
+
+from . import diskutils, settings
+
+log = logging.getLogger(__name__)
+
+
+# CONSTANTS ###################################################################
+
+WAL = '.yorm.wal'  # default path of the write-ahead log
+
+
+# GLOBALS #####################################################################
+
+_local = threading.local()
+_lock = threading.Lock()
+
+
+# CLASSES #####################################################################
+
+
+class Transaction:
+    """Changes to mapped files staged until they are committed together."""
+
+    def __init__(self, wal=WAL):
+        self.wal = wal
+        self.files = OrderedDict()  # staged text keyed by file path
+        self.mappers = []
+
+    def __repr__(self):
+        return "<transaction of {} file(s)>".format(len(self.files))
+
+    def stage(self, mapper, text, path=None):
+        """Stage the new contents of a mapped file.
+
+        :param mapper: mapper writing the file
+        :param text: new contents, or None to delete the file
+        :param path: file written by the mapper (default: its own)
+
+        """
+        path = path or mapper.path
+        log.debug("Staging changes to %s", path)
+        self.files[path] = text
+        if mapper not in self.mappers:
+            self.mappers.append(mapper)
+
+    def commit(self):
+        """Log the staged changes, then apply them to the files."""
+        if not self.files:
+            return
+        log.info("Committing changes to %s file(s)...", len(self.files))
+
+        files = [(os.path.abspath(path), text)
+                 for path, text in self.files.items()]
+        with _lock, diskutils.lock(self.wal):
+            diskutils.write_log(files, self.wal)
+            _apply(files, self.wal)
+
+        self._reset()
+
+    def rollback(self):
+        """Discard the staged changes."""
+        log.info("Discarding changes to %s file(s)", len(self.files))
+        self._reset()
+
+    def _reset(self):
+        """Force mapped objects to reload their files."""
+        for mapper in self.mappers:
+            mapper.cancel()  # changes were staged or discarded
+            mapper.modified = True
+            mapper._snapshot = None  # pylint: disable=protected-access
+        self.files.clear()
+        self.mappers.clear()
+
+
+# FUNCTIONS ###################################################################
+
+
+@contextlib.contextmanager
+def transaction(wal=WAL):
+    """Context manager to save changes to multiple mapped files atomically.
+
+    Files written inside the block are staged and then written together
+    when it exits: the new contents are first recorded in a write-ahead
+    log, which is replayed by `recover` if the process stops before every
+    file is replaced. If the block raises an exception, the staged changes
+    are discarded and the objects are reloaded from their files.
+
+    Journals of `JournaledList` attributes are compacted into their files
+    instead of appended to, and removed when the transaction commits.
+
+    Nested transactions are part of the outermost one.
+
+    :param wal: path of the write-ahead log
+
+    """
+    current = get_transaction()
+    if current:
+        yield current
+        return
+
+    current = Transaction(wal)
+    _local.transaction = current
+    try:
+        yield current
+    except BaseException:
+        current.rollback()
+        raise
+    else:
+        current.commit()
+    finally:
+        _local.transaction = None
+
+
+def get_transaction():
+    """Get the active transaction in this thread, if any."""
+    if settings.fake:
+        return None
+    return getattr(_local, 'transaction', None)
+
+
+def recover(wal=WAL):
+    """Apply changes from a write-ahead log left by an interrupted commit.
+
+    The log is locked while it is written and applied, so a commit still
+    in progress in another process is waited for rather than replayed.
+    Only the default log is recovered when objects are mapped; logs at
+    other paths must be recovered by calling this function.
+
+    :param wal: path of the write-ahead log
+
+    :return: list of recovered file paths
+
+    """
+    if not os.path.exists(wal):
+        return []
+
+    with _lock, diskutils.lock(wal):
+        if not os.path.exists(wal):
+            return []  # applied by the process that was committing it
+
+        files = diskutils.read_log(wal)
+        if files is None:
+            log.warning("Discarding incomplete write-ahead log: %s", wal)
+            diskutils.delete(wal)
+            return []
+
+        log.warning("Recovering %s file(s) from %s", len(files), wal)
+        _apply(files, wal)
+
+    return [path for path, _ in files]
+
+
+def _apply(files, wal):
+    """Replace files with their logged contents and remove the log."""
+    for path, text in files:
+        if text is None:
+            diskutils.delete(path)
+        else:
+            diskutils.replace(text, path)
+    diskutils.sync(path for path, _ in files)
+    diskutils.delete(wal)
@@ -2,7 +2,7 @@
 
 import logging
 
-from .. import common
+from .. import common, interning
 from ..bases import Container
 from . import standard
 
@@ -12,6 +12,8 @@ log = logging.getLogger(__name__)
 class Dictionary(Container, dict):
     """Base class for a dictionary of attribute types."""
 
+    __slots__ = (common.MAPPER,)
+
     def __new__(cls, *args, **kwargs):
         if cls is Dictionary:
             msg = "Dictionary class must be subclassed to use"
@@ -40,7 +42,7 @@ class Dictionary(Container, dict):
             for k, v in data.items():
                 if k in attrs:
                     dictionary[k] = v
-            for k, v in data.__dict__.items():
+            for k, v in getattr(data, '__dict__', {}).items():
                 if k in attrs:
                     dictionary[k] = v
         else:
@@ -48,6 +50,7 @@ class Dictionary(Container, dict):
 
         # Map object attributes to types
         for name, data2 in dictionary.items():
+            name = interning.string(name)
 
             try:
                 converter = attrs.pop(name)
@@ -93,6 +96,8 @@ class Dictionary(Container, dict):
 class List(Container, list):
     """Base class for a homogeneous list of attribute types."""
 
+    __slots__ = (common.MAPPER,)
+
     def __new__(cls, *args, **kwargs):
         if cls is List:
             raise NotImplementedError("List class must be subclassed to use")
@@ -103,7 +108,7 @@ class List(Container, list):
     @classmethod
     def of_type(cls, sub_class):
         name = sub_class.__name__ + cls.__name__
-        new_class = type(name, (cls,), {})
+        new_class = type(name, (cls,), {'__slots__': ()})
         common.attrs[new_class][common.ALL] = sub_class
         return new_class
 
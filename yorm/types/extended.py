@@ -1,10 +1,13 @@
 """Converter classes for extensions to builtin types."""
 
 import re
+import array
 import logging
 
+from .. import common
+from ..bases import Container, Converter
 from .standard import String, Integer, Float, Boolean
-from .containers import Dictionary, List
+from .containers import Dictionary, List, to_list
 from ._representers import LiteralString
 
 
@@ -149,6 +152,36 @@ class Markdown(String):
             return ''
 
 
+class Array(Converter):
+    """Converter for NumPy arrays stored in a sidecar `.npy` file.
+
+    When mapped as an object's attribute, the array is written next to the
+    object's file and memory-mapped when loaded. Otherwise (e.g. when nested
+    in a container), the array is stored inline as a list.
+
+    """
+
+    EXTENSION = '.npy'
+
+    @classmethod
+    def create_default(cls):
+        return None
+
+    @classmethod
+    def to_value(cls, obj):
+        if obj is None:
+            return None
+        import numpy  # pylint: disable=import-error
+        return numpy.asarray(obj)
+
+    @classmethod
+    def to_data(cls, obj):
+        if obj is None:
+            return None
+        import numpy  # pylint: disable=import-error
+        return numpy.asarray(obj).tolist()
+
+
 # CUSTOM CONTAINERS ###########################################################
 
 
@@ -180,6 +213,8 @@ class AttributeDictionary(Dictionary):
 class SortedList(List):
     """List converter that is sorted on disk."""
 
+    __slots__ = ()
+
     @classmethod
     def create_default(cls):
         """Create an uninitialized object."""
@@ -203,3 +238,127 @@ class SortedList(List):
             data.append(cls.item_type.to_data(item))  # pylint: disable=no-member
 
         return data
+
+
+class JournaledList(List):
+    """List converter that appends new items to a journal file.
+
+    When mapped as an object's attribute, items appended to the list are
+    written to a companion `.log` file (one JSON record per line) rather
+    than rewriting the object's file. The journal is replayed when loading
+    and compacted into the object's file once it exceeds `THRESHOLD`
+    records or the list is changed other than by appending.
+
+    """
+
+    __slots__ = ('_rewrite',)
+
+    EXTENSION = '.log'
+    THRESHOLD = 1000  # maximum number of records before compacting
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._rewrite = True  # until the mapper records the journal's items
+
+    def __setitem__(self, *args):
+        self._rewrite = True
+        super().__setitem__(*args)
+
+    def __delitem__(self, *args):
+        self._rewrite = True
+        super().__delitem__(*args)
+
+    def insert(self, *args, **kwargs):
+        self._rewrite = True
+        super().insert(*args, **kwargs)
+
+    def remove(self, *args, **kwargs):
+        self._rewrite = True
+        super().remove(*args, **kwargs)
+
+    def pop(self, *args, **kwargs):
+        self._rewrite = True
+        super().pop(*args, **kwargs)
+
+    def clear(self, *args, **kwargs):
+        self._rewrite = True
+        super().clear(*args, **kwargs)
+
+    def sort(self, *args, **kwargs):
+        self._rewrite = True
+        super().sort(*args, **kwargs)
+
+    def reverse(self, *args, **kwargs):
+        self._rewrite = True
+        super().reverse(*args, **kwargs)
+
+
+class NumericArray(Container, array.array):
+    """Base class for a compact array of numeric attribute types."""
+
+    __slots__ = (common.MAPPER,)
+
+    TYPECODE = None  # `array` type code for all items (set in subclasses)
+    ITEM_TYPE = None  # converter for items to coerce (set in subclasses)
+
+    def __new__(cls, *args):
+        if not cls.TYPECODE:
+            msg = "NumericArray class must be subclassed to use"
+            raise NotImplementedError(msg)
+        return super().__new__(cls, cls.TYPECODE, *args)
+
+    @classmethod
+    def to_data(cls, value):
+        if isinstance(value, cls):
+            value2 = value
+        else:
+            value2 = cls.create_default()
+            value2.update_value(value, auto_track=False)
+
+        return value2.tolist() or [None]
+
+    def update_value(self, data, *, auto_track=True):  # pylint: disable=unused-argument
+        cls = self.__class__  # numeric items are never tracked
+
+        # Convert arrays in bulk to avoid per-item conversion
+        if isinstance(data, array.array):
+            value = cls(data)
+        elif all((hasattr(data, 'astype'), hasattr(data, 'tobytes'))):
+            value = cls()
+            value.frombytes(data.astype(cls.TYPECODE).tobytes())
+        else:
+            items = [item for item in to_list(data) if item is not None]
+            try:
+                value = self._from_items(items)
+            except OverflowError as exc:
+                msg = "Items out of range for {}: {}".format(cls.__name__, exc)
+                raise ValueError(msg) from None
+
+        # Apply the new value
+        self[:] = value
+
+    @classmethod
+    def _from_items(cls, items):
+        try:
+            return cls(items)
+        except TypeError:
+            log.trace("Converting array items using %r", cls.ITEM_TYPE)
+            return cls(cls.ITEM_TYPE.to_value(item) for item in items)  # pylint: disable=no-member
+
+
+class IntegerArray(NumericArray):
+    """Array converter for `int` items stored as 64-bit integers."""
+
+    __slots__ = ()
+
+    TYPECODE = 'q'
+    ITEM_TYPE = Integer
+
+
+class FloatArray(NumericArray):
+    """Array converter for `float` items stored as 64-bit floats."""
+
+    __slots__ = ()
+
+    TYPECODE = 'd'
+    ITEM_TYPE = Float
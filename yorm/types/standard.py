@@ -2,7 +2,7 @@
 
 import logging
 
-from .. import exceptions
+from .. import exceptions, interning
 from ..bases import Converter
 
 log = logging.getLogger(__name__)
@@ -20,10 +20,12 @@ class Object(Converter):
 
     @classmethod
     def to_value(cls, obj):
-        return obj
+        return interning.share(obj)
 
     @classmethod
     def to_data(cls, obj):
+        if cls.TYPE is None:
+            return obj  # untyped data is only shared when loaded
         return cls.to_value(obj)
 
 
@@ -36,16 +38,16 @@ class String(Object):
     @classmethod
     def to_value(cls, obj):
         if isinstance(obj, cls.TYPE):
-            return obj
+            return interning.string(obj)
         elif obj is True:
             return "true"
         elif obj is False:
             return "false"
         elif obj:
             try:
-                return ', '.join(str(item) for item in obj)
+                return interning.string(', '.join(str(item) for item in obj))
             except TypeError:
-                return str(obj)
+                return interning.string(str(obj))
         else:
             return cls.DEFAULT
 
@@ -5,8 +5,7 @@ import logging
 import string
 import glob
 import types
-
-import parse
+import contextlib
 
 from . import common, exceptions
 
@@ -112,6 +111,7 @@ def match(cls_or_path, _factory=None, **kwargs):
     kwargs['self'] = mock
     posix_pattern = gf.vformat(path_format, (), kwargs.copy())
     del kwargs['self']
+    import parse  # imported on first use to speed up imports
     py_pattern = parse.compile(path_format)
 
     for filename in glob.iglob(posix_pattern):
@@ -155,6 +155,22 @@ def save(instance):
     return instance
 
 
+@contextlib.contextmanager
+def locked(instance):
+    """Hold an exclusive lock on a mapped object's file for a batch of changes.
+
+    The object is reloaded if its file changed before the lock was acquired,
+    so changes inside the block are based on the latest contents.
+
+    """
+    mapper = common.get_mapper(instance, expected=True)
+
+    with mapper.lock():
+        if mapper.exists and mapper.modified:
+            mapper.load()
+        yield instance
+
+
 def delete(instance):
     """Delete a mapped object's file."""
     mapper = common.get_mapper(instance, expected=True)
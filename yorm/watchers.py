@@ -0,0 +1,208 @@
+"""Callbacks for mapped files changed by other processes."""
+
+import inspect
+import logging
+import threading
+import weakref
+from collections import OrderedDict
+
+from . import common, diskutils, metrics, settings
+
+log = logging.getLogger(__name__)
+
+
+# GLOBALS #####################################################################
+
+_lock = threading.RLock()
+_subscriptions = OrderedDict()  # subscriptions keyed by mapper ID
+_classes = OrderedDict()  # callbacks for new instances keyed by class
+_thread = None
+_wakeup = threading.Event()
+
+
+# CLASSES #####################################################################
+
+
+class Subscription:
+    """Callbacks for one mapped file and the data they last received."""
+
+    def __init__(self, mapper):
+        key = id(mapper)
+        self.mapper = weakref.ref(mapper, lambda _: _discard(key))
+        self.callbacks = []
+        self.signature, self.data = _read(mapper)
+        self.pending = None
+
+    def check(self):
+        """Call the callbacks if the file's data changed."""
+        mapper = self.mapper()
+        if mapper is None or mapper.deleted:
+            return
+
+        with _lock:
+            signature = mapper._signature()  # pylint: disable=protected-access
+            if signature == self.signature:
+                self.pending = None
+                return
+            if signature != self.pending:
+                self.pending = signature
+                return  # wait until the file is no longer being written
+            self.pending = None
+
+            try:
+                signature, data = _read(mapper)
+            except ValueError as e:
+                log.warning("Skipped invalid changes to %s: %s", mapper, e)
+                self.signature = signature
+                return
+
+            changes = diff(self.data, data)
+            self.signature, self.data = signature, data
+
+        if not changes:
+            return
+
+        log.info("Detected external changes to %s: %s",
+                 mapper, ", ".join(changes))
+        for callback in list(self.callbacks):
+            try:
+                callback(mapper._obj, changes)  # pylint: disable=protected-access
+            except Exception:  # pylint: disable=broad-except
+                log.exception("Watch callback failed for %s", mapper)
+
+
+# FUNCTIONS ###################################################################
+
+
+def watch(class_or_instance, callback):
+    """Call a function when a mapped object's file is changed by others.
+
+    The callback runs on a background thread once the file stops changing,
+    receiving the object and a dictionary of changed attribute names mapped
+    to (old, new) file data. Watching a class applies to its instances
+    mapped afterwards.
+
+    :param class_or_instance: mapped object or class of objects to watch
+    :param callback: function to call with the object and its changes
+
+    """
+    with _lock:
+        if inspect.isclass(class_or_instance):
+            _classes.setdefault(class_or_instance, []).append(callback)
+        else:
+            mapper = common.get_mapper(class_or_instance, expected=True)
+            _subscribe(mapper, callback)
+        _start()
+
+
+def unwatch(class_or_instance, callback=None):
+    """Stop calling one or all callbacks for a mapped object or class."""
+    with _lock:
+        if inspect.isclass(class_or_instance):
+            callbacks = _classes.get(class_or_instance, [])
+            key = class_or_instance
+            container = _classes
+        else:
+            mapper = common.get_mapper(class_or_instance, expected=True)
+            subscription = _subscriptions.get(id(mapper))
+            callbacks = subscription.callbacks if subscription else []
+            key = id(mapper)
+            container = _subscriptions
+
+        if callback is None:
+            callbacks.clear()
+        else:
+            callbacks.remove(callback)
+        if not callbacks:
+            container.pop(key, None)
+
+
+def track(mapper):
+    """Apply the callbacks of watched classes to a newly mapped object."""
+    if not _classes:
+        return
+    with _lock:
+        for cls, callbacks in _classes.items():
+            if isinstance(mapper._obj, cls):  # pylint: disable=protected-access
+                for callback in callbacks:
+                    _subscribe(mapper, callback)
+
+
+def written(mapper, data):
+    """Record data saved by the object itself so it is not reported."""
+    subscription = _subscriptions.get(id(mapper))
+    if subscription:
+        with _lock:
+            subscription.signature = mapper._signature()  # pylint: disable=protected-access
+            subscription.data = data
+
+
+def check():
+    """Check every watched file for changes once."""
+    with _lock:
+        subscriptions = list(_subscriptions.values())
+    for subscription in subscriptions:
+        subscription.check()
+
+
+def diff(old, new):
+    """Get the changed keys of two dictionaries.
+
+    >>> diff({'a': 1, 'b': 2}, {'a': 1, 'b': 3, 'c': 4})
+    OrderedDict([('b', (2, 3)), ('c', (None, 4))])
+
+    """
+    changes = OrderedDict()
+    for key in list(old) + [key for key in new if key not in old]:
+        before, after = old.get(key), new.get(key)
+        if before != after:
+            changes[key] = before, after
+    return changes
+
+
+def _subscribe(mapper, callback):
+    subscription = _subscriptions.get(id(mapper))
+    if subscription is None:
+        subscription = Subscription(mapper)
+        _subscriptions[id(mapper)] = subscription
+    subscription.callbacks.append(callback)
+
+
+def _discard(key):
+    with _lock:
+        _subscriptions.pop(key, None)
+
+
+def _read(mapper):
+    """Get the signature and data of a file, reading nothing if missing."""
+    signature = mapper._signature()  # pylint: disable=protected-access
+    if signature is None:
+        return None, {}
+    with metrics.Scope(mapper):
+        text = mapper._read()  # pylint: disable=protected-access
+    return signature, diskutils.parse(text, mapper.path)
+
+
+def _start():
+    global _thread  # pylint: disable=global-statement
+    if _thread is None:
+        _thread = threading.Thread(target=_run, name="yorm-watcher")
+        _thread.daemon = True
+        _thread.start()
+    else:
+        _wakeup.set()
+
+
+def _run():
+    global _thread  # pylint: disable=global-statement
+    while True:
+        with _lock:
+            if not _subscriptions and not _classes:
+                _thread = None
+                return
+        try:
+            check()
+        except Exception:  # pylint: disable=broad-except
+            log.exception("Failed to check watched files")
+        _wakeup.wait(settings.watch_interval)
+        _wakeup.clear()